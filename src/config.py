@@ -5,11 +5,25 @@ from src.utilities.path_utils import PathUtils
 UI_ENABLED = True
 UI_ELEMENTS_ENABLED = True
 UI_SPEED = 100
+UI_TRAVELING_UPDATE_SECONDS = 750
+HEADLESS_SIMULATION_ENABLED = False
 
 HUB_RETURN_INSERTION_ALLOWANCE = 2.5
 FILL_IN_INSERTION_ALLOWANCE = 3
 CLOSEST_NEIGHBOR_MINIMUM = 8
 
+SAVINGS_CONSTRUCTOR_ENABLED = False
+ANYTIME_PLANNING_ENABLED = False
+PLANNING_TIME_BUDGET_SECONDS = 2.0
+INCREMENTAL_REPLANNING_ENABLED = True
+CHECKPOINT_INTERVAL_SECONDS = 900
+
+MONTE_CARLO_REPLICATIONS = 1000
+MONTE_CARLO_MIN_SPEED_MPH = 12.0
+MONTE_CARLO_MAX_SPEED_MPH = 22.0
+MONTE_CARLO_ARRIVAL_JITTER_SECONDS = 900
+MONTE_CARLO_PERCENTILES = (50, 90, 95)
+
 NUM_DRIVERS = 2
 NUM_DELIVERY_TRUCKS = 3
 NUM_TRUCK_CAPACITY = 16
@@ -25,6 +39,13 @@ DELIVERY_DATE = datetime.min
 
 DISTANCE_CSV_FILE = PathUtils.get_full_file_path('distance_table.csv')
 PACKAGE_CSV_FILE = PathUtils.get_full_file_path('package_file.csv')
+EVENT_STORE_ENABLED = False
+EVENT_STORE_FILE = PathUtils.get_full_file_path('delivery_history.db')
+LOG_FILE = PathUtils.get_full_file_path('delivery_log.txt')
+LOG_BUFFER_LINES = 1000
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUP_COUNT = 3
+LOG_PAGE_LINES = 40
 
 EXCEPTED_UPDATES = dict()
 PACKAGE_9_ADDRESS_CHANGE_TIME = time(hour=10, minute=20)
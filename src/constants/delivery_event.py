@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class DeliveryEvent(Enum):
+    """
+    Enum class representing the events of the delivery simulation.
+
+    Events at the same time are handled in order of their value, so package arrivals and address updates are applied
+        before any truck acts on them, a truck finishes loading before it departs, and checkpoints are taken once
+        everything else at their time has happened. Arrivals include returns to the hub.
+    """
+
+    STATUS_UPDATE = 0
+    LOAD_COMPLETION = 1
+    DEPARTURE = 2
+    TRAVELING = 3
+    ARRIVAL = 4
+    CHECKPOINT = 5
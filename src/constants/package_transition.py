@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class PackageTransition(Enum):
+    """
+    Enum class representing the scheduled changes of a package during the deliveries.
+
+    Transitions due at the same time are applied in order of their value, so packages arrive at the hub before any
+        address update at that time.
+    """
+
+    HUB_ARRIVAL = 0
+    ADDRESS_UPDATE = 1
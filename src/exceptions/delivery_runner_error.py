@@ -47,6 +47,8 @@ class AddressUpdateException(DeliveryRunnerError):
         Space Complexity: O(1)
         """
 
+        self.package = package
+        self.old_location = old_location
         super().__init__(message=f'Package #{package.package_id} | Address updated from'
                                  f' "{old_location.get_full_address()} to {package.location.get_full_address()}"')
 
@@ -54,14 +56,18 @@ class AddressUpdateException(DeliveryRunnerError):
 class DelayedPackagesArrivedException(DeliveryRunnerError):
     """Raised when a delayed package has arrived"""
 
-    def __init__(self):
+    def __init__(self, packages=()):
         """
         Initialize a DelayedPackagesArrivedException instance.
 
-        Time Complexity: O(1)
-        Space Complexity: O(1)
+        Args:
+            packages (Iterable[Package]): The packages that arrived (default: none).
+
+        Time Complexity: O(p), where p is the number of packages that arrived.
+        Space Complexity: O(p)
         """
 
+        self.packages = list(packages)
         super().__init__(message=f'Raised when a delayed package has arrived and package can be loaded on truck')
 
 
@@ -1,7 +1,7 @@
 from src import config
 
 __all__ = ['BundledPackageTruckAssignmentError', 'InvalidRouteRunError', 'LateDeliveryError', 'OptimalHubReturnError',
-           'OverlappingRouteRunError', 'PackageNotArrivedError', 'TruckCapacityExceededError',
+           'OverlappingRouteRunError', 'PackageNotArrivedError', 'ReplanningError', 'TruckCapacityExceededError',
            'UnconfirmedPackageDeliveryError']
 
 
@@ -153,3 +153,24 @@ class OptimalHubReturnError(RouteBuilderError):
 
         super().__init__(message=f'This Route Run results in the truck not returning to the hub when the truck'
                                  f'close and the truck would be more than half empty')
+
+
+class ReplanningError(RouteBuilderError):
+    """Raised when no route run can be re-planned to deliver a package at its new location"""
+
+    def __init__(self, run, package):
+        """
+        Initialize a ReplanningError instance.
+
+        Args:
+            run (RouteRun): The route run, restored to its route before the re-plan.
+            package (Package): The re-routed package.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.run = run
+        self.package = package
+        super().__init__(message=f'Truck #{run.assigned_truck_id} route could not be re-planned to deliver Package'
+                                 f' #{str(package.package_id).zfill(2)} at {package.location.name}')
@@ -8,12 +8,16 @@ def main():
     - Loads the trucks.
     - Commences the deliveries.
     - Displays the user interface menu.
+    - Writes the rest of the delivery log on exit.
 
     """
 
-    DeliveryRunner.load_trucks()
-    DeliveryRunner.commence_deliveries()
-    UI.menu()
+    try:
+        DeliveryRunner.load_trucks()
+        DeliveryRunner.commence_deliveries()
+        UI.menu()
+    finally:
+        UI.LOG.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,128 @@
+import re
+from typing import Dict, Iterable, List, Optional
+
+from src.models.location import Location
+
+__all__ = ['AddressIndex']
+
+_PUNCTUATION_PATTERN = re.compile(r'[.,]')
+_ABBREVIATIONS = {'NORTH': 'N', 'SOUTH': 'S', 'EAST': 'E', 'WEST': 'W', 'STREET': 'ST', 'AVENUE': 'AVE',
+                  'BOULEVARD': 'BLVD', 'ROAD': 'RD', 'DRIVE': 'DR', 'LANE': 'LN', 'CIRCLE': 'CIR', 'COURT': 'CT',
+                  'PARKWAY': 'PKWY', 'HIGHWAY': 'HWY', 'SUITE': 'STE', 'APARTMENT': 'APT'}
+
+
+def _get_street_tokens(street: str) -> List[str]:
+    """
+    Canonicalizes a street address into tokens: upper case, without periods or commas, and with directions and street
+        suffixes abbreviated, so spelling variants of an address produce the same tokens.
+
+    Args:
+        street (str): The street address.
+
+    Returns:
+        List[str]: The tokens.
+
+    Time Complexity: O(a), where a is the length of the address.
+    Space Complexity: O(a)
+    """
+
+    tokens = _PUNCTUATION_PATTERN.sub('', street).upper().split()
+    return [_ABBREVIATIONS.get(token, token) for token in tokens]
+
+
+class _TrieNode:
+    """
+    A node of an address trie, reached by a sequence of street tokens.
+    """
+
+    __slots__ = ('children', 'location')
+
+    def __init__(self):
+        """
+        Initializes an empty _TrieNode object.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.children: Dict[str, _TrieNode] = dict()
+        self.location: Optional[Location] = None
+
+
+class AddressIndex:
+    """
+    An index of locations by canonicalized street address and zip code, for resolving address corrections.
+
+    Each zip code has a trie of the canonicalized street tokens of its locations, so an address resolves in time
+        proportional to its length: the matching location is the one whose street is the longest token prefix of the
+        address, which allows for unit numbers and other trailing details.
+    """
+
+    def __init__(self, locations: Iterable[Location]):
+        """
+        Builds the index of the locations. Of several locations with the same street and zip code, the first is
+            indexed.
+
+        Args:
+            locations (Iterable[Location]): The locations, with their zip codes set.
+
+        Time Complexity: O(m * a), where m is the number of locations.
+        Space Complexity: O(m * a)
+        """
+
+        self._roots: Dict[int, _TrieNode] = dict()
+        for location in locations:
+            node = self._roots.setdefault(location.zip_code, _TrieNode())
+            for token in _get_street_tokens(location.address):
+                node = node.children.setdefault(token, _TrieNode())
+            if node.location is None:
+                node.location = location
+
+    def find(self, street: str, zip_code: int, is_prefix_match=True) -> Optional[Location]:
+        """
+        Finds the location of a street address and zip code.
+
+        Args:
+            street (str): The street address.
+            zip_code (int): The zip code.
+            is_prefix_match (bool, optional): Flag indicating if a location whose street is a prefix of the address
+                matches, rather than only the exact street. Defaults to True.
+
+        Returns:
+            Location: The matching location, or None if no location matches.
+
+        Time Complexity: O(a)
+        Space Complexity: O(a)
+        """
+
+        node = self._roots.get(zip_code)
+        location = None
+        for token in _get_street_tokens(street) if node else ():
+            node = node.children.get(token)
+            if node is None:
+                break
+            location = node.location or location
+        if not is_prefix_match and (node is None or node.location is not location):
+            return None
+        return location
+
+    def find_address(self, address: str) -> Optional[Location]:
+        """
+        Finds the location of a full address.
+
+        Args:
+            address (str): The address, formatted as "Address, City, State Zip".
+
+        Returns:
+            Location: The matching location, or None if the address is malformed or no location matches.
+
+        Time Complexity: O(a)
+        Space Complexity: O(a)
+        """
+
+        try:
+            street, city, state_zip = address.split(', ')
+            zip_code = int(state_zip.split(' ')[1])
+        except (ValueError, TypeError, IndexError, AttributeError):
+            return None
+        return self.find(street, zip_code)
@@ -0,0 +1,119 @@
+from array import array
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from src.models.location import Location
+from src.models.route_run import RouteRun
+
+__all__ = ['TruckState', 'Checkpoint']
+
+
+class TruckState:
+    """
+    The state of a truck as of an event of the delivery simulation.
+
+    Attributes:
+        truck_id (int): The ID of the truck.
+        seconds (int): The time of the event in seconds since midnight.
+        previous_location (Location): The location the truck came from, or None at the start of a route run.
+        current_location (Location): The location the truck is at or has last left.
+        next_location (Location): The next stop of the truck, or None once its route is complete.
+        package_ids (Tuple[int]): The IDs of the packages loaded on the truck.
+        mileage (float): The miles driven by the truck since the start of the day.
+        current_run (RouteRun): The route run the truck is on or waiting to depart on, or None once its route is
+            complete.
+        route_runs (Tuple[RouteRun]): The route runs still to be assigned to the truck.
+        is_driving (bool): Flag indicating if the truck has departed on its current run, rather than waiting at the hub.
+    """
+
+    __slots__ = ('truck_id', 'seconds', 'previous_location', 'current_location', 'next_location', 'package_ids',
+                 'mileage', 'current_run', 'route_runs', 'is_driving')
+
+    def __init__(self, truck_id: int, seconds: int, previous_location: Optional[Location], current_location: Location,
+                 next_location: Optional[Location], package_ids: Tuple[int, ...], mileage: float,
+                 current_run: Optional[RouteRun], route_runs: Tuple[RouteRun, ...], is_driving: bool):
+        """
+        Initializes a TruckState object.
+
+        Args:
+            truck_id (int): The ID of the truck.
+            seconds (int): The time of the event in seconds since midnight.
+            previous_location (Location): The location the truck came from.
+            current_location (Location): The location the truck is at or has last left.
+            next_location (Location): The next stop of the truck.
+            package_ids (Tuple[int]): The IDs of the loaded packages.
+            mileage (float): The miles driven since the start of the day.
+            current_run (RouteRun): The current route run.
+            route_runs (Tuple[RouteRun]): The route runs still to be assigned.
+            is_driving (bool): Flag indicating if the truck has departed on its current run.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.truck_id = truck_id
+        self.seconds = seconds
+        self.previous_location = previous_location
+        self.current_location = current_location
+        self.next_location = next_location
+        self.package_ids = package_ids
+        self.mileage = mileage
+        self.current_run = current_run
+        self.route_runs = route_runs
+        self.is_driving = is_driving
+
+
+class Checkpoint:
+    """
+    The full state of the delivery simulation at a time, from which any later time is reconstructed by applying the
+        events recorded after it, and from which the simulation can be resumed.
+
+    Package states are stored by position in the recorder's packages, in order of package ID: a status code
+        indexing the DeliveryStatus members and the index of the package's latest status update.
+
+    Attributes:
+        seconds (int): The time of the checkpoint in seconds since midnight.
+        event_count (int): The number of truck events recorded before the checkpoint.
+        log_length (int): The number of events in Package.event_log before the checkpoint.
+        truck_states (Dict[int, TruckState]): The latest state of every truck, keyed by truck ID.
+        status_codes (array): The status code of every package.
+        update_indexes (array): The index of the latest status update of every package.
+        run_routes (List[Tuple[RouteRun, Tuple[Location], set, dict]]): The remaining route, locations, and run
+            analysis dictionary of every route run, which are revised when a run is re-planned.
+        visited_locations (FrozenSet[Location]): The locations visited by any truck.
+        rerouted_locations (FrozenSet[Location]): The locations a package was re-routed to.
+    """
+
+    __slots__ = ('seconds', 'event_count', 'log_length', 'truck_states', 'status_codes', 'update_indexes',
+                 'run_routes', 'visited_locations', 'rerouted_locations')
+
+    def __init__(self, seconds: int, event_count: int, log_length: int, truck_states: Dict[int, TruckState],
+                 status_codes: array, update_indexes: array,
+                 run_routes: List[Tuple[RouteRun, Tuple[Location, ...], set, dict]],
+                 visited_locations: FrozenSet[Location], rerouted_locations: FrozenSet[Location]):
+        """
+        Initializes a Checkpoint object.
+
+        Args:
+            seconds (int): The time of the checkpoint in seconds since midnight.
+            event_count (int): The number of truck events recorded before the checkpoint.
+            log_length (int): The number of events in Package.event_log before the checkpoint.
+            truck_states (Dict[int, TruckState]): The latest state of every truck.
+            status_codes (array): The status code of every package.
+            update_indexes (array): The index of the latest status update of every package.
+            run_routes (List[Tuple[RouteRun, Tuple[Location], set, dict]]): The route state of every route run.
+            visited_locations (FrozenSet[Location]): The locations visited by any truck.
+            rerouted_locations (FrozenSet[Location]): The locations a package was re-routed to.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.seconds = seconds
+        self.event_count = event_count
+        self.log_length = log_length
+        self.truck_states = truck_states
+        self.status_codes = status_codes
+        self.update_indexes = update_indexes
+        self.run_routes = run_routes
+        self.visited_locations = visited_locations
+        self.rerouted_locations = rerouted_locations
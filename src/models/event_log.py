@@ -0,0 +1,205 @@
+from array import array
+from collections import Counter
+from datetime import time
+from itertools import compress
+from typing import Dict, Iterable, List, Tuple
+
+from src.constants.delivery_status import DeliveryStatus
+from src.models.location import Location
+from src.utilities.time_conversion import TimeConversion
+
+__all__ = ['EventLog']
+
+_STATUSES: Tuple[DeliveryStatus, ...] = tuple(DeliveryStatus)
+_STATUS_CODES: Dict[DeliveryStatus, int] = {status: code for code, status in enumerate(_STATUSES)}
+_NO_TRUCK_ID = 0
+
+
+class EventLog:
+    """
+    An append-only log of every package status update of the fleet, stored as columns of compact arrays.
+
+    Each event is a row of the package ID, the time in seconds since midnight, a status code indexing the
+        DeliveryStatus members, a location code indexing EventLog.locations, and the ID of the truck that made the
+        update, or 0 if no truck did. Fleet-wide queries scan a single column with filters that run in C, rather than
+        every package's status history.
+
+    Attributes:
+        locations (List[Location]): The locations of the events, indexed by location code.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty EventLog object.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.locations: List[Location] = []
+        self._location_codes: Dict[Location, int] = dict()
+        self._package_id_column = array('L')
+        self._seconds_column = array('l')
+        self._status_column = array('B')
+        self._location_column = array('L')
+        self._truck_id_column = array('L')
+
+    def __len__(self):
+        """
+        Returns the number of events.
+
+        Returns:
+            int: The number of events.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return len(self._seconds_column)
+
+    def append(self, package_id: int, seconds: int, status: DeliveryStatus, location: Location, truck_id: int = None):
+        """
+        Appends an event.
+
+        Args:
+            package_id (int): The ID of the package.
+            seconds (int): The time of the event in seconds since midnight.
+            status (DeliveryStatus): The updated status of the package.
+            location (Location): The delivery location of the package.
+            truck_id (int, optional): The ID of the truck that made the update. Defaults to None.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        location_code = self._location_codes.get(location)
+        if location_code is None:
+            location_code = self._location_codes[location] = len(self.locations)
+            self.locations.append(location)
+        self._package_id_column.append(package_id)
+        self._seconds_column.append(seconds)
+        self._status_column.append(_STATUS_CODES[status])
+        self._location_column.append(location_code)
+        self._truck_id_column.append(_NO_TRUCK_ID if truck_id is None else truck_id)
+
+    def get_event(self, index: int) -> Tuple[int, int, DeliveryStatus, Location, int]:
+        """
+        Retrieves an event.
+
+        Args:
+            index (int): The index of the event.
+
+        Returns:
+            Tuple[int, int, DeliveryStatus, Location, int]: The package ID, time in seconds since midnight, status,
+                location, and truck ID of the event, with a truck ID of None if no truck made the update.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        truck_id = self._truck_id_column[index]
+        return (self._package_id_column[index], self._seconds_column[index], _STATUSES[self._status_column[index]],
+                self.locations[self._location_column[index]], None if truck_id == _NO_TRUCK_ID else truck_id)
+
+    def truncate(self, length: int):
+        """
+        Removes every event after the first given number of events.
+
+        Args:
+            length (int): The number of events to keep.
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(1)
+        """
+
+        for column in (self._package_id_column, self._seconds_column, self._status_column, self._location_column,
+                       self._truck_id_column):
+            del column[length:]
+
+    def clear(self):
+        """
+        Removes every event.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.truncate(0)
+
+    def _get_status_mask(self, status: DeliveryStatus) -> Iterable[bool]:
+        """
+        Retrieves a mask of the events with a status, for filtering the other columns with itertools.compress.
+
+        Args:
+            status (DeliveryStatus): The status.
+
+        Returns:
+            Iterable[bool]: True for each event with the status, False otherwise.
+
+        Time Complexity: O(1), the mask is evaluated lazily in O(e), where e is the number of events.
+        Space Complexity: O(1)
+        """
+
+        return map(_STATUS_CODES[status].__eq__, self._status_column)
+
+    def get_delivery_seconds(self) -> Dict[int, int]:
+        """
+        Retrieves the time of every delivery.
+
+        Returns:
+            Dict[int, int]: The delivery time in seconds since midnight, keyed by package ID.
+
+        Time Complexity: O(e)
+        Space Complexity: O(n)
+        """
+
+        return dict(zip(compress(self._package_id_column, self._get_status_mask(DeliveryStatus.DELIVERED)),
+                        compress(self._seconds_column, self._get_status_mask(DeliveryStatus.DELIVERED))))
+
+    def get_deliveries_per_hour(self) -> Dict[int, int]:
+        """
+        Counts the deliveries made in each hour of the day.
+
+        Returns:
+            Dict[int, int]: The number of deliveries, keyed by hour in order of hour.
+
+        Time Complexity: O(e)
+        Space Complexity: O(1)
+        """
+
+        hour_counts = Counter(seconds // 3600 for seconds
+                              in compress(self._seconds_column, self._get_status_mask(DeliveryStatus.DELIVERED)))
+        return dict(sorted(hour_counts.items()))
+
+    def get_deliveries_per_truck(self) -> Dict[int, int]:
+        """
+        Counts the deliveries made by each truck.
+
+        Returns:
+            Dict[int, int]: The number of deliveries, keyed by truck ID in order of truck ID.
+
+        Time Complexity: O(e)
+        Space Complexity: O(1)
+        """
+
+        truck_counts = Counter(compress(self._truck_id_column, self._get_status_mask(DeliveryStatus.DELIVERED)))
+        return dict(sorted(truck_counts.items()))
+
+    def get_late_package_ids(self, deadlines: Dict[int, time]) -> List[int]:
+        """
+        Retrieves the packages delivered after their deadline.
+
+        Args:
+            deadlines (Dict[int, time]): The deadline of each package with one, keyed by package ID.
+
+        Returns:
+            List[int]: The IDs of the late packages, in ascending order.
+
+        Time Complexity: O(e + n log n)
+        Space Complexity: O(n)
+        """
+
+        deadline_seconds = {package_id: TimeConversion.get_seconds(deadline)
+                            for package_id, deadline in deadlines.items() if deadline}
+        return sorted([package_id for package_id, seconds in self.get_delivery_seconds().items()
+                       if package_id in deadline_seconds and seconds > deadline_seconds[package_id]])
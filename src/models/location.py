@@ -1,6 +1,7 @@
 __all__ = ['Location']
 
 from datetime import time
+from zlib import crc32
 
 from src import config
 from src.config import DELIVERY_RETURN_TIME
@@ -31,6 +32,8 @@ class Location:
         has_required_truck_package (bool): Flag indicating if the location has a required truck package.
         has_unconfirmed_package (bool): Flag indicating if the location has an unconfirmed package.
         has_bundled_package (bool): Flag indicating if the location has a bundled package.
+        has_rerouted_package (bool): Flag indicating if a package was re-routed to the location during the
+            deliveries, so its packages may be delivered by more than one truck.
     """
 
     def __init__(self, name: str, address: str, is_hub=False):
@@ -64,6 +67,7 @@ class Location:
         self.has_required_truck_package = False
         self.has_unconfirmed_package = False
         self.has_bundled_package = False
+        self.has_rerouted_package = False
 
     def __eq__(self, other):
         """
@@ -85,7 +89,8 @@ class Location:
 
     def __hash__(self):
         """
-        Returns the hash value of the location based on its address and name.
+        Returns the hash value of the location based on its address and name. The hash does not depend on
+            PYTHONHASHSEED, so sets of locations iterate in the same order in every process.
 
         Returns:
             int: The hash value of the location.
@@ -94,7 +99,7 @@ class Location:
         Space Complexity: O(1)
         """
 
-        return hash(self.address + self.name)
+        return crc32((self.address + self.name).encode())
 
     def __contains__(self, item):
         """
@@ -305,6 +310,27 @@ class Location:
 
         self.distance_dict = distance_dict
 
+    def clear_packages(self):
+        """
+        Removes the packages of the day from the location along with the planning state derived from them, keeping
+            the address and distance data.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.package_set = set()
+        self.been_visited = False
+        self.been_assigned = self.is_hub
+        self.been_routed = False
+        self.assigned_truck_id = None
+        self.earliest_deadline = DELIVERY_RETURN_TIME
+        self.latest_package_arrival = None
+        self.has_required_truck_package = False
+        self.has_unconfirmed_package = False
+        self.has_bundled_package = False
+        self.has_rerouted_package = False
+
     def set_earliest_deadline(self, deadline: time):
         """
         Sets the earliest deadline for the location.
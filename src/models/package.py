@@ -1,12 +1,15 @@
 import math
-from copy import copy
 from datetime import time
 
 __all__ = ['Package']
 
-from src import config
 from src.constants.delivery_status import DeliveryStatus
+from src.models.event_log import EventLog
 from src.models.location import Location
+from src.models.package_index import PackageIndex
+from src.models.package_store import PackageStore
+from src.models.status_timeline import StatusTimeline
+from src.utilities.time_conversion import TimeConversion
 
 
 def _get_formatted_status_string(update, package, formatted_address, status):
@@ -23,6 +26,11 @@ class Package:
     Class representing a package.
 
     Attributes:
+        event_log (EventLog): The status updates of every package, in the order they were made.
+        package_index (PackageIndex): The secondary indexes of the packages of the day, which the setters of the
+            indexed attributes keep up to date.
+        package_store (PackageStore): The columnar store of the packages of the day, which the setters of the stored
+            attributes keep up to date.
         package_id (int): Identifier of the package.
         location (Location): Location object representing the package's destination.
         is_verified_address (bool): Flag indicating if the package's address is verified.
@@ -30,7 +38,7 @@ class Package:
         weight (float): Weight of the package.
         status (DeliveryStatus): Current delivery status of the package.
         special_note (str): Special note associated with the package.
-        status_update_dict (dict): Dictionary storing the package's status updates.
+        status_timeline (StatusTimeline): The package's status updates in order of time.
         bundled_package_set (set): Set of bundled packages associated with the package.
         assigned_truck_id (None or int): ID of the truck assigned to deliver the package.
         bundled_package_ids (None or list): List of bundled package IDs.
@@ -40,20 +48,24 @@ class Package:
         delivery_time (None or time): Time of package delivery.
     """
 
+    event_log = EventLog()
+    package_index = PackageIndex()
+    package_store = PackageStore()
+
     def __init__(self, package_id: int, location: Location, is_verified_address, deadline, weight, special_note):
         self.package_id = package_id
-        self.location = location
-        self.is_verified_address = is_verified_address
+        self._location = location
+        self._is_verified_address = is_verified_address
         self.deadline = deadline
         self.weight = weight
-        self.status = DeliveryStatus.ON_ROUTE_TO_DEPOT
+        self._status = DeliveryStatus.ON_ROUTE_TO_DEPOT
         self.special_note = special_note
-        self.status_update_dict = dict()
+        self.status_timeline = StatusTimeline()
         self.bundled_package_set = set()
-        self.assigned_truck_id = None
+        self._assigned_truck_id = None
         self.bundled_package_ids = None
         self.pending_update_time = None
-        self.hub_arrival_time = None
+        self._hub_arrival_time = None
         self.hub_departure_time = None
         self.delivery_time = None
 
@@ -188,31 +200,25 @@ class Package:
         return self.location is other.location or \
             sum(self.location.distance_dict.values()) >= sum(other.location.distance_dict.values())
 
-    def update_status(self, updated_status: DeliveryStatus, current_time: time):
+    def update_status(self, updated_status: DeliveryStatus, current_time: time, truck_id: int = None):
         """
-        Updates the status of the package with the provided status and current time.
+        Updates the status of the package with the provided status and current time, appending the update to the
+            event log unless the status was already recorded at the time.
 
         Args:
             updated_status (DeliveryStatus): The updated status of the package.
             current_time (time): The current time.
+            truck_id (int, optional): The ID of the truck making the update. Defaults to None.
 
-        Time Complexity: O(1)
+        Time Complexity: O(log k), where k is the number of status updates.
         Space Complexity: O(1)
         """
 
         self.status = updated_status
-        if current_time not in self.status_update_dict:
-            self.status_update_dict[current_time] = {'status': copy(updated_status), 'location': self.location,
-                                                     'is_verified_address': self.is_verified_address,
-                                                     'special_note': self.special_note}
-        else:
-            if self.status_update_dict[current_time]['status'] is not updated_status:
-                if (isinstance(self.status_update_dict[current_time]['status'], tuple) and
-                        updated_status not in self.status_update_dict[current_time]['status']):
-                    self.status_update_dict[current_time]['status'] += (updated_status,)
-                else:
-                    self.status_update_dict[current_time]['status'] =\
-                        self.status_update_dict[current_time]['status'], updated_status
+        if self.status_timeline.record(current_time, updated_status, self.location, self.is_verified_address,
+                                       self.special_note):
+            Package.event_log.append(self.package_id, TimeConversion.get_seconds(current_time), updated_status,
+                                     self.location, truck_id)
 
     def get_full_address(self) -> str:
         """
@@ -249,7 +255,7 @@ class Package:
         else:
             status = self.status
             location = self.location
-            last_update = list(self.status_update_dict.keys())[-1]
+            last_update = self.status_timeline.get_state(len(self.status_timeline) - 1).update_time
         address = location.get_full_address()
         if not address_length:
             address_length = max([len(_location.get_full_address()) for _location in [location, self.location]])
@@ -271,15 +277,174 @@ class Package:
         Returns:
             Tuple[time, dict]: The latest update time and the package state at that time.
 
-        Time Complexity: O(n)
+        Time Complexity: O(log k), where k is the number of status updates.
+        Space Complexity: O(1)
+        """
+
+        package_state = self.status_timeline.get_state_at_time(current_time, self.package_id)
+        return package_state.update_time, package_state.as_dict()
+
+    @property
+    def location(self) -> Location:
+        """
+        Getter property for the delivery location of the package.
+
+        Returns:
+            Location: The location.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._location
+
+    @location.setter
+    def location(self, location: Location):
+        """
+        Setter property for the delivery location of the package, updating the package store.
+
+        Args:
+            location (Location): The location.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        Package.package_store.update_location(self, location)
+        self._location = location
+
+    @property
+    def status(self) -> DeliveryStatus:
+        """
+        Getter property for the current delivery status of the package.
+
+        Returns:
+            DeliveryStatus: The status.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._status
+
+    @status.setter
+    def status(self, status: DeliveryStatus):
+        """
+        Setter property for the current delivery status of the package, updating the package index and store.
+
+        Args:
+            status (DeliveryStatus): The status.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        Package.package_index.update_status(self, self._status, status)
+        Package.package_store.update_status(self, status)
+        self._status = status
+
+    @property
+    def assigned_truck_id(self) -> int:
+        """
+        Getter property for the ID of the truck assigned to deliver the package.
+
+        Returns:
+            int: The truck ID, or None if no truck is assigned.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._assigned_truck_id
+
+    @assigned_truck_id.setter
+    def assigned_truck_id(self, truck_id: int):
+        """
+        Setter property for the ID of the truck assigned to deliver the package, updating the package index and
+            store.
+
+        Args:
+            truck_id (int): The truck ID, or None.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        Package.package_index.update_assigned_truck_id(self, self._assigned_truck_id, truck_id)
+        Package.package_store.update_assigned_truck_id(self, truck_id)
+        self._assigned_truck_id = truck_id
+
+    @property
+    def is_verified_address(self) -> bool:
+        """
+        Getter property for the flag indicating if the package's address is verified.
+
+        Returns:
+            bool: True if the address is verified, False otherwise.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._is_verified_address
+
+    @is_verified_address.setter
+    def is_verified_address(self, is_verified_address: bool):
+        """
+        Setter property for the flag indicating if the package's address is verified, updating the package index.
+
+        Args:
+            is_verified_address (bool): True if the address is verified, False otherwise.
+
+        Time Complexity: O(1)
         Space Complexity: O(1)
         """
 
-        latest_update_time = config.STANDARD_PACKAGE_ARRIVAL_TIME
-        for update_time, values in self.status_update_dict.items():
-            if current_time >= update_time:
-                latest_update_time = update_time
-                continue
-            else:
-                break
-        return latest_update_time, self.status_update_dict[latest_update_time]
+        Package.package_index.update_verified_address(self, is_verified_address)
+        self._is_verified_address = is_verified_address
+
+    @property
+    def hub_arrival_time(self) -> time:
+        """
+        Getter property for the time the package arrives at the hub.
+
+        Returns:
+            time: The hub arrival time, or None if it is not set.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._hub_arrival_time
+
+    @hub_arrival_time.setter
+    def hub_arrival_time(self, hub_arrival_time: time):
+        """
+        Setter property for the time the package arrives at the hub, updating the package index and store.
+
+        Args:
+            hub_arrival_time (time): The hub arrival time.
+
+        Time Complexity: O(b) for a new hub arrival time, where b is the number of distinct hub arrival times,
+            O(1) otherwise.
+        Space Complexity: O(1)
+        """
+
+        Package.package_index.update_hub_arrival_time(self, self._hub_arrival_time, hub_arrival_time)
+        Package.package_store.update_hub_arrival_time(self, hub_arrival_time)
+        self._hub_arrival_time = hub_arrival_time
+
+    @property
+    def status_update_dict(self) -> dict:
+        """
+        Getter property for the package's status updates keyed by time, in order of time.
+
+        Returns:
+            dict: The status, location, address verification, and special note of each status update.
+
+        Time Complexity: O(k)
+        Space Complexity: O(k)
+        """
+
+        return {update_time: package_state.as_dict() for update_time, package_state
+                in self.status_timeline.get_states()}
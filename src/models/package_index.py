@@ -0,0 +1,356 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import time
+from typing import Dict, FrozenSet, Hashable, List, Set
+
+from src.constants.delivery_status import DeliveryStatus
+
+__all__ = ['PackageIndex']
+
+
+class _SortedBuckets:
+    """
+    Sets of packages keyed by time, with the keys kept in sorted order so the packages in a range of times are found
+        by binary search.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty _SortedBuckets object.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._keys: List[time] = []
+        self._buckets: Dict[time, Set] = dict()
+
+    def add(self, key: time, package):
+        """
+        Adds a package to the bucket of a time.
+
+        Args:
+            key (time): The time, or None to leave the package out.
+            package (Package): The package.
+
+        Time Complexity: O(b) for a new time, where b is the number of buckets, O(1) otherwise.
+        Space Complexity: O(1)
+        """
+
+        if key is None:
+            return
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = set()
+            insort(self._keys, key)
+        bucket.add(package)
+
+    def discard(self, key: time, package):
+        """
+        Removes a package from the bucket of a time, keeping the emptied bucket.
+
+        Args:
+            key (time): The time.
+            package (Package): The package.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if key in self._buckets:
+            self._buckets[key].discard(package)
+
+    def get_range(self, start: time = None, end: time = None, include_end=True) -> Set:
+        """
+        Retrieves the packages with a time in a range.
+
+        Args:
+            start (time, optional): The start of the range, exclusive. Defaults to None (no start).
+            end (time, optional): The end of the range. Defaults to None (no end).
+            include_end (bool, optional): Flag indicating if the end of the range is included. Defaults to True.
+
+        Returns:
+            Set[Package]: The packages.
+
+        Time Complexity: O(log b + r), where r is the number of buckets and packages in the range.
+        Space Complexity: O(r)
+        """
+
+        start_index = 0 if start is None else bisect_right(self._keys, start)
+        if end is None:
+            end_index = len(self._keys)
+        else:
+            end_index = bisect_right(self._keys, end) if include_end else bisect_left(self._keys, end)
+        packages = set()
+        for key in self._keys[start_index:end_index]:
+            packages.update(self._buckets[key])
+        return packages
+
+
+class PackageIndex:
+    """
+    Secondary indexes of the packages of the day, by status, assigned truck, hub arrival (release) time, deadline,
+        address verification, and bundle group, so each query costs time proportional to its result.
+
+    A package reports changes to its indexed attributes through its setters, which are ignored unless the package is
+        the indexed package with its ID, so copies and snapshots of packages never disturb the index. The packages at a
+        location are indexed by Location.package_set, which is kept up to date on address updates.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty PackageIndex object.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._packages: Dict[int, Hashable] = dict()
+        self._status_buckets: Dict[DeliveryStatus, Set] = {status: set() for status in DeliveryStatus}
+        self._truck_buckets: Dict[int, Set] = dict()
+        self._unconfirmed_packages: Set = set()
+        self._release_buckets = _SortedBuckets()
+        self._deadline_buckets = _SortedBuckets()
+        self._bundle_groups: List[FrozenSet] = []
+
+    def __len__(self):
+        """
+        Returns the number of indexed packages.
+
+        Returns:
+            int: The number of packages.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return len(self._packages)
+
+    def is_indexed(self, package) -> bool:
+        """
+        Checks if a package is the indexed package with its ID.
+
+        Args:
+            package (Package): The package.
+
+        Returns:
+            bool: True if the package is indexed, False otherwise.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._packages.get(package.package_id) is package
+
+    def rebuild(self, packages):
+        """
+        Replaces the indexed packages.
+
+        Args:
+            packages (Iterable[Package]): The packages to index.
+
+        Time Complexity: O(n + d * b), where d is the number of distinct times and b the number of buckets.
+        Space Complexity: O(n)
+        """
+
+        self._packages.clear()
+        for bucket in self._status_buckets.values():
+            bucket.clear()
+        self._truck_buckets.clear()
+        self._unconfirmed_packages.clear()
+        self._release_buckets = _SortedBuckets()
+        self._deadline_buckets = _SortedBuckets()
+        self._bundle_groups = []
+        grouped_packages = set()
+        for package in packages:
+            self._packages[package.package_id] = package
+            self._status_buckets[package.status].add(package)
+            self.update_assigned_truck_id(package, None, package.assigned_truck_id)
+            if not package.is_verified_address:
+                self._unconfirmed_packages.add(package)
+            self._release_buckets.add(package.hub_arrival_time, package)
+            self._deadline_buckets.add(package.deadline, package)
+            if package.bundled_package_set and package not in grouped_packages:
+                bundle_group = frozenset(package.bundled_package_set.union([package]))
+                grouped_packages.update(bundle_group)
+                self._bundle_groups.append(bundle_group)
+
+    def update_status(self, package, old_status: DeliveryStatus, new_status: DeliveryStatus):
+        """
+        Moves an indexed package to the bucket of its new status.
+
+        Args:
+            package (Package): The package.
+            old_status (DeliveryStatus): The previous status.
+            new_status (DeliveryStatus): The new status.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if old_status is not new_status and self.is_indexed(package):
+            self._status_buckets[old_status].discard(package)
+            self._status_buckets[new_status].add(package)
+
+    def update_assigned_truck_id(self, package, old_truck_id: int, new_truck_id: int):
+        """
+        Moves an indexed package to the bucket of its new assigned truck.
+
+        Args:
+            package (Package): The package.
+            old_truck_id (int): The previously assigned truck ID, or None.
+            new_truck_id (int): The newly assigned truck ID, or None.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if old_truck_id == new_truck_id or not self.is_indexed(package):
+            return
+        if old_truck_id in self._truck_buckets:
+            self._truck_buckets[old_truck_id].discard(package)
+        if new_truck_id:
+            self._truck_buckets.setdefault(new_truck_id, set()).add(package)
+
+    def update_verified_address(self, package, is_verified_address: bool):
+        """
+        Updates the address verification of an indexed package.
+
+        Args:
+            package (Package): The package.
+            is_verified_address (bool): Flag indicating if the package's address is verified.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if not self.is_indexed(package):
+            return
+        if is_verified_address:
+            self._unconfirmed_packages.discard(package)
+        else:
+            self._unconfirmed_packages.add(package)
+
+    def update_hub_arrival_time(self, package, old_time: time, new_time: time):
+        """
+        Moves an indexed package to the bucket of its new hub arrival time.
+
+        Args:
+            package (Package): The package.
+            old_time (time): The previous hub arrival time, or None.
+            new_time (time): The new hub arrival time, or None.
+
+        Time Complexity: O(b) for a new time, O(1) otherwise.
+        Space Complexity: O(1)
+        """
+
+        if old_time != new_time and self.is_indexed(package):
+            self._release_buckets.discard(old_time, package)
+            self._release_buckets.add(new_time, package)
+
+    def get_status_packages(self, status: DeliveryStatus) -> Set:
+        """
+        Retrieves the packages with a status.
+
+        Args:
+            status (DeliveryStatus): The status.
+
+        Returns:
+            Set[Package]: The packages.
+
+        Time Complexity: O(r), where r is the number of packages retrieved.
+        Space Complexity: O(r)
+        """
+
+        return set(self._status_buckets[status])
+
+    def get_truck_packages(self, truck_id: int = None) -> Set:
+        """
+        Retrieves the packages assigned to a truck, or to any truck.
+
+        Args:
+            truck_id (int, optional): The ID of the truck. Defaults to None (any truck).
+
+        Returns:
+            Set[Package]: The packages.
+
+        Time Complexity: O(r + t), where t is the number of trucks.
+        Space Complexity: O(r)
+        """
+
+        if truck_id:
+            return set(self._truck_buckets.get(truck_id, ()))
+        return set().union(*self._truck_buckets.values())
+
+    def get_unconfirmed_packages(self) -> Set:
+        """
+        Retrieves the packages whose address is not verified.
+
+        Returns:
+            Set[Package]: The packages.
+
+        Time Complexity: O(r)
+        Space Complexity: O(r)
+        """
+
+        return set(self._unconfirmed_packages)
+
+    def get_released_packages(self, end_time: time) -> Set:
+        """
+        Retrieves the packages arriving at the hub at or before a time.
+
+        Args:
+            end_time (time): The time.
+
+        Returns:
+            Set[Package]: The packages.
+
+        Time Complexity: O(log b + r)
+        Space Complexity: O(r)
+        """
+
+        return self._release_buckets.get_range(end=end_time)
+
+    def get_packages_released_after(self, start_time: time) -> Set:
+        """
+        Retrieves the packages arriving at the hub after a time.
+
+        Args:
+            start_time (time): The time.
+
+        Returns:
+            Set[Package]: The packages.
+
+        Time Complexity: O(log b + r)
+        Space Complexity: O(r)
+        """
+
+        return self._release_buckets.get_range(start=start_time)
+
+    def get_packages_due_by(self, end_time: time) -> Set:
+        """
+        Retrieves the packages with a deadline at or before a time.
+
+        Args:
+            end_time (time): The time.
+
+        Returns:
+            Set[Package]: The packages.
+
+        Time Complexity: O(log b + r)
+        Space Complexity: O(r)
+        """
+
+        return self._deadline_buckets.get_range(end=end_time)
+
+    def get_bundle_groups(self) -> List[FrozenSet]:
+        """
+        Retrieves the groups of packages that must be delivered together.
+
+        Returns:
+            List[FrozenSet[Package]]: The bundle groups.
+
+        Time Complexity: O(g), where g is the number of bundle groups.
+        Space Complexity: O(g)
+        """
+
+        return list(self._bundle_groups)
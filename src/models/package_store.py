@@ -0,0 +1,356 @@
+from array import array
+from datetime import time
+from itertools import compress
+from typing import Dict, Hashable, Iterable, List, Sequence
+
+from src.constants.delivery_status import DeliveryStatus
+from src.utilities.time_conversion import TimeConversion
+
+__all__ = ['PackageStore']
+
+_FIELD_TYPECODES = {'package_id': 'l', 'location_index': 'l', 'deadline_seconds': 'l', 'release_seconds': 'l',
+                    'weight': 'd', 'truck_id': 'l', 'bundle_id': 'l', 'status_code': 'b'}
+_STATUS_CODES: Dict[DeliveryStatus, int] = {status: code for code, status in enumerate(DeliveryStatus)}
+_NONE = -1
+
+Mask = List[bool]
+
+
+def _get_seconds(value: time) -> int:
+    """
+    Converts a time column value to seconds since midnight.
+
+    Args:
+        value (time): The time, or None.
+
+    Returns:
+        int: The seconds since midnight, or -1 if the time is None.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    return _NONE if value is None else TimeConversion.get_seconds(value)
+
+
+class PackageStore:
+    """
+    A columnar store of the packages of the day, holding one typed array per field with a row per package, so
+        filters and aggregates over every package are single passes over flat columns rather than attribute lookups
+        on each package object.
+
+    The columns are the package ID, the index of the delivery location in the locations, the deadline and hub arrival
+        (release) time in seconds since midnight, the weight, the assigned truck ID, the bundle group ID, and the
+        status code. Missing values are -1, or 0 for the truck ID. A package reports changes to its stored attributes
+        through its setters, which are ignored unless the package is the stored package with its ID, so copies and
+        snapshots of packages never disturb the store.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty PackageStore object.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._columns: Dict[str, array] = {field: array(typecode) for field, typecode in _FIELD_TYPECODES.items()}
+        self._packages: list = []
+        self._rows: Dict[int, int] = dict()
+        self._locations: list = []
+        self._location_indexes: Dict[Hashable, int] = dict()
+
+    def __len__(self):
+        """
+        Returns the number of stored packages.
+
+        Returns:
+            int: The number of packages.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return len(self._packages)
+
+    def is_indexed(self, package) -> bool:
+        """
+        Checks if a package is the stored package with its ID.
+
+        Args:
+            package (Package): The package.
+
+        Returns:
+            bool: True if the package is stored, False otherwise.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        row = self._rows.get(package.package_id)
+        return row is not None and self._packages[row] is package
+
+    def rebuild(self, packages, locations: Sequence):
+        """
+        Replaces the stored packages, with a row per package in the given order.
+
+        Args:
+            packages (Iterable[Package]): The packages to store.
+            locations (Sequence[Location]): The locations, whose positions are the location indexes.
+
+        Time Complexity: O(n + m), where m is the number of locations.
+        Space Complexity: O(n + m)
+        """
+
+        self._packages = list(packages)
+        self._rows = {package.package_id: row for row, package in enumerate(self._packages)}
+        self._locations = list(locations)
+        self._location_indexes = {location: i for i, location in enumerate(self._locations)}
+        bundle_ids = dict()
+        bundle_count = 0
+        for package in self._packages:
+            if package.bundled_package_set and package not in bundle_ids:
+                for bundled_package in package.bundled_package_set.union([package]):
+                    bundle_ids[bundled_package] = bundle_count
+                bundle_count += 1
+        values = {
+            'package_id': [package.package_id for package in self._packages],
+            'location_index': [self._location_indexes.get(package.location, _NONE) for package in self._packages],
+            'deadline_seconds': [_get_seconds(package.deadline) for package in self._packages],
+            'release_seconds': [_get_seconds(package.hub_arrival_time) for package in self._packages],
+            'weight': [package.weight for package in self._packages],
+            'truck_id': [package.assigned_truck_id or 0 for package in self._packages],
+            'bundle_id': [bundle_ids.get(package, _NONE) for package in self._packages],
+            'status_code': [_STATUS_CODES[package.status] for package in self._packages]}
+        self._columns = {field: array(typecode, values[field]) for field, typecode in _FIELD_TYPECODES.items()}
+
+    def _set_value(self, package, field: str, value):
+        """
+        Sets a field of a stored package, ignoring packages that are not stored.
+
+        Args:
+            package (Package): The package.
+            field (str): The field name.
+            value: The value.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if self.is_indexed(package):
+            self._columns[field][self._rows[package.package_id]] = value
+
+    def update_status(self, package, status: DeliveryStatus):
+        """
+        Updates the status code of a stored package.
+
+        Args:
+            package (Package): The package.
+            status (DeliveryStatus): The new status.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if self.is_indexed(package):
+            self._columns['status_code'][self._rows[package.package_id]] = _STATUS_CODES[status]
+
+    def update_assigned_truck_id(self, package, truck_id: int):
+        """
+        Updates the assigned truck ID of a stored package.
+
+        Args:
+            package (Package): The package.
+            truck_id (int): The new truck ID, or None.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._set_value(package, 'truck_id', truck_id or 0)
+
+    def update_hub_arrival_time(self, package, hub_arrival_time: time):
+        """
+        Updates the release time of a stored package.
+
+        Args:
+            package (Package): The package.
+            hub_arrival_time (time): The new hub arrival time, or None.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._set_value(package, 'release_seconds', _get_seconds(hub_arrival_time))
+
+    def update_location(self, package, location):
+        """
+        Updates the location index of a stored package.
+
+        Args:
+            package (Package): The package.
+            location (Location): The new delivery location.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._set_value(package, 'location_index', self._location_indexes.get(location, _NONE))
+
+    def get_column(self, field: str) -> array:
+        """
+        Retrieves a column of the store, which must not be changed.
+
+        Args:
+            field (str): The field name, such as 'deadline_seconds'.
+
+        Returns:
+            array: The column, with a value per stored package in row order.
+
+        Raises:
+            KeyError: If the field does not exist.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._columns[field]
+
+    def get_packages(self) -> List:
+        """
+        Retrieves the stored packages in row order.
+
+        Returns:
+            List[Package]: The packages.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+
+        return list(self._packages)
+
+    def get_status_mask(self, *statuses: DeliveryStatus) -> Mask:
+        """
+        Retrieves the mask of the packages with any of the given statuses.
+
+        Args:
+            *statuses (DeliveryStatus): The statuses.
+
+        Returns:
+            Mask: A flag per stored package in row order.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+
+        codes = set([_STATUS_CODES[status] for status in statuses])
+        return [code in codes for code in self._columns['status_code']]
+
+    def get_released_mask(self, current_time: time) -> Mask:
+        """
+        Retrieves the mask of the packages arriving at the hub at or before a time.
+
+        Args:
+            current_time (time): The time.
+
+        Returns:
+            Mask: A flag per stored package in row order.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+
+        seconds = TimeConversion.get_seconds(current_time)
+        return [_NONE < release <= seconds for release in self._columns['release_seconds']]
+
+    def get_due_mask(self, end_time: time) -> Mask:
+        """
+        Retrieves the mask of the packages with a deadline at or before a time.
+
+        Args:
+            end_time (time): The time.
+
+        Returns:
+            Mask: A flag per stored package in row order.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+
+        seconds = TimeConversion.get_seconds(end_time)
+        return [_NONE < deadline <= seconds for deadline in self._columns['deadline_seconds']]
+
+    def get_truck_mask(self, truck_id: int = None) -> Mask:
+        """
+        Retrieves the mask of the packages assigned to a truck, or to any truck.
+
+        Args:
+            truck_id (int, optional): The ID of the truck. Defaults to None (any truck).
+
+        Returns:
+            Mask: A flag per stored package in row order.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+
+        if truck_id:
+            return [assigned_truck_id == truck_id for assigned_truck_id in self._columns['truck_id']]
+        return [assigned_truck_id != 0 for assigned_truck_id in self._columns['truck_id']]
+
+    @staticmethod
+    def combine_masks(*masks: Mask) -> Mask:
+        """
+        Combines masks, flagging the packages flagged by every mask.
+
+        Args:
+            *masks (Mask): The masks, at least one.
+
+        Returns:
+            Mask: The combined mask.
+
+        Time Complexity: O(n * k), where k is the number of masks.
+        Space Complexity: O(n)
+        """
+
+        return [all(flags) for flags in zip(*masks)]
+
+    def select(self, mask: Mask) -> List:
+        """
+        Retrieves the packages flagged by a mask.
+
+        Args:
+            mask (Mask): The mask.
+
+        Returns:
+            List[Package]: The flagged packages in row order.
+
+        Time Complexity: O(n)
+        Space Complexity: O(r), where r is the number of packages retrieved.
+        """
+
+        return list(compress(self._packages, mask))
+
+    def get_location_weights(self, mask: Mask = None) -> Dict:
+        """
+        Totals the weight of the packages at each delivery location.
+
+        Args:
+            mask (Mask, optional): The mask of the packages to total. Defaults to None (every package).
+
+        Returns:
+            Dict[Location, float]: The total weight at each location with a flagged package.
+
+        Time Complexity: O(n)
+        Space Complexity: O(m)
+        """
+
+        location_indexes: Iterable[int] = self._columns['location_index']
+        weights: Iterable[float] = self._columns['weight']
+        if mask is not None:
+            location_indexes, weights = compress(location_indexes, mask), compress(weights, mask)
+        totals = dict()
+        for location_index, weight in zip(location_indexes, weights):
+            if location_index != _NONE:
+                totals[location_index] = totals.get(location_index, 0) + weight
+        return {self._locations[location_index]: total for location_index, total in totals.items()}
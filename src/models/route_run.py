@@ -471,6 +471,19 @@ class RouteRun:
 
         self._error_type = value
 
+    def ends_at_hub(self) -> bool:
+        """
+        Checks if the route run ends back at the hub, either by its return_to_hub flag or its ordered route.
+
+        Returns:
+            bool: True if the route run ends at the hub, False otherwise.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self.return_to_hub or (bool(self.ordered_route) and self.ordered_route[-1].is_hub)
+
     def package_total(self, alternate_locations: Set[Location] = None):
         """
         Returns the total number of packages in the route run.
@@ -538,9 +551,10 @@ class RouteRun:
             if location.is_hub:
                 continue
             self.required_packages.update(location.package_set)
-        for package in PackageHandler.get_bundled_packages(ignore_assigned=False):
-            if package in self.required_packages:
-                self.required_packages.update(PackageHandler.get_bundled_packages(ignore_assigned=True))
+        bundle_packages = PackageHandler.constraint_graph.bundle_packages
+        if not bundle_packages.isdisjoint(self.required_packages):
+            self.required_packages.update([package for package in bundle_packages
+                                           if not package.location.been_assigned])
 
     def get_all_packages(self, alternate_locations: Set[Location] = None):
         """
@@ -0,0 +1,76 @@
+from datetime import time
+from typing import Dict, Iterable, List
+
+from src.constants.delivery_status import DeliveryStatus
+from src.models.package import Package
+from src.models.route_run import RouteRun
+
+
+class SimulationResult:
+    """
+    Class representing the outcome of a simulated delivery day.
+
+    Attributes:
+        seed (int): The random seed of the simulation.
+        delivery_times (Dict[int, time]): The delivery time of every package, or None if undelivered, keyed by ID.
+        truck_mileage (Dict[int, float]): The mileage driven by every truck with route runs, keyed by truck ID.
+        late_package_ids (List[int]): The IDs of the packages delivered after their deadline.
+        undelivered_package_ids (List[int]): The IDs of the packages that were not delivered.
+        completion_time (time): The time the last route run is completed, or None if there are no runs.
+    """
+
+    def __init__(self, seed: int, packages: Iterable[Package], runs: Iterable[RouteRun]):
+        """
+        Initializes a SimulationResult object from the packages and route runs of a completed simulation.
+
+        Args:
+            seed (int): The random seed of the simulation.
+            packages (Iterable[Package]): All packages.
+            runs (Iterable[RouteRun]): The simulated route runs.
+
+        Time Complexity: O(n log n + r log r)
+        Space Complexity: O(n + r)
+        """
+
+        packages = sorted(packages, key=lambda package: package.package_id)
+        runs = sorted(runs, key=lambda run: (run.assigned_truck_id, run.start_time))
+        self.seed = seed
+        self.delivery_times: Dict[int, time] = {package.package_id: package.delivery_time for package in packages}
+        self.truck_mileage: Dict[int, float] = dict()
+        for run in runs:
+            self.truck_mileage[run.assigned_truck_id] = (self.truck_mileage.get(run.assigned_truck_id, 0) +
+                                                         run.estimated_mileage)
+        self.late_package_ids: List[int] = [package.package_id for package in packages
+                                            if package.delivery_time and package.deadline
+                                            and package.delivery_time > package.deadline]
+        self.undelivered_package_ids: List[int] = [package.package_id for package in packages
+                                                   if package.status is not DeliveryStatus.DELIVERED]
+        self.completion_time = max([run.estimated_completion_time for run in runs], default=None)
+
+    @property
+    def total_mileage(self) -> float:
+        """
+        Getter property for the total mileage driven by every truck.
+
+        Returns:
+            float: The total mileage.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+
+        return sum(self.truck_mileage.values())
+
+    @property
+    def is_successful(self) -> bool:
+        """
+        Getter property indicating if every package was delivered on time.
+
+        Returns:
+            bool: True if no package is late or undelivered, False otherwise.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return not self.late_package_ids and not self.undelivered_package_ids
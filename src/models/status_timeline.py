@@ -0,0 +1,338 @@
+from array import array
+from bisect import bisect_right
+from copy import copy
+from datetime import time
+from typing import Dict, Hashable, List, Tuple
+
+from src.models.location import Location
+from src.utilities.time_conversion import TimeConversion
+
+__all__ = ['StatusTimeline', 'PackageState']
+
+_VERIFIED_ADDRESS_FLAG = 1
+
+
+class _InternTable:
+    """
+    A table assigning each distinct value a small integer code, so timelines store codes in compact arrays.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty _InternTable object.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.values: List = []
+        self._codes: Dict[Hashable, int] = dict()
+
+    def get_code(self, value: Hashable) -> int:
+        """
+        Retrieves the code of a value, assigning the next code to a new value.
+
+        Args:
+            value (Hashable): The value.
+
+        Returns:
+            int: The code of the value.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class _InternTables:
+    """
+    The intern tables of the statuses, locations, and special notes recorded by the timelines of a day.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty _InternTables object.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.statuses = _InternTable()
+        self.locations = _InternTable()
+        self.special_notes = _InternTable()
+
+
+class PackageState:
+    """
+    The state of a package as of a status update.
+
+    Attributes:
+        package_id (int): The ID of the package.
+        update_time (time): The time of the status update.
+        status (DeliveryStatus or Tuple[DeliveryStatus]): The status, or the statuses in order if the package changed
+            status more than once at the update time.
+        location (Location): The delivery location of the package.
+        is_verified_address (bool): Flag indicating if the package's address was verified.
+        special_note (str): The special note of the package.
+    """
+
+    __slots__ = ('package_id', 'update_time', 'status', 'location', 'is_verified_address', 'special_note')
+
+    def __init__(self, package_id: int, update_time: time, status, location: Location, is_verified_address: bool,
+                 special_note: str):
+        """
+        Initializes a PackageState object.
+
+        Args:
+            package_id (int): The ID of the package.
+            update_time (time): The time of the status update.
+            status (DeliveryStatus or Tuple[DeliveryStatus]): The status.
+            location (Location): The delivery location.
+            is_verified_address (bool): Flag indicating if the address was verified.
+            special_note (str): The special note.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.package_id = package_id
+        self.update_time = update_time
+        self.status = status
+        self.location = location
+        self.is_verified_address = is_verified_address
+        self.special_note = special_note
+
+    def as_dict(self) -> dict:
+        """
+        Returns the state in the form of an entry of Package.status_update_dict.
+
+        Returns:
+            dict: The status, location, address verification, and special note of the package.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return {'status': self.status, 'location': self.location, 'is_verified_address': self.is_verified_address,
+                'special_note': self.special_note}
+
+
+class StatusTimeline:
+    """
+    The status history of a package, stored as parallel arrays sorted by time so the state at any time is found by
+        binary search.
+
+    Each status update is a row of the update time in seconds since midnight, a status code, a location code, flags,
+        and a special note code. Codes index tables shared by every timeline of the day, so a row takes a few bytes
+        and reading a state never copies the package. Each day starts new tables, so they hold only the values of the
+        loaded day, while timelines of an earlier day keep reading the tables they were created with.
+    """
+
+    __slots__ = ('_seconds', '_status_codes', '_location_codes', '_flags', '_special_note_codes', '_tables')
+    _day_tables = _InternTables()
+
+    def __init__(self):
+        """
+        Initializes an empty StatusTimeline object.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._seconds = array('l')
+        self._status_codes = array('H')
+        self._location_codes = array('I')
+        self._flags = array('B')
+        self._special_note_codes = array('I')
+        self._tables = StatusTimeline._day_tables
+
+    @staticmethod
+    def start_day():
+        """
+        Starts new intern tables for the timelines created from now on, such as for the packages of a new day.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        StatusTimeline._day_tables = _InternTables()
+
+    def __len__(self):
+        """
+        Returns the number of status updates.
+
+        Returns:
+            int: The number of status updates.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return len(self._seconds)
+
+    def record(self, update_time: time, status, location: Location, is_verified_address: bool,
+               special_note: str) -> bool:
+        """
+        Records a status update. A second update at the same time appends its status to the statuses at that time,
+            keeping the location, address verification, and special note of the first.
+
+        Args:
+            update_time (time): The time of the update.
+            status (DeliveryStatus): The updated status.
+            location (Location): The delivery location of the package.
+            is_verified_address (bool): Flag indicating if the package's address is verified.
+            special_note (str): The special note of the package.
+
+        Returns:
+            bool: True if the update was recorded, False if the status was already recorded at the time.
+
+        Time Complexity: O(log k) for updates in order of time, O(k) otherwise, where k is the number of updates.
+        Space Complexity: O(1)
+        """
+
+        seconds = TimeConversion.get_seconds(update_time)
+        index = len(self._seconds)
+        if index and self._seconds[-1] >= seconds:
+            index = bisect_right(self._seconds, seconds)
+        if index and self._seconds[index - 1] == seconds:
+            previous_status = self._tables.statuses.values[self._status_codes[index - 1]]
+            if previous_status is status or (isinstance(previous_status, tuple) and status in previous_status):
+                return False
+            updated_status = (previous_status + (status,) if isinstance(previous_status, tuple)
+                              else (previous_status, status))
+            self._status_codes[index - 1] = self._tables.statuses.get_code(updated_status)
+            return True
+        self._seconds.insert(index, seconds)
+        self._status_codes.insert(index, self._tables.statuses.get_code(copy(status)))
+        self._location_codes.insert(index, self._tables.locations.get_code(location))
+        self._flags.insert(index, _VERIFIED_ADDRESS_FLAG if is_verified_address else 0)
+        self._special_note_codes.insert(index, self._tables.special_notes.get_code(special_note))
+        return True
+
+    def find_index(self, target_time: time) -> int:
+        """
+        Finds the latest status update at or before a time, or the first update if the time is before every update.
+
+        Args:
+            target_time (time): The time.
+
+        Returns:
+            int: The index of the status update.
+
+        Time Complexity: O(log k)
+        Space Complexity: O(1)
+        """
+
+        return max(bisect_right(self._seconds, TimeConversion.get_seconds(target_time)) - 1, 0)
+
+    def advance_index(self, index: int, target_seconds: int) -> int:
+        """
+        Steps forward from a status update to the latest status update at or before a time, which is faster than a
+            binary search when the time is only a few updates later.
+
+        Args:
+            index (int): The index of a status update at or before the time.
+            target_seconds (int): The time in seconds since midnight.
+
+        Returns:
+            int: The index of the latest status update at or before the time.
+
+        Time Complexity: O(u), where u is the number of updates stepped over.
+        Space Complexity: O(1)
+        """
+
+        last_index = len(self._seconds) - 1
+        while index < last_index and self._seconds[index + 1] <= target_seconds:
+            index += 1
+        return index
+
+    def truncate(self, length: int):
+        """
+        Removes every status update after the first given number of updates.
+
+        Args:
+            length (int): The number of status updates to keep.
+
+        Time Complexity: O(k)
+        Space Complexity: O(1)
+        """
+
+        for column in (self._seconds, self._status_codes, self._location_codes, self._flags,
+                       self._special_note_codes):
+            del column[length:]
+
+    def get_state(self, index: int, package_id: int = None) -> PackageState:
+        """
+        Retrieves the state of the package as of a status update.
+
+        Args:
+            index (int): The index of the status update.
+            package_id (int, optional): The ID of the package. Defaults to None.
+
+        Returns:
+            PackageState: The state of the package.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return PackageState(package_id, TimeConversion.get_time(self._seconds[index]),
+                            self._tables.statuses.values[self._status_codes[index]],
+                            self._tables.locations.values[self._location_codes[index]],
+                            bool(self._flags[index] & _VERIFIED_ADDRESS_FLAG),
+                            self._tables.special_notes.values[self._special_note_codes[index]])
+
+    def get_state_at_time(self, target_time: time, package_id: int = None) -> PackageState:
+        """
+        Retrieves the state of the package as of the latest status update at or before a time.
+
+        Args:
+            target_time (time): The time.
+            package_id (int, optional): The ID of the package. Defaults to None.
+
+        Returns:
+            PackageState: The state of the package.
+
+        Time Complexity: O(log k)
+        Space Complexity: O(1)
+        """
+
+        return self.get_state(self.find_index(target_time), package_id)
+
+    def get_row_at_seconds(self, target_seconds: int) -> Tuple[int, object, Location]:
+        """
+        Retrieves the time, status, and location of the latest status update at or before a time, or of the first
+            update if the time is before every update, without building a PackageState.
+
+        Args:
+            target_seconds (int): The time in seconds since midnight.
+
+        Returns:
+            Tuple[int, DeliveryStatus or Tuple[DeliveryStatus], Location]: The time of the update in seconds since
+                midnight, its status, and the delivery location.
+
+        Time Complexity: O(log k)
+        Space Complexity: O(1)
+        """
+
+        index = max(bisect_right(self._seconds, target_seconds) - 1, 0)
+        return (self._seconds[index], self._tables.statuses.values[self._status_codes[index]],
+                self._tables.locations.values[self._location_codes[index]])
+
+    def get_states(self) -> List[Tuple[time, PackageState]]:
+        """
+        Retrieves every status update in order of time.
+
+        Returns:
+            List[Tuple[time, PackageState]]: The time and state of each status update.
+
+        Time Complexity: O(k)
+        Space Complexity: O(k)
+        """
+
+        return [(state.update_time, state) for state in [self.get_state(i) for i in range(len(self._seconds))]]
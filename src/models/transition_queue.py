@@ -0,0 +1,127 @@
+import heapq
+from itertools import count
+from typing import Iterable, List, Optional, Tuple
+
+from src import config
+from src.constants.delivery_status import DeliveryStatus
+from src.constants.package_transition import PackageTransition
+from src.models.package import Package
+from src.utilities.time_conversion import TimeConversion
+
+__all__ = ['TransitionQueue']
+
+
+class TransitionQueue:
+    """
+    A priority queue of the scheduled transitions of packages, such as hub arrivals and address updates, keyed by the
+        time they are due.
+
+    Popping the transitions due at a time costs O(log q) per transition, so a status update costs time proportional to
+        the number of packages that change rather than the number of packages.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty TransitionQueue object.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._heap: List[tuple] = []
+        self._sequence = count()
+
+    def __len__(self):
+        """
+        Returns the number of pending transitions.
+
+        Returns:
+            int: The number of transitions.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return len(self._heap)
+
+    def clear(self):
+        """
+        Removes every pending transition.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._heap = []
+
+    def schedule(self, seconds: int, transition: PackageTransition, package: Package, address: str = None):
+        """
+        Schedules a transition of a package. Transitions due at the same time are popped in order of transition, then
+            in the order they were scheduled.
+
+        Args:
+            seconds (int): The time the transition is due in seconds since midnight.
+            transition (PackageTransition): The transition.
+            package (Package): The package.
+            address (str, optional): The updated address of an address update. Defaults to None.
+
+        Time Complexity: O(log q), where q is the number of pending transitions.
+        Space Complexity: O(1)
+        """
+
+        heapq.heappush(self._heap, (seconds, transition.value, next(self._sequence), transition, package, address))
+
+    def schedule_packages(self, packages: Iterable[Package]):
+        """
+        Schedules the pending transitions of packages: the hub arrival of each package still on route to the hub, and
+            the expected address update of each package with an unverified address.
+
+        Args:
+            packages (Iterable[Package]): The packages.
+
+        Time Complexity: O(n log n)
+        Space Complexity: O(n)
+        """
+
+        for package in packages:
+            if package.status is DeliveryStatus.ON_ROUTE_TO_DEPOT and package.hub_arrival_time:
+                self.schedule(TimeConversion.get_seconds(package.hub_arrival_time), PackageTransition.HUB_ARRIVAL,
+                              package)
+            if not package.is_verified_address and package.package_id in config.EXCEPTED_UPDATES:
+                update = config.EXCEPTED_UPDATES[package.package_id]
+                self.schedule(TimeConversion.get_seconds(update['update_time']), PackageTransition.ADDRESS_UPDATE,
+                              package, update['address'])
+
+    def get_next_seconds(self) -> Optional[int]:
+        """
+        Retrieves the time the next transition is due.
+
+        Returns:
+            int: The time in seconds since midnight, or None if no transition is pending.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, seconds: int) -> List[Tuple[PackageTransition, Package, Optional[str]]]:
+        """
+        Removes and returns the transitions due at or before a time.
+
+        Args:
+            seconds (int): The time in seconds since midnight.
+
+        Returns:
+            List[Tuple[PackageTransition, Package, str]]: The transition, package, and updated address of each due
+                transition, in order of due time.
+
+        Time Complexity: O(d log q), where d is the number of due transitions.
+        Space Complexity: O(d)
+        """
+
+        due_transitions = []
+        while self._heap and self._heap[0][0] <= seconds:
+            _, _, _, transition, package, address = heapq.heappop(self._heap)
+            due_transitions.append((transition, package, address))
+        return due_transitions
@@ -2,7 +2,7 @@ from datetime import time
 
 __all__ = ['Truck']
 
-from typing import Set
+from typing import Iterable, Set, Tuple
 
 from src import config
 from src.constants.delivery_status import DeliveryStatus
@@ -267,9 +267,35 @@ class Truck(CustomHash):
         if self._size > config.NUM_TRUCK_CAPACITY:
             raise TruckCapacityExceededError
         if not is_simulated_load:
-            package.update_status(DeliveryStatus.LOADED, self.clock)
+            package.update_status(DeliveryStatus.LOADED, self.clock, self.truck_id)
         super().add_package(package)
 
+    def add_packages(self, packages: Iterable[Package], is_simulated_load=True) -> int:
+        """
+        Adds packages to the truck in one batch.
+
+        Args:
+            packages (Iterable[Package]): The packages to add.
+            is_simulated_load (bool): Indicates if the package addition is simulated.
+
+        Returns:
+            int: The number of packages added.
+
+        Raises:
+            TruckCapacityExceededError: If the packages do not fit on the truck.
+
+        Time Complexity: O(p), where p is the number of packages to add.
+        Space Complexity: O(p)
+        """
+
+        packages = list(packages)
+        if self._size + len(packages) > config.NUM_TRUCK_CAPACITY:
+            raise TruckCapacityExceededError
+        if not is_simulated_load:
+            for package in packages:
+                package.update_status(DeliveryStatus.LOADED, self.clock, self.truck_id)
+        return super().add_packages(packages)
+
     def dispatch(self):
         """
         Dispatches the truck, marking the current time as the dispatch time and updating the status of the
@@ -283,13 +309,17 @@ class Truck(CustomHash):
             self._dispatch_time = self.clock
             self._is_dispatched = True
         for package in self.current_run.required_packages:
-            package.update_status(DeliveryStatus.OUT_FOR_DELIVERY, self.clock)
+            package.update_status(DeliveryStatus.OUT_FOR_DELIVERY, self.clock, self.truck_id)
 
-    def deliver(self):
+    def deliver(self, packages: Iterable[Package] = None):
         """
-        Delivers packages at the current location, updating their
+        Delivers the undelivered packages at the current location, updating their
             status to "DELIVERED" and removing them from the truck.
 
+        Args:
+            packages (Iterable[Package], optional): The packages to deliver. Defaults to None (every package at the
+                current location).
+
         Returns:
             Set[Package]: The set of delivered packages.
 
@@ -303,11 +333,13 @@ class Truck(CustomHash):
         delivered_packages = set()
         if not self.current_location or self.current_location.is_hub:
             return delivered_packages
-        for package in self.current_location.package_set:
+        for package in self.current_location.package_set if packages is None else packages:
+            if package.status is DeliveryStatus.DELIVERED:
+                continue
             delivered_package = self.get_package(package.package_id)
             if not delivered_package:
                 raise PackageNotOnTruckError
-            package.update_status(DeliveryStatus.DELIVERED, self.clock)
+            package.update_status(DeliveryStatus.DELIVERED, self.clock, self.truck_id)
             package.delivery_time = self.clock
             self.remove_package(package.package_id)
             delivered_packages.add(package)
@@ -320,18 +352,27 @@ class Truck(CustomHash):
         Returns:
             Set[Package]: The set of unloaded packages.
 
-        Time Complexity: O(n^2)
+        Time Complexity: O(n)
         Space Complexity: O(n)
         """
 
-        truck_packages = set()
-        for slot in self._arr:
-            for package in slot:
-                truck_packages.add(package)
-        self._arr = [[] for _ in range(self._capacity)]
-        self._size = 0
+        truck_packages = set(self)
+        self.clear()
         return truck_packages
 
+    def get_package_ids(self) -> Tuple[int, ...]:
+        """
+        Retrieves the IDs of the packages on the truck.
+
+        Returns:
+            Tuple[int]: The IDs of the packages, in ascending order.
+
+        Time Complexity: O(n log n)
+        Space Complexity: O(n)
+        """
+
+        return tuple(sorted(package.package_id for package in self))
+
     def distance(self, origin_location=None, target_location=None, to_hub=False):
         """
         Calculates the distance between two locations.
@@ -381,7 +422,7 @@ class Truck(CustomHash):
         Returns:
             bool: True if the package is on the truck, False otherwise.
 
-        Time Complexity: O(n)
+        Time Complexity: O(1)
         Space Complexity: O(1)
         """
 
@@ -4,7 +4,10 @@ from datetime import time
 
 from src import config
 from src.constants.color import Color
+from src.utilities.checkpoint_recorder import CheckpointRecorder
+from src.utilities.log_sink import LogSink
 from src.utilities.package_handler import PackageHandler
+from src.utilities.status_report import StatusReport
 
 
 def _simulation():
@@ -33,21 +36,14 @@ def _clear():
 
 def _retrieve_status_of_all_packages():
     """
-    Retrieves the status of all packages and displays them.
+    Retrieves the status of all packages and displays them as one table.
 
-    Time Complexity: O(n)
-    Space Complexity: O(1)
+    Time Complexity: O(n log n)
+    Space Complexity: O(n)
     """
 
     _clear()
-    address_length = max([len(location.get_full_address()) for location in PackageHandler.all_locations])
-    for i in range(1, len(PackageHandler.all_packages) + 1):
-        snapshot_package = PackageHandler.get_package_snapshot(PackageHandler.package_hash.get_package(i),
-                                                               target_time=UI.TIME)
-        color = (snapshot_package.status.color if not isinstance(snapshot_package.status, tuple) else
-                 snapshot_package.status[-1].color)
-        UI.print(snapshot_package.get_status_string(UI.TIME, address_length=address_length), sleep_seconds=.25,
-                 color=color, log_enabled=False)
+    print(StatusReport.to_text(UI.TIME, is_colored=config.UI_ELEMENTS_ENABLED), end='')
     UI.press_enter_to_continue()
     _clear()
 
@@ -84,12 +80,36 @@ def _retrieve_package_details():
             _clear()
 
 
+def _display_truck_positions():
+    """
+    Displays the position, load, and mileage of each truck at the current time, reconstructed from the checkpoints
+        of the deliveries.
+
+    Time Complexity: O(log c + e + n + u)
+    Space Complexity: O(n)
+    """
+
+    if UI.CHECKPOINTS is None or not UI.CHECKPOINTS.checkpoints:
+        return
+    truck_states, _ = UI.CHECKPOINTS.get_state_at_time(UI.TIME)
+    for truck_id, truck_state in sorted(truck_states.items()):
+        if truck_state.current_run is None:
+            position = f'Route completed at {truck_state.current_location.name}'
+        elif not truck_state.is_driving:
+            position = f'Waiting at {truck_state.current_location.name}'
+        else:
+            position = f'Left {truck_state.current_location.name} for {truck_state.next_location.name}'
+        UI.print(f'Truck #{truck_id} | {position} | {len(truck_state.package_ids)} packages on truck |'
+                 f' {truck_state.mileage:.1f} miles driven', color=UI.get_assigned_color(truck_id), log_enabled=False)
+    UI.print('', extra_lines=1, log_enabled=False)
+
+
 def _time_machine():
     """
-    Allows the user to input a time to transport to.
+    Allows the user to input a time to transport to, then displays where the trucks were at that time.
 
-    Time Complexity: O(1)
-    Space Complexity: O(1)
+    Time Complexity: O(log c + e + n + u)
+    Space Complexity: O(n)
     """
 
     _clear()
@@ -105,23 +125,39 @@ def _time_machine():
             UI.TIME = time(hour=hour, minute=minute)
             UI.print('Transporting', think=True, color=Color.RED, sleep_seconds=1, log_enabled=False)
             _clear()
+            _display_truck_positions()
             return
 
 
 def _view_log():
     """
-    Displays the log file.
+    Displays the log file a page at a time, letting the user page through it or search it.
 
-    Time Complexity: O(n)
-    Space Complexity: O(1)
+    Time Complexity: O(f) per page or search, where f is the size of the log files.
+    Space Complexity: O(p), where p is the number of lines per page.
     """
 
     UI.print('Transporting to end of day', think=True, color=Color.RED, sleep_seconds=1, log_enabled=False)
     print('\n\n')
-    for line in UI.LOG_FILE.splitlines():
-        print(line)
-        sleep(.025)
-    UI.press_enter_to_continue()
+    page_index = 0
+    while True:
+        page = UI.LOG.get_page(page_index)
+        for line in page:
+            print(line)
+        if not page:
+            UI.print('END OF LOG', color=Color.YELLOW, log_enabled=False)
+        user_input = input('\n[ENTER] NEXT PAGE | [B] PREVIOUS PAGE | [/TEXT] SEARCH | [Q] QUIT -> ').strip()
+        if user_input.lower() == 'q':
+            break
+        if user_input.startswith('/'):
+            matches = UI.LOG.search(user_input[1:])
+            for line_number, line in matches:
+                print(f'{line_number:>6}: {line}')
+            UI.print(f'\n{len(matches)} matching lines', color=Color.YELLOW, log_enabled=False)
+        elif user_input.lower() == 'b':
+            page_index = max(page_index - 1, 0)
+        elif page:
+            page_index += 1
     print('\n\n')
     UI.print('Transporting to previous time', think=True, color=Color.RED, sleep_seconds=1, log_enabled=False)
     print('\n\n')
@@ -163,7 +199,25 @@ class UI:
     UNDERLINE = '\033[4m'
     STRIKETHROUGH = '\u001b[9m'
     ASSIGNED_COLOR = {1: Color.BRIGHT_BLUE, 2: Color.BRIGHT_CYAN, 3: Color.BRIGHT_MAGENTA}
-    LOG_FILE = ''
+    LOG = LogSink(config.LOG_FILE)
+    CHECKPOINTS: CheckpointRecorder = None
+
+    @staticmethod
+    def get_assigned_color(truck_id: int) -> Color:
+        """
+        Gets the display color of a truck, cycling through the assigned colors for fleets of any size.
+
+        Args:
+            truck_id (int): The ID of the truck.
+
+        Returns:
+            Color: The display color of the truck.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return UI.ASSIGNED_COLOR[(truck_id - 1) % len(UI.ASSIGNED_COLOR) + 1]
 
     @staticmethod
     def print(output: str, sleep_seconds: float = 0, color: Color = None, think=False, extra_lines=0,
@@ -183,6 +237,8 @@ class UI:
         Space Complexity: O(1)
         """
 
+        if config.HEADLESS_SIMULATION_ENABLED:
+            return
         if not config.UI_ELEMENTS_ENABLED:
             color = None
             sleep_seconds = 0
@@ -195,7 +251,7 @@ class UI:
             print(output, end='' if think else '\n')
             sleep(sleep_seconds / (UI.SPEED / 100))
         if log_enabled:
-            UI.LOG_FILE += (output + '\n')
+            UI.LOG.write(output)
         if think:
             for _ in range(3):
                 if config.UI_ENABLED:
@@ -207,7 +263,7 @@ class UI:
             extra_lines = 100
         for _ in range(extra_lines):
             if log_enabled:
-                UI.LOG_FILE += '\n'
+                UI.LOG.write('')
             print()
 
     @staticmethod
@@ -222,6 +278,8 @@ class UI:
         Space Complexity: O(1)
         """
 
+        if config.HEADLESS_SIMULATION_ENABLED:
+            return
         if config.UI_ENABLED and config.UI_ELEMENTS_ENABLED:
             input('\n\nPress Enter key to continue...')
             print('\n\n')
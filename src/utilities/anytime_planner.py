@@ -0,0 +1,138 @@
+import io
+from contextlib import redirect_stdout
+from datetime import time
+from time import perf_counter
+from typing import Callable, Set
+
+from src import config
+from src.models.truck import Truck
+from src.ui import UI
+from src.utilities.package_handler import PackageHandler
+from src.utilities.route_builder import RouteBuilder
+from src.utilities.run_planner import RunPlanner
+
+__all__ = ['AnytimePlanner']
+
+
+def _build_quietly() -> Set[Truck]:
+    """
+    Builds the greedy route plan without printing, sleeping, waiting on input or writing to the log.
+
+    Returns:
+        Set[Truck]: The set of trucks assigned to the runs.
+
+    Time Complexity: O(n * m)
+    Space Complexity: O(n)
+    """
+
+    ui_enabled, ui_elements_enabled, log_enabled = config.UI_ENABLED, config.UI_ELEMENTS_ENABLED, UI.LOG.is_enabled
+    config.UI_ENABLED = False
+    config.UI_ELEMENTS_ENABLED = False
+    UI.LOG.is_enabled = False
+    try:
+        with redirect_stdout(io.StringIO()):
+            return RouteBuilder.build_optimized_runs()
+    finally:
+        config.UI_ENABLED = ui_enabled
+        config.UI_ELEMENTS_ENABLED = ui_elements_enabled
+        UI.LOG.is_enabled = log_enabled
+
+
+def _get_plan_mileage(trucks: Set[Truck]) -> float:
+    """
+    Calculates the total estimated mileage of every run in the plan.
+
+    Args:
+        trucks (Set[Truck]): The trucks of the plan.
+
+    Returns:
+        float: The total estimated mileage.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+
+    return sum([run.estimated_mileage for truck in trucks for run in truck.route_runs])
+
+
+def _get_plan_completion_time(trucks: Set[Truck]) -> time:
+    """
+    Finds the latest estimated completion time of every run in the plan.
+
+    Args:
+        trucks (Set[Truck]): The trucks of the plan.
+
+    Returns:
+        time: The latest estimated completion time.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+
+    return max([run.estimated_completion_time for truck in trucks for run in truck.route_runs])
+
+
+def _is_complete_plan(trucks: Set[Truck]) -> bool:
+    """
+    Checks if the plan has at least one run and every location has been assigned to a run.
+
+    Args:
+        trucks (Set[Truck]): The trucks of the plan.
+
+    Returns:
+        bool: True if the plan is complete, False otherwise.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+
+    return (any([truck.route_runs for truck in trucks]) and
+            all([location.been_assigned for location in PackageHandler.all_locations]))
+
+
+class AnytimePlanner:
+    """
+    Plans route runs within a time budget, streaming every improved plan as soon as it is found.
+
+    The greedy plan from RouteBuilder is produced first and reported as the initial incumbent. The remaining budget
+        is spent refining the runs of the incumbent one improving move at a time, so the planner can be stopped at any
+        point and still hand back the best plan found so far.
+    """
+
+    @staticmethod
+    def plan(time_budget_seconds: float = config.PLANNING_TIME_BUDGET_SECONDS,
+             on_incumbent: Callable[[Set[Truck], float, time], None] = None) -> Set[Truck]:
+        """
+        Builds the best route plan that can be found within the time budget.
+
+        Args:
+            time_budget_seconds (float): The planning time budget in seconds.
+                Defaults to config.PLANNING_TIME_BUDGET_SECONDS.
+            on_incumbent (Callable, optional): Called with the trucks, total mileage and completion time every time
+                a better plan is found. Defaults to None.
+
+        Returns:
+            Set[Truck]: The set of trucks assigned to the runs of the best plan.
+
+        Time Complexity: O(n * m) for the greedy plan, then bounded by the time budget
+        Space Complexity: O(n)
+        """
+
+        deadline = perf_counter() + time_budget_seconds
+        trucks = _build_quietly()
+        if not _is_complete_plan(trucks):
+            return trucks
+        if on_incumbent:
+            on_incumbent(trucks, _get_plan_mileage(trucks), _get_plan_completion_time(trucks))
+        runs = sorted([run for truck in trucks for run in truck.route_runs])
+        improved = True
+        while improved and perf_counter() < deadline:
+            improved = False
+            for run in runs:
+                if perf_counter() >= deadline:
+                    break
+                if RunPlanner.refine(run, max_moves=1) > 0:
+                    improved = True
+                    if on_incumbent:
+                        on_incumbent(trucks, _get_plan_mileage(trucks), _get_plan_completion_time(trucks))
+        return trucks
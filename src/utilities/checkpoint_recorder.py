@@ -0,0 +1,301 @@
+from array import array
+from bisect import bisect_right
+from datetime import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src import config
+from src.constants.delivery_status import DeliveryStatus
+from src.constants.run_info import RunInfo
+from src.models.checkpoint import Checkpoint, TruckState
+from src.models.location import Location
+from src.models.package import Package
+from src.models.route_run import RouteRun
+from src.models.status_timeline import PackageState
+from src.models.truck import Truck
+from src.utilities.time_conversion import TimeConversion
+
+__all__ = ['CheckpointRecorder']
+
+_STATUS_CODES: Dict[DeliveryStatus, int] = {status: code for code, status in enumerate(DeliveryStatus)}
+
+
+def _is_pending_run(run: RouteRun, truck: Truck) -> bool:
+    """
+    Checks if a route run of a truck is in progress or still to come, comparing runs by identity since runs compare
+        equal by start time.
+
+    Args:
+        run (RouteRun): The route run.
+        truck (Truck): The truck assigned the run.
+
+    Returns:
+        bool: True if the run is the truck's current run or one of its remaining runs, False otherwise.
+
+    Time Complexity: O(r)
+    Space Complexity: O(1)
+    """
+
+    return run is truck.current_run or any(run is route_run for route_run in truck.route_runs)
+
+
+def _get_mileage(truck: Truck, runs: Iterable[RouteRun], is_driving: bool) -> float:
+    """
+    Calculates the miles a truck has driven since the start of the day from the estimated mileage of its completed
+        route runs and its position on its current run.
+
+    Args:
+        truck (Truck): The truck.
+        runs (Iterable[RouteRun]): All route runs.
+        is_driving (bool): Flag indicating if the truck has departed on its current run.
+
+    Returns:
+        float: The miles driven.
+
+    Time Complexity: O(r^2)
+    Space Complexity: O(1)
+    """
+
+    mileage = sum([run.estimated_mileage for run in runs
+                   if run.assigned_truck_id == truck.truck_id and not _is_pending_run(run, truck)])
+    if is_driving and truck.current_run is not None:
+        analysis_dict = truck.current_run.run_analysis_dict[(truck.previous_location, truck.current_location)]
+        mileage += analysis_dict[RunInfo.ESTIMATED_MILEAGE]
+    return mileage
+
+
+def _restore_package(package: Package, package_state: PackageState, update_count: int):
+    """
+    Restores a package to its state as of a status update, discarding its later status updates.
+
+    Args:
+        package (Package): The package.
+        package_state (PackageState): The state of the package as of the status update.
+        update_count (int): The number of status updates to keep.
+
+    Time Complexity: O(k)
+    Space Complexity: O(1)
+    """
+
+    package.status_timeline.truncate(update_count)
+    if package.location is not package_state.location:
+        package.location.package_set.discard(package)
+        package_state.location.package_set.add(package)
+        package.location = package_state.location
+    status = package_state.status[-1] if isinstance(package_state.status, tuple) else package_state.status
+    package.status = status
+    package.is_verified_address = package_state.is_verified_address
+    package.special_note = package_state.special_note
+    if status is not DeliveryStatus.DELIVERED:
+        package.delivery_time = None
+
+
+class CheckpointRecorder:
+    """
+    Records the delivery simulation as periodic checkpoints and the truck events in between.
+
+    A truck event is recorded whenever a truck departs, arrives, or reloads, and a checkpoint of every truck and package
+        is taken at a fixed interval. The state at any time is the nearest earlier checkpoint with the few truck events
+        and status updates since applied, rather than a replay of the day, and the simulation can be resumed from any
+        checkpoint.
+
+    Attributes:
+        trucks_by_id (Dict[int, Truck]): The recorded trucks keyed by truck ID.
+        runs (Tuple[RouteRun]): The recorded route runs, in order of truck ID and start time.
+        packages (Tuple[Package]): The recorded packages, in order of package ID.
+        start_seconds (int): The start time of the deliveries in seconds since midnight.
+        interval_seconds (int): The number of seconds between checkpoints.
+        checkpoints (List[Checkpoint]): The checkpoints, in order of time.
+    """
+
+    def __init__(self, trucks: Iterable[Truck], runs: Iterable[RouteRun], packages: Iterable[Package],
+                 start_seconds: int, interval_seconds: int = config.CHECKPOINT_INTERVAL_SECONDS):
+        """
+        Initializes a CheckpointRecorder object.
+
+        Args:
+            trucks (Iterable[Truck]): The trucks with route runs.
+            runs (Iterable[RouteRun]): The route runs.
+            packages (Iterable[Package]): The packages.
+            start_seconds (int): The start time of the deliveries in seconds since midnight.
+            interval_seconds (int): The number of seconds between checkpoints. Defaults to
+                config.CHECKPOINT_INTERVAL_SECONDS.
+
+        Time Complexity: O(n log n + r log r)
+        Space Complexity: O(n + r)
+        """
+
+        self.trucks_by_id: Dict[int, Truck] = {truck.truck_id: truck for truck in trucks}
+        self.runs: Tuple[RouteRun, ...] = tuple(sorted(runs, key=lambda run: (run.assigned_truck_id, run.start_time)))
+        self.packages: Tuple[Package, ...] = tuple(sorted(packages, key=lambda package: package.package_id))
+        self._packages_by_id: Dict[int, Package] = {package.package_id: package for package in self.packages}
+        self.start_seconds = start_seconds
+        self.interval_seconds = max(interval_seconds, 1)
+        self.checkpoints: List[Checkpoint] = []
+        self._checkpoint_seconds = array('l')
+        self._events: List[TruckState] = []
+        self._event_seconds = array('l')
+        self._truck_states: Dict[int, TruckState] = dict()
+
+    def get_next_seconds(self, seconds: int) -> int:
+        """
+        Retrieves the time of the first scheduled checkpoint at or after a time. Checkpoints are scheduled every
+            interval from the start of the deliveries.
+
+        Args:
+            seconds (int): The time in seconds since midnight.
+
+        Returns:
+            int: The time of the checkpoint in seconds since midnight.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        elapsed_intervals = -(-max(seconds - self.start_seconds, 0) // self.interval_seconds)
+        return self.start_seconds + elapsed_intervals * self.interval_seconds
+
+    def record_truck(self, seconds: int, truck: Truck, is_driving: bool) -> TruckState:
+        """
+        Records a truck event, such as a departure, an arrival, or a reload.
+
+        Args:
+            seconds (int): The time of the event in seconds since midnight.
+            truck (Truck): The truck.
+            is_driving (bool): Flag indicating if the truck has departed on its current run.
+
+        Returns:
+            TruckState: The recorded state of the truck.
+
+        Time Complexity: O(n log n + r^2)
+        Space Complexity: O(n)
+        """
+
+        mileage = _get_mileage(truck, self.runs, is_driving)
+        truck_state = TruckState(truck.truck_id, seconds, truck.previous_location, truck.current_location,
+                                 truck.next_location, truck.get_package_ids(), mileage, truck.current_run,
+                                 tuple(truck.route_runs), is_driving)
+        self._events.append(truck_state)
+        self._event_seconds.append(seconds)
+        self._truck_states[truck.truck_id] = truck_state
+        return truck_state
+
+    def take(self, seconds: int, visited_locations: Set[Location]) -> Checkpoint:
+        """
+        Takes a checkpoint of the trucks, packages, and route runs.
+
+        Args:
+            seconds (int): The current time in seconds since midnight.
+            visited_locations (Set[Location]): The locations visited by any truck.
+
+        Returns:
+            Checkpoint: The checkpoint.
+
+        Time Complexity: O(n + r * l), where l is the number of locations on a route run.
+        Space Complexity: O(n + r * l)
+        """
+
+        checkpoint = Checkpoint(
+            seconds, len(self._events), len(Package.event_log), dict(self._truck_states),
+            array('B', [_STATUS_CODES[package.status] for package in self.packages]),
+            array('H', [len(package.status_timeline) - 1 for package in self.packages]),
+            [(run, tuple(run.ordered_route), run.locations, run.run_analysis_dict) for run in self.runs],
+            frozenset(visited_locations),
+            frozenset([package.location for package in self.packages if package.location.has_rerouted_package]))
+        self.checkpoints.append(checkpoint)
+        self._checkpoint_seconds.append(seconds)
+        return checkpoint
+
+    def find_checkpoint(self, target_seconds: int) -> Optional[Checkpoint]:
+        """
+        Finds the latest checkpoint at or before a time.
+
+        Args:
+            target_seconds (int): The time in seconds since midnight.
+
+        Returns:
+            Checkpoint: The checkpoint, or None if every checkpoint is later.
+
+        Time Complexity: O(log c), where c is the number of checkpoints.
+        Space Complexity: O(1)
+        """
+
+        index = bisect_right(self._checkpoint_seconds, target_seconds) - 1
+        return self.checkpoints[index] if index >= 0 else None
+
+    def get_state_at_time(self, target_time: time) -> Tuple[Dict[int, TruckState], List[PackageState]]:
+        """
+        Reconstructs the state of the trucks and packages at a time from the nearest earlier checkpoint, or the first
+            checkpoint if the time is before every checkpoint.
+
+        Args:
+            target_time (time): The time.
+
+        Returns:
+            Tuple[Dict[int, TruckState], List[PackageState]]: The state of every truck keyed by truck ID, and the
+                state of every package in order of package ID.
+
+        Time Complexity: O(log c + e + n + u), where e is the number of truck events and u the number of status
+            updates since the checkpoint.
+        Space Complexity: O(n)
+        """
+
+        target_seconds = TimeConversion.get_seconds(target_time)
+        checkpoint = self.find_checkpoint(target_seconds) or self.checkpoints[0]
+        truck_states = dict(checkpoint.truck_states)
+        for index in range(checkpoint.event_count, bisect_right(self._event_seconds, target_seconds)):
+            truck_states[self._events[index].truck_id] = self._events[index]
+        package_states = []
+        for package, update_index in zip(self.packages, checkpoint.update_indexes):
+            timeline = package.status_timeline
+            package_states.append(timeline.get_state(timeline.advance_index(update_index, target_seconds),
+                                                     package.package_id))
+        return truck_states, package_states
+
+    def restore(self, checkpoint: Checkpoint) -> Set[Truck]:
+        """
+        Restores the trucks, packages, and route runs to a checkpoint so the simulation can be resumed from it,
+            discarding the later checkpoints, truck events, and status updates, including those in
+            Package.event_log.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint.
+
+        Returns:
+            Set[Truck]: The trucks with a route run in progress or still to come.
+
+        Time Complexity: O(n * k + r * l + e)
+        Space Complexity: O(n)
+        """
+
+        index = self.checkpoints.index(checkpoint)
+        del self.checkpoints[index + 1:]
+        del self._checkpoint_seconds[index + 1:]
+        del self._events[checkpoint.event_count:]
+        del self._event_seconds[checkpoint.event_count:]
+        self._truck_states = dict(checkpoint.truck_states)
+        Package.event_log.truncate(checkpoint.log_length)
+        for package in self.packages:
+            package.location.has_rerouted_package = False
+        for package, update_index in zip(self.packages, checkpoint.update_indexes):
+            _restore_package(package, package.status_timeline.get_state(update_index), update_index + 1)
+        for location in checkpoint.rerouted_locations:
+            location.has_rerouted_package = True
+        for run, ordered_route, locations, run_analysis_dict in checkpoint.run_routes:
+            run.ordered_route = list(ordered_route)
+            run.locations = locations
+            run.run_analysis_dict = run_analysis_dict
+        trucks = set()
+        for truck_id, truck_state in checkpoint.truck_states.items():
+            truck = self.trucks_by_id[truck_id]
+            truck.unload()
+            for package_id in truck_state.package_ids:
+                truck.add_package(self._packages_by_id[package_id])
+            truck.previous_location = truck_state.previous_location
+            truck.current_location = truck_state.current_location
+            truck.next_location = truck_state.next_location
+            truck.current_run = truck_state.current_run
+            truck.route_runs[:] = truck_state.route_runs
+            truck.set_clock(TimeConversion.get_time(checkpoint.seconds))
+            if truck.current_run is not None:
+                trucks.add(truck)
+        return trucks
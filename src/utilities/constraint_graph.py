@@ -0,0 +1,225 @@
+from datetime import time
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from src import config
+from src.models.address_index import AddressIndex
+from src.models.location import Location
+from src.models.package import Package
+
+__all__ = ['ConstraintGraph']
+
+
+def _get_bundle_groups(packages: Tuple[Package]) -> Dict[Location, FrozenSet[Location]]:
+    """
+    Groups the locations whose packages must be delivered together by the same truck.
+
+    Args:
+        packages (Tuple[Package]): All packages.
+
+    Returns:
+        Dict[Location, FrozenSet[Location]]: The bundle group of every bundled location, keyed by location.
+
+    Time Complexity: O(n * m)
+    Space Complexity: O(n)
+    """
+
+    bundle_groups = dict()
+    for package in packages:
+        if not package.bundled_package_set:
+            continue
+        group = {package.location}.union([bundle_package.location for bundle_package in package.bundled_package_set])
+        for location in group:
+            group.update(bundle_groups.get(location, frozenset()))
+        group = frozenset(group)
+        for location in group:
+            bundle_groups[location] = group
+    return bundle_groups
+
+
+class ConstraintGraph:
+    """
+    An immutable graph of the delivery constraints, compiled once from the ingested locations and packages.
+
+    Every constraint is keyed by location, so planner checks read it with a single lookup instead of scanning the
+        packages again. Constraints that change while planning, such as which locations have been assigned, are left
+        to the caller.
+
+    Attributes:
+        bundle_locations (FrozenSet[Location]): Locations with packages that must be delivered together.
+        bundle_packages (FrozenSet[Package]): Packages that must be delivered together.
+        delayed_locations (FrozenSet[Location]): Locations with packages arriving at the hub after dispatch.
+        unconfirmed_locations (FrozenSet[Location]): Locations with packages awaiting an address update.
+        latest_delayed_arrival (time): The latest hub arrival time of a delayed package, or None.
+    """
+
+    def __init__(self, locations: Tuple[Location], packages: Tuple[Package], address_index: AddressIndex = None):
+        """
+        Compiles the constraint graph.
+
+        Args:
+            locations (Tuple[Location]): All locations.
+            packages (Tuple[Package]): All packages.
+            address_index (AddressIndex, optional): The address index of the locations. Defaults to None (an index
+                is built from the locations).
+
+        Time Complexity: O(n * m)
+        Space Complexity: O(n + m)
+        """
+
+        truck_pins = dict()
+        release_times = dict()
+        deadlines = dict()
+        address_updates = dict()
+        delayed_arrivals = []
+        address_index = AddressIndex(locations) if address_index is None else address_index
+        for package in packages:
+            location = package.location
+            if package.assigned_truck_id:
+                truck_pins[location] = package.assigned_truck_id
+            if not release_times.get(location) or package.hub_arrival_time > release_times[location]:
+                release_times[location] = package.hub_arrival_time
+            if not deadlines.get(location) or package.deadline < deadlines[location]:
+                deadlines[location] = package.deadline
+            if package.hub_arrival_time > config.DELIVERY_DISPATCH_TIME:
+                delayed_arrivals.append((package.hub_arrival_time, location))
+            if not package.is_verified_address and package.package_id in config.EXCEPTED_UPDATES:
+                update = config.EXCEPTED_UPDATES[package.package_id]
+                updated_location = address_index.find_address(update['address'])
+                if not address_updates.get(location) or update['update_time'] > address_updates[location][0]:
+                    address_updates[location] = (update['update_time'], updated_location)
+        bundle_groups = _get_bundle_groups(packages)
+        self._bundle_groups = MappingProxyType(bundle_groups)
+        self._truck_pins = MappingProxyType(truck_pins)
+        truck_pinned_locations = dict()
+        for location, truck_id in truck_pins.items():
+            truck_pinned_locations.setdefault(truck_id, set()).add(location)
+        self._pinned_locations = frozenset(truck_pins.keys())
+        self._truck_pinned_locations = MappingProxyType({truck_id: frozenset(pinned_locations) for
+                                                         truck_id, pinned_locations in truck_pinned_locations.items()})
+        self._release_times = MappingProxyType(release_times)
+        self._deadlines = MappingProxyType(deadlines)
+        self._address_updates = MappingProxyType(address_updates)
+        self.bundle_locations = frozenset(bundle_groups.keys())
+        self.bundle_packages = frozenset([package for package in packages if package.bundled_package_set])
+        self.delayed_locations = frozenset([location for _, location in delayed_arrivals])
+        self.unconfirmed_locations = frozenset([package.location for package in packages
+                                                if not package.is_verified_address])
+        self.latest_delayed_arrival = max([arrival for arrival, _ in delayed_arrivals]) if delayed_arrivals else None
+
+    def __setattr__(self, name, value):
+        """
+        Prevents the constraint graph from being changed once it has been compiled.
+
+        Args:
+            name (str): The name of the attribute.
+            value: The value of the attribute.
+
+        Raises:
+            AttributeError: If the attribute has already been set.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if name in self.__dict__:
+            raise AttributeError(f'{type(self).__name__}.{name} cannot be changed')
+        super().__setattr__(name, value)
+
+    def get_bundle_group(self, location: Location) -> FrozenSet[Location]:
+        """
+        Retrieves the locations that must be delivered by the same truck as the location.
+
+        Args:
+            location (Location): The location to look up.
+
+        Returns:
+            FrozenSet[Location]: The bundle group including the location, or an empty set if it is not bundled.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._bundle_groups.get(location, frozenset())
+
+    def get_truck_pin(self, location: Location) -> Optional[int]:
+        """
+        Retrieves the truck that packages at the location are restricted to.
+
+        Args:
+            location (Location): The location to look up.
+
+        Returns:
+            int: The truck ID, or None if the location is not restricted to a truck.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._truck_pins.get(location)
+
+    def get_pinned_locations(self, truck_id: int = None) -> FrozenSet[Location]:
+        """
+        Retrieves the locations restricted to a truck.
+
+        Args:
+            truck_id (int, optional): The truck ID to filter by. Defaults to None (every truck).
+
+        Returns:
+            FrozenSet[Location]: The restricted locations.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if not truck_id:
+            return self._pinned_locations
+        return self._truck_pinned_locations.get(truck_id, frozenset())
+
+    def get_release_time(self, location: Location) -> Optional[time]:
+        """
+        Retrieves the time the last package for the location arrives at the hub.
+
+        Args:
+            location (Location): The location to look up.
+
+        Returns:
+            time: The release time, or None if the location has no packages.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._release_times.get(location)
+
+    def get_deadline(self, location: Location) -> Optional[time]:
+        """
+        Retrieves the earliest delivery deadline of the packages at the location.
+
+        Args:
+            location (Location): The location to look up.
+
+        Returns:
+            time: The deadline, or None if the location has no packages.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._deadlines.get(location)
+
+    def get_address_update(self, location: Location) -> Optional[Tuple[time, Location]]:
+        """
+        Retrieves the expected address update of the packages at the location.
+
+        Args:
+            location (Location): The location to look up.
+
+        Returns:
+            Tuple[time, Location]: The update time and the corrected location, or None if no update is expected.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._address_updates.get(location)
@@ -2,15 +2,15 @@ import csv
 import re
 from copy import copy
 from datetime import datetime, time
-from typing import List, Set, Tuple
+from typing import Iterable, List, Set, Tuple
 
 from src import config
 from src.constants.delivery_status import DeliveryStatus
 from src.constants.utah_cities import UtahCity
+from src.models.address_index import AddressIndex
 from src.models.location import Location
 from src.models.package import Package
 from src.models.truck import Truck
-from src.utilities.time_conversion import TimeConversion
 
 __all__ = ['CsvParser']
 
@@ -73,9 +73,7 @@ def _set_earliest_location_deadline(location: Location, in_deadline_time: time):
     Space Complexity: O(1)
     """
 
-    current_location_deadline = TimeConversion.get_datetime(location.earliest_deadline)
-    in_deadline = TimeConversion.get_datetime(in_deadline_time)
-    if in_deadline < current_location_deadline:
+    if in_deadline_time < location.earliest_deadline:
         location.earliest_deadline = in_deadline_time
 
 
@@ -93,11 +91,8 @@ def _set_latest_location_package_arrival(location: Location, in_arrival_time: ti
 
     if not location.latest_package_arrival:
         location.latest_package_arrival = in_arrival_time
-    else:
-        current_latest_location_arrival = TimeConversion.get_datetime(location.latest_package_arrival)
-        in_arrival = TimeConversion.get_datetime(in_arrival_time)
-        if in_arrival > current_latest_location_arrival:
-            location.latest_package_arrival = in_arrival_time
+    elif in_arrival_time > location.latest_package_arrival:
+        location.latest_package_arrival = in_arrival_time
 
 
 def _set_bundled_packages_ids(package: Package):
@@ -295,6 +290,7 @@ class CsvParser:
         """
 
         packages = []
+        address_index = AddressIndex(locations)
         with open(filepath, newline='') as csv_file:
             reader = csv.DictReader(csv_file)
             for row in reader:
@@ -303,23 +299,19 @@ class CsvParser:
                 address: str = row['Address'].strip()
                 city = UtahCity[row['City'].replace(' ', '_').upper()]
                 zip_code = int(row['Zip'].strip())
-                package_location = None
-                for location in locations:
-                    if location.address == address and location.zip_code == zip_code:
-                        package_location = location
-                        package_location.city = city
-                        if not location.state:
-                            location.state = package_location.city.state
-                        break
+                package_location = address_index.find(address, zip_code, is_prefix_match=False)
                 if not package_location:
                     raise ImportError
+                package_location.city = city
+                if not package_location.state:
+                    package_location.state = package_location.city.state
                 deadline = config.DELIVERY_RETURN_TIME if row['Delivery Deadline'] == 'EOD' else \
                     datetime.strptime(row['Delivery Deadline'], '%I:%M:%S %p').time()
                 weight = int(row['Mass KILO'])
                 special_note = row['Special Notes']
                 is_verified_address = not special_note.startswith('Wrong address')
                 if not is_verified_address:
-                    location.has_unconfirmed_package = True
+                    package_location.has_unconfirmed_package = True
                 package = Package(package_id=package_id, location=package_location,
                                   is_verified_address=is_verified_address, deadline=deadline,
                                   weight=weight, special_note=special_note)
@@ -332,3 +324,51 @@ class CsvParser:
                 package.location.package_set.add(package)
             _set_bundled_packages(packages)
         return tuple(packages)
+
+    @staticmethod
+    def initialize_carryover_packages(packages: Iterable[Package], first_package_id: int,
+                                      address_index: AddressIndex) -> Tuple[Package]:
+        """
+        Initializes the packages carried over from a previous day. Each package is renumbered from the first package
+            ID so it does not clash with the packages of the new day, and is waiting at the hub from the standard
+            arrival time. Bundles are not carried over, as they refer to the package IDs of the previous day. A package
+            still awaiting its expected address update is carried over to its updated address, as the update is keyed
+            by its previous package ID.
+
+        Args:
+            packages (Iterable[Package]): The undelivered packages of the previous day.
+            first_package_id (int): The package ID of the first carried over package.
+            address_index (AddressIndex): The address index of the locations, used to find updated addresses.
+
+        Returns:
+            Tuple[Package]: The carried over packages, in order of their previous package ID.
+
+        Time Complexity: O(n log n)
+        Space Complexity: O(n)
+        """
+
+        carryover_packages = []
+        for package_id, previous_package in enumerate(sorted(packages, key=lambda _package: _package.package_id),
+                                                      start=first_package_id):
+            location = previous_package.location
+            is_verified_address = previous_package.is_verified_address
+            special_note = previous_package.special_note
+            if not is_verified_address and previous_package.package_id in config.EXCEPTED_UPDATES:
+                updated_location = address_index.find_address(
+                    config.EXCEPTED_UPDATES[previous_package.package_id]['address'])
+                if updated_location:
+                    location, is_verified_address = updated_location, True
+                    special_note = '\u001b[9m' + special_note + '\033[0m'
+            package = Package(package_id=package_id, location=location, is_verified_address=is_verified_address,
+                              deadline=previous_package.deadline, weight=previous_package.weight,
+                              special_note=special_note)
+            if not package.is_verified_address:
+                package.location.has_unconfirmed_package = True
+            package.hub_arrival_time = config.STANDARD_PACKAGE_ARRIVAL_TIME
+            package.update_status(DeliveryStatus.AT_HUB, config.STANDARD_PACKAGE_ARRIVAL_TIME)
+            _set_earliest_location_deadline(package.location, package.deadline)
+            _set_latest_location_package_arrival(package.location, package.hub_arrival_time)
+            _set_assigned_truck(package)
+            carryover_packages.append(package)
+            package.location.package_set.add(package)
+        return tuple(carryover_packages)
@@ -1,4 +1,4 @@
-from typing import final
+from typing import Iterable, Iterator, List, Optional, final
 
 from src import config
 from src.constants.delivery_status import DeliveryStatus
@@ -6,23 +6,58 @@ from src.models.package import Package
 
 __all__ = ['CustomHash']
 
+_MIN_CAPACITY = 8
+_MAX_LOAD_FACTOR = 0.66
+_EMPTY = None
+_DELETED = object()
+
+
+def _get_table_capacity(size: int) -> int:
+    """
+    Gets the smallest power of two table capacity that holds a number of packages within the maximum load factor.
+
+    Args:
+        size (int): The number of packages.
+
+    Returns:
+        int: The table capacity.
+
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+    """
+
+    capacity = _MIN_CAPACITY
+    while size > capacity * _MAX_LOAD_FACTOR:
+        capacity *= 2
+    return capacity
+
 
 class CustomHash:
+    """
+    A hash table of packages keyed by package ID, using open addressing with linear probing.
+
+    Package IDs and packages are kept in parallel slot lists whose capacity is a power of two, so a package ID's home
+        slot is its hash masked to the capacity. Removed packages leave a deleted marker so later probes continue past
+        them. The table doubles in capacity, dropping the deleted markers, whenever the occupied slots pass the maximum
+        load factor, so lookups stay O(1) however many packages are added.
+    """
 
     def __init__(self, capacity: int):
         """
-        Initializes a CustomHash object with the given capacity.
+        Initializes a CustomHash object with room for the given number of packages.
 
         Args:
-            capacity (int): The capacity of the CustomHash.
+            capacity (int): The number of packages the CustomHash holds before it resizes.
 
         Time Complexity: O(n)
         Space Complexity: O(n)
         """
 
-        self._capacity = capacity
-        self._arr: list = [[] for _ in range(capacity)]
+        self._capacity = _get_table_capacity(capacity)
+        self._keys: list = [_EMPTY] * self._capacity
+        self._values: list = [_EMPTY] * self._capacity
         self._size = 0
+        self._occupied = 0
 
     def __len__(self):
         """
@@ -45,8 +80,92 @@ class CustomHash:
         Space Complexity: O(1)
         """
 
-        index = hash(package) % self._capacity
-        return package in self._arr[index]
+        return self._locate_package(package.package_id) != -1
+
+    def __iter__(self) -> Iterator[Package]:
+        """
+        Iterates over the packages in the CustomHash, in slot order. The CustomHash must not be changed while it is
+            iterated.
+
+        Returns:
+            Iterator[Package]: The packages.
+
+        Time Complexity: O(c), where c is the capacity of the table.
+        Space Complexity: O(1)
+        """
+
+        return (package for key, package in zip(self._keys, self._values) if key is not _EMPTY and key is not _DELETED)
+
+    def _resize(self, capacity: int):
+        """
+        Moves every package into new slot lists of the given capacity, dropping the deleted markers.
+
+        Args:
+            capacity (int): The new capacity, a power of two.
+
+        Time Complexity: O(n + c)
+        Space Complexity: O(c)
+        """
+
+        packages = list(self)
+        self._capacity = capacity
+        self._keys = [_EMPTY] * capacity
+        self._values = [_EMPTY] * capacity
+        self._size = 0
+        self._occupied = 0
+        for package in packages:
+            self._insert(package)
+
+    def _reserve(self, count: int):
+        """
+        Resizes the table if needed, so the given number of packages can be inserted without passing the maximum
+            load factor.
+
+        Args:
+            count (int): The number of packages to be inserted.
+
+        Time Complexity: O(1), or O(n + c) when the table is resized.
+        Space Complexity: O(1), or O(c) when the table is resized.
+        """
+
+        if self._occupied + count > self._capacity * _MAX_LOAD_FACTOR:
+            self._resize(_get_table_capacity(self._size + count))
+
+    def _insert(self, package: Package) -> bool:
+        """
+        Inserts a package into the first free slot of its probe sequence, unless a package with its ID is present.
+            The table must have room for it.
+
+        Args:
+            package (Package): The package to insert.
+
+        Returns:
+            bool: True if the package was inserted, False if a package with its ID is present.
+
+        Time Complexity: O(1) expected
+        Space Complexity: O(1)
+        """
+
+        keys = self._keys
+        mask = self._capacity - 1
+        package_id = package.package_id
+        index = hash(package_id) & mask
+        free_index = -1
+        key = keys[index]
+        while key is not _EMPTY:
+            if key == package_id:
+                return False
+            if key is _DELETED and free_index == -1:
+                free_index = index
+            index = (index + 1) & mask
+            key = keys[index]
+        if free_index == -1:
+            free_index = index
+            self._occupied += 1
+        keys[free_index] = package_id
+        self._values[free_index] = package
+        self._size += 1
+        return True
 
     def add_package(self, package: Package):
         """
@@ -55,15 +174,33 @@ class CustomHash:
         Args:
             package (Package): The package to add.
 
-        Time Complexity: O(n)
-        Space Complexity: O(1)
+        Returns:
+            bool: True if the package was added, False if a package with its ID is present.
+
+        Time Complexity: O(1) amortized
+        Space Complexity: O(1) amortized
+        """
+
+        self._reserve(1)
+        return self._insert(package)
+
+    def add_packages(self, packages: Iterable[Package]) -> int:
+        """
+        Adds the given packages to the CustomHash, resizing the table at most once.
+
+        Args:
+            packages (Iterable[Package]): The packages to add.
+
+        Returns:
+            int: The number of packages added.
+
+        Time Complexity: O(p), where p is the number of packages to add.
+        Space Complexity: O(p)
         """
 
-        if self._locate_package(package_id=package.package_id) == -1:
-            self._arr[package.package_id % self._capacity].append(package)
-            self._size += 1
-            return True
-        return False
+        packages = list(packages)
+        self._reserve(len(packages))
+        return sum([self._insert(package) for package in packages])
 
     def get_package(self, package_id: int) -> Package:
         """
@@ -72,13 +209,32 @@ class CustomHash:
         Args:
             package_id (int): The ID of the package to retrieve.
 
-        Time Complexity: O(n)
+        Returns:
+            Package: The package, or None if it is not present.
+
+        Time Complexity: O(1)
         Space Complexity: O(1)
         """
 
         index = self._locate_package(package_id)
         if index != -1:
-            return self._arr[package_id % self._capacity][index]
+            return self._values[index]
+
+    def get_packages(self, package_ids: Iterable[int]) -> List[Optional[Package]]:
+        """
+        Retrieves the packages with the given package IDs from the CustomHash.
+
+        Args:
+            package_ids (Iterable[int]): The IDs of the packages to retrieve.
+
+        Returns:
+            List[Package]: The packages in the order of their IDs, with None for each package that is not present.
+
+        Time Complexity: O(p)
+        Space Complexity: O(p)
+        """
+
+        return [self.get_package(package_id) for package_id in package_ids]
 
     def remove_package(self, package_id: int):
         """
@@ -87,27 +243,49 @@ class CustomHash:
         Args:
             package_id (int): The ID of the package to remove.
 
-        Time Complexity: O(n)
+        Returns:
+            bool: True if the package was removed, False if it is not present.
+
+        Time Complexity: O(1)
         Space Complexity: O(1)
         """
 
         index = self._locate_package(package_id)
         if index == -1:
             return False
-        del self._arr[package_id % self._capacity][index]
+        self._keys[index] = _DELETED
+        self._values[index] = _EMPTY
         self._size -= 1
         return True
 
+    def remove_packages(self, package_ids: Iterable[int]) -> int:
+        """
+        Removes the packages with the given package IDs from the CustomHash.
+
+        Args:
+            package_ids (Iterable[int]): The IDs of the packages to remove.
+
+        Returns:
+            int: The number of packages removed.
+
+        Time Complexity: O(p)
+        Space Complexity: O(p)
+        """
+
+        return sum([self.remove_package(package_id) for package_id in package_ids])
+
     def clear(self):
         """
-        Clears all packages from the CustomHash.
+        Clears all packages from the CustomHash, keeping its capacity.
 
-        Time Complexity: O(n)
-        Space Complexity: O(n)
+        Time Complexity: O(c)
+        Space Complexity: O(c)
         """
 
-        self._arr = [[] for _ in range(self._capacity)]
+        self._keys = [_EMPTY] * self._capacity
+        self._values = [_EMPTY] * self._capacity
         self._size = 0
+        self._occupied = 0
 
     @final
     def add_all_packages(self, packages):
@@ -122,6 +300,8 @@ class CustomHash:
         """
 
         standard_arrival_time = config.STANDARD_PACKAGE_ARRIVAL_TIME
+        packages = list(packages)
+        self._reserve(len(packages))
         for package in packages:
             if not package.special_note.startswith('Delayed'):
                 package.update_status(DeliveryStatus.AT_HUB, standard_arrival_time)
@@ -129,16 +309,25 @@ class CustomHash:
 
     def _locate_package(self, package_id: int) -> int:
         """
-        Locates the index of the package with the given package_id in the CustomHash.
+        Locates the slot of the package with the given package_id in the CustomHash.
 
         Args:
             package_id (int): The ID of the package to locate.
 
-        Time Complexity: O(n)
+        Returns:
+            int: The index of the slot, or -1 if the package is not present.
+
+        Time Complexity: O(1) expected
         Space Complexity: O(1)
         """
 
-        for i, package in enumerate(self._arr[package_id % self._capacity]):
-            if package.package_id == package_id:
-                return i
+        keys = self._keys
+        mask = self._capacity - 1
+        index = hash(package_id) & mask
+        key = keys[index]
+        while key is not _EMPTY:
+            if key == package_id:
+                return index
+            index = (index + 1) & mask
+            key = keys[index]
         return -1
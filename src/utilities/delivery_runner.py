@@ -1,43 +1,82 @@
+import asyncio
+import heapq
 import random
 from copy import copy
 from datetime import time
-from typing import List, Set
+from functools import wraps
+from typing import Iterable, List, Optional, Set
 
 from src import config
 from src.constants.color import Color
+from src.constants.delivery_event import DeliveryEvent
 from src.constants.delivery_status import DeliveryStatus
 from src.constants.run_info import RunInfo
-from src.exceptions import AddressUpdateException, DelayedPackagesArrivedException
+from src.exceptions import DelayedPackagesArrivedException, ReplanningError
+from src.models.checkpoint import Checkpoint, TruckState
 from src.models.package import Package
 from src.models.route_run import RouteRun
+from src.models.simulation_result import SimulationResult
 from src.models.truck import Truck
 from src.ui import UI
+from src.utilities.anytime_planner import AnytimePlanner
+from src.utilities.checkpoint_recorder import CheckpointRecorder
+from src.utilities.driver_scheduler import DriverScheduler
+from src.utilities.event_store import EventStore
+from src.utilities.fleet_registry import FleetRegistry
 from src.utilities.package_handler import PackageHandler
+from src.utilities.replanner import IncrementalReplanner
 from src.utilities.route_builder import RouteBuilder
 from src.utilities.time_conversion import TimeConversion
+from src.utilities.virtual_clock import Broadcast, VirtualClock
 
 
-def _display_package_load_message(truck: Truck, run: RouteRun, package_id: int):
+def _skip_when_headless(display_function):
     """
-    Displays the message when a package is loaded onto a truck.
+    Decorates a display function so that it does nothing, not even build its message, in a headless simulation.
 
     Args:
-        truck (Truck): The truck onto which the package is loaded.
-        run (RouteRun): The current route run.
-        package_id (int): The ID of the package being loaded.
+        display_function (Callable): The display function.
 
-    Time Complexity: O(n)
+    Returns:
+        Callable: The decorated display function.
+
+    Time Complexity: O(1)
     Space Complexity: O(1)
     """
 
-    package = truck.get_package(package_id)
-    UI.print(f'{truck.clock} | Package #{str(package_id).zfill(2)} | Destination: "{package.location.name}" | Loaded '
-             f'successfully onto Truck #{truck.truck_id} | '
-             f'Packages currently loaded: {len(truck)} / {config.NUM_TRUCK_CAPACITY}' +
-             ('\n** WILL NOT BE DELIVERED UNTIL AFTER RELOADING BUT IS REQUIRED TO BE CARRIED **'
-              if package.location not in run.ordered_route else ''), sleep_seconds=2, color=Color.YELLOW)
+    @wraps(display_function)
+    def display_unless_headless(*args, **kwargs):
+        if not config.HEADLESS_SIMULATION_ENABLED:
+            display_function(*args, **kwargs)
 
+    return display_unless_headless
 
+
+@_skip_when_headless
+def _display_packages_load_message(truck: Truck, run: RouteRun, packages: List[Package], load_seconds: int):
+    """
+    Displays the message when a batch of packages is loaded onto a truck.
+
+    Args:
+        truck (Truck): The truck onto which the packages are loaded.
+        run (RouteRun): The current route run.
+        packages (List[Package]): The packages loaded, in order of package ID.
+        load_seconds (int): The time taken to load the packages in seconds.
+
+    Time Complexity: O(p * l), where p is the number of packages loaded.
+    Space Complexity: O(p)
+    """
+
+    carried_package_ids = [str(package.package_id).zfill(2) for package in packages
+                           if package.location not in run.ordered_route]
+    UI.print(f'{truck.clock} | Truck #{truck.truck_id} | Packages '
+             f'{", ".join(["#" + str(package.package_id).zfill(2) for package in packages])} | Loaded successfully '
+             f'in {load_seconds} seconds | Packages currently loaded: {len(truck)} / {config.NUM_TRUCK_CAPACITY}' +
+             (f'\n** PACKAGES #{", #".join(carried_package_ids)} WILL NOT BE DELIVERED UNTIL AFTER RELOADING BUT ARE '
+              f'REQUIRED TO BE CARRIED **' if carried_package_ids else ''), sleep_seconds=2, color=Color.YELLOW)
+
+
+@_skip_when_headless
 def _display_awaiting_package_message(truck: Truck, package: Package):
     """
     Displays the message when a truck is awaiting a package to arrive at the hub.
@@ -54,6 +93,41 @@ def _display_awaiting_package_message(truck: Truck, package: Package):
              sleep_seconds=2, color=Color.RED)
 
 
+@_skip_when_headless
+def _display_incumbent_plan_message(trucks: Set[Truck], total_mileage: float, completion_time: time):
+    """
+    Displays the message when the anytime planner finds an improved route plan.
+
+    Args:
+        trucks (Set[Truck]): The trucks of the improved plan.
+        total_mileage (float): The total estimated mileage of the plan.
+        completion_time (time): The estimated completion time of the plan.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+
+    UI.print(f'Route plan found | {len([run for truck in trucks for run in truck.route_runs])} runs |'
+             f' Total mileage: {total_mileage:.1f} | Completion time: {completion_time}', color=Color.GREEN)
+
+
+@_skip_when_headless
+def _display_driver_report(fleet: FleetRegistry, runs: List[RouteRun]):
+    """
+    Displays the driver shifts assigned by the fleet over its runs.
+
+    Args:
+        fleet (FleetRegistry): The trucks of the day, with their assigned driver shifts.
+        runs (List[RouteRun]): The planned route runs.
+
+    Time Complexity: O(r^3), where r is the number of runs.
+    Space Complexity: O(r)
+    """
+
+    DriverScheduler.display_report(runs, fleet.number_of_drivers, fleet.driver_schedule)
+
+
+@_skip_when_headless
 def _display_initial_truck_loading_message():
     """
     Displays the message indicating the commencement of truck loading.
@@ -66,6 +140,7 @@ def _display_initial_truck_loading_message():
              think=True, color=Color.YELLOW)
 
 
+@_skip_when_headless
 def _display_next_location(truck: Truck):
     """
     Displays the message indicating the truck's departure to the next location.
@@ -82,6 +157,7 @@ def _display_next_location(truck: Truck):
              think=True)
 
 
+@_skip_when_headless
 def _display_delivery_info(truck: Truck, delivered_packages: Set[Package]):
     """
     Displays the delivery information for a truck.
@@ -102,9 +178,10 @@ def _display_delivery_info(truck: Truck, delivered_packages: Set[Package]):
              f' "{truck.current_location.name}" | {len(delivered_packages)} delivered, '
              f'{analysis_dict[RunInfo.UNDELIVERED_PACKAGES_TOTAL]} remaining on truck | '
              f'{(len(total_undelivered))} / {len(PackageHandler.all_packages)} total remaining',
-             sleep_seconds=3, color=UI.ASSIGNED_COLOR[truck.truck_id])
+             sleep_seconds=3, color=UI.get_assigned_color(truck.truck_id))
 
 
+@_skip_when_headless
 def _display_reload_info(truck: Truck):
     """
     Displays information about the truck's arrival at a location for reload.
@@ -121,6 +198,7 @@ def _display_reload_info(truck: Truck):
              sleep_seconds=4, color=Color.MAGENTA)
 
 
+@_skip_when_headless
 def _display_route_completion(truck: Truck):
     """
     Displays information about the completion of the truck's route.
@@ -135,39 +213,45 @@ def _display_route_completion(truck: Truck):
     UI.print(f'{truck.clock} | Truck #{truck.truck_id} arrived at {truck.current_location.name} for final delivery |'
              f' {len(truck.current_location.package_set)} total delivered | Route completed successfully ! |'
              f' Total Run Mileage: {truck.current_run.estimated_mileage:.1f}',
-             sleep_seconds=4, color=UI.ASSIGNED_COLOR[truck.truck_id])
+             sleep_seconds=4, color=UI.get_assigned_color(truck.truck_id))
 
 
-def _reload_for_next_run(truck: Truck, run: RouteRun, fast_reload=False):
+def _reload_for_next_run(truck: Truck, run: RouteRun, fast_reload=False) -> int:
     """
-    Reloads the truck for the next run.
+    Reloads the truck for the next run. The required packages at the hub that are not on the truck are found with one
+        set difference and loaded in one batch at the truck's current time, taking a random time per package that the
+        truck spends at the hub before departing.
 
     Args:
         truck (Truck): The truck to reload.
         run (RouteRun): The current route run.
         fast_reload (bool): Flag indicating whether to perform a fast reload (without simulated loading time).
+            Headless simulations always reload fast.
 
-    Time Complexity: O(n^2)
+    Returns:
+        int: The time taken to load the packages in seconds, 0 for a fast reload.
+
+    Time Complexity: O(n log n + c), where c is the capacity of the truck.
     Space Complexity: O(n)
     """
 
-    for package in sorted(list(run.required_packages), key=lambda _package: _package.package_id):
-        if truck.is_package_on_truck(package):
-            continue
-        if package.status is DeliveryStatus.AT_HUB:
-            truck.add_package(package, False)
-            if not fast_reload:
-                DeliveryRunner.global_clock = TimeConversion.increment_time(
-                    DeliveryRunner.global_clock, random.randint(package.weight,
-                                                                config.PACKAGE_LOAD_SPEED_MAX_SECONDS))
-                truck.set_clock(DeliveryRunner.global_clock)
-            _display_package_load_message(truck, run, package.package_id)
+    packages = sorted([package for package in set(run.required_packages).difference(truck)
+                       if package.status is DeliveryStatus.AT_HUB], key=lambda _package: _package.package_id)
+    load_seconds = 0
+    if not fast_reload and not config.HEADLESS_SIMULATION_ENABLED:
+        load_seconds = sum([random.randint(min(package.weight, config.PACKAGE_LOAD_SPEED_MAX_SECONDS),
+                                           config.PACKAGE_LOAD_SPEED_MAX_SECONDS) for package in packages])
+    truck.add_packages(packages, False)
+    if packages:
+        _display_packages_load_message(truck, run, packages, load_seconds)
     unloaded_packages = set([package for package in run.required_packages
                              if package.status == DeliveryStatus.ON_ROUTE_TO_DEPOT])
     for package in unloaded_packages:
         _display_awaiting_package_message(truck, package)
+    return load_seconds
 
 
+@_skip_when_headless
 def _display_address_update_message(address_update_message: str):
     """
     Displays a message for an address update.
@@ -182,6 +266,39 @@ def _display_address_update_message(address_update_message: str):
     UI.print(f'{DeliveryRunner.global_clock} | {address_update_message}', color=Color.RED, sleep_seconds=3)
 
 
+@_skip_when_headless
+def _display_replanning_error_message(replanning_error: ReplanningError):
+    """
+    Displays a message indicating that a route run could not be re-planned after a disruption.
+
+    Args:
+        replanning_error (ReplanningError): The re-planning error.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    UI.print(f'{DeliveryRunner.global_clock} | {replanning_error}', color=Color.RED, sleep_seconds=3)
+
+
+@_skip_when_headless
+def _display_replanned_run_message(run: RouteRun):
+    """
+    Displays a message indicating that a route run has been re-planned after a disruption.
+
+    Args:
+        run (RouteRun): The re-planned route run.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+
+    UI.print(f'{DeliveryRunner.global_clock} | Truck #{run.assigned_truck_id} route re-planned | Remaining stops: '
+             f'{", ".join([location.name for location in run.ordered_route])} | Estimated completion time: '
+             f'{run.estimated_completion_time}', color=Color.YELLOW, sleep_seconds=3)
+
+
+@_skip_when_headless
 def _display_delayed_packages_arrival_message():
     """
     Displays a message indicating that delayed packages have arrived and are available to be loaded.
@@ -194,6 +311,7 @@ def _display_delayed_packages_arrival_message():
              color=Color.GREEN, sleep_seconds=3)
 
 
+@_skip_when_headless
 def _display_returned_to_visited_location_message(truck: Truck):
     """
     Displays a message indicating that the truck has returned to a visited location for mileage optimization.
@@ -209,6 +327,7 @@ def _display_returned_to_visited_location_message(truck: Truck):
              f' for mileage optimization purposes | No packages delivered', think=True, color=Color.BLUE)
 
 
+@_skip_when_headless
 def _display_starting_route_message(truck: Truck):
     """
     Displays a message indicating that a truck is beginning its route.
@@ -216,16 +335,16 @@ def _display_starting_route_message(truck: Truck):
     Args:
         truck (Truck): The truck that is beginning its route.
 
-    Time Complexity: O(n)
+    Time Complexity: O(1)
     Space Complexity: O(1)
     """
 
     UI.print(f'{truck.clock} | Truck #{truck.truck_id} beginning route',
-             think=True, color=UI.ASSIGNED_COLOR[truck.truck_id])
-    truck.dispatch()
+             think=True, color=UI.get_assigned_color(truck.truck_id))
     _display_next_location(truck)
 
 
+@_skip_when_headless
 def _display_deliveries_commencing_message(start_time: time):
     """
     Displays a message indicating that deliveries are commencing.
@@ -259,6 +378,52 @@ def _get_important_status_update_times():
     return important_update_times
 
 
+def _is_event_store_enabled() -> bool:
+    """
+    Checks if plans and status events are saved to the event store, which is skipped for headless simulations.
+
+    Returns:
+        bool: True if the event store is enabled in config and the simulation is not headless, False otherwise.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    return config.EVENT_STORE_ENABLED and not config.HEADLESS_SIMULATION_ENABLED
+
+
+def _save_plan(runs: Iterable[RouteRun]):
+    """
+    Saves the plan of the day to the event store, unless disabled.
+
+    Args:
+        runs (Iterable[RouteRun]): The route runs of the plan, with their full routes.
+
+    Time Complexity: O(r log r + r * l)
+    Space Complexity: O(r)
+    """
+
+    if not _is_event_store_enabled():
+        return
+    with EventStore(config.EVENT_STORE_FILE) as event_store:
+        DeliveryRunner.plan_id = event_store.save_plan(runs)
+
+
+def _save_events():
+    """
+    Saves the status events of the deliveries to the event store under the plan of the day, unless disabled.
+
+    Time Complexity: O(e log e)
+    Space Complexity: O(1)
+    """
+
+    if not _is_event_store_enabled() or DeliveryRunner.plan_id is None:
+        return
+    with EventStore(config.EVENT_STORE_FILE) as event_store:
+        event_store.save_events(DeliveryRunner.plan_id, Package.event_log)
+
+
+@_skip_when_headless
 def _display_route_completion_message(completion_time):
     """
     Displays a message indicating the successful completion of all routes.
@@ -276,6 +441,388 @@ def _display_route_completion_message(completion_time):
              color=Color.BRIGHT_GREEN)
 
 
+def _get_seconds_at_next(truck: Truck) -> int:
+    """
+    Retrieves the estimated time the truck arrives at its next location.
+
+    Args:
+        truck (Truck): The truck on a route run.
+
+    Returns:
+        int: The estimated time of arrival at the next location in seconds since midnight.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    analysis_dict = truck.current_run.run_analysis_dict[(truck.previous_location, truck.current_location)]
+    return TimeConversion.get_seconds(analysis_dict[RunInfo.ESTIMATED_TIME_AT_NEXT])
+
+
+def _get_traveling_seconds(truck: Truck, start_seconds: int, current_seconds: int) -> int:
+    """
+    Retrieves the time of the next traveling message of a truck, which is displayed every
+        config.UI_TRAVELING_UPDATE_SECONDS divided by the truck ID from the start of the deliveries.
+
+    Args:
+        truck (Truck): The traveling truck.
+        start_seconds (int): The start time of the deliveries in seconds since midnight.
+        current_seconds (int): The earliest time of the message in seconds since midnight.
+
+    Returns:
+        int: The time of the message in seconds since midnight.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    interval = max(config.UI_TRAVELING_UPDATE_SECONDS // truck.truck_id, 1)
+    return current_seconds + (start_seconds - current_seconds) % interval
+
+
+def _is_awaiting_packages(run: RouteRun) -> bool:
+    """
+    Checks if a route run requires packages that have not yet arrived at the hub.
+
+    Args:
+        run (RouteRun): The route run.
+
+    Returns:
+        bool: True if a required package is on route to the hub, False otherwise.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+
+    return any(package.status is DeliveryStatus.ON_ROUTE_TO_DEPOT for package in run.required_packages)
+
+
+def _set_clocks(clock: VirtualClock, truck: Truck = None):
+    """
+    Sets the global clock and the truck's clock to the simulated time.
+
+    Args:
+        clock (VirtualClock): The simulation clock.
+        truck (Truck, optional): The truck that has woken up. Defaults to None.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    DeliveryRunner.global_clock = TimeConversion.get_time(clock.seconds)
+    if truck is not None:
+        truck.set_clock(DeliveryRunner.global_clock)
+
+
+async def _wait(clock: VirtualClock, wake_up: asyncio.Future, truck: Truck = None):
+    """
+    Waits for a scheduled wake-up on the clock, then sets the global clock and the truck's clock to the simulated time.
+
+    Args:
+        clock (VirtualClock): The simulation clock.
+        wake_up (asyncio.Future): The wake-up.
+        truck (Truck, optional): The waiting truck. Defaults to None.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    await clock.wait(wake_up)
+    _set_clocks(clock, truck)
+
+
+def _record_truck_state(clock: VirtualClock, truck: Truck, is_driving: bool):
+    """
+    Records a truck event for the checkpoints, unless checkpoints are disabled.
+
+    Args:
+        clock (VirtualClock): The simulation clock.
+        truck (Truck): The truck.
+        is_driving (bool): Flag indicating if the truck has departed on its current run.
+
+    Time Complexity: O(n log n + r^2)
+    Space Complexity: O(n)
+    """
+
+    if DeliveryRunner.checkpoints is not None:
+        DeliveryRunner.checkpoints.record_truck(clock.seconds, truck, is_driving)
+
+
+def _pop_next_run(truck: Truck) -> RouteRun:
+    """
+    Removes and returns the route run of a truck with the earliest start time. The truck's route runs are kept as a
+        heap ordered by start time once the deliveries start.
+
+    Args:
+        truck (Truck): The truck with route runs.
+
+    Returns:
+        RouteRun: The next route run.
+
+    Time Complexity: O(log r)
+    Space Complexity: O(1)
+    """
+
+    return heapq.heappop(truck.route_runs)
+
+
+def _start_first_run(truck: Truck, visited_locations: Set):
+    """
+    Assigns a truck its first route run.
+
+    Args:
+        truck (Truck): The truck with route runs.
+        visited_locations (Set[Location]): The locations visited by any truck.
+
+    Time Complexity: O(log r)
+    Space Complexity: O(1)
+    """
+
+    truck.current_run = _pop_next_run(truck)
+    truck.current_location = truck.current_run.ordered_route[0]
+    truck.next_location = truck.current_run.ordered_route[1]
+    visited_locations.add(truck.current_location)
+    del truck.current_run.ordered_route[0]
+
+
+def _handle_status_update() -> List[Exception]:
+    """
+    Applies the package transitions due at the current time, displaying each address update and the arrival of
+        delayed packages. Unless disabled in config, the route run that was going to deliver a package at its old
+        address is re-planned to deliver the package at its new address, as described in IncrementalReplanner.replan.
+
+    Returns:
+        List[Exception]: The batch of update events of PackageHandler.bulk_status_update, empty if nothing changed.
+
+    Time Complexity: O(d log q + a * (n^3 + k * n^4)), where d is the number of due transitions and a the number of
+        address updates.
+    Space Complexity: O(d)
+    """
+
+    status_updates = PackageHandler.bulk_status_update(DeliveryRunner.global_clock)
+    for status_update in status_updates:
+        if isinstance(status_update, DelayedPackagesArrivedException):
+            _display_delayed_packages_arrival_message()
+            continue
+        _display_address_update_message(status_update.message)
+        if config.INCREMENTAL_REPLANNING_ENABLED:
+            try:
+                for run in IncrementalReplanner.replan(DeliveryRunner.trucks, status_update.package,
+                                                       status_update.old_location):
+                    _display_replanned_run_message(run)
+            except ReplanningError as replanning_error:
+                _display_replanning_error_message(replanning_error)
+    return status_updates
+
+
+async def _update_statuses(clock: VirtualClock, update_seconds: Iterable[int]):
+    """
+    Updates the package statuses at each important status update time and broadcasts the batch of update events on
+        DeliveryRunner.status_updates, closing the broadcast after the last update.
+
+    Args:
+        clock (VirtualClock): The simulation clock.
+        update_seconds (Iterable[int]): The update times in seconds since midnight, in order.
+
+    Time Complexity: O(u + t log q), where u is the number of updates and t the number of transitions.
+    Space Complexity: O(1)
+    """
+
+    for seconds in update_seconds:
+        await _wait(clock, clock.schedule(seconds, DeliveryEvent.STATUS_UPDATE.value))
+        DeliveryRunner.status_updates.publish(_handle_status_update())
+    DeliveryRunner.status_updates.close()
+
+
+async def _take_checkpoints(clock: VirtualClock, visited_locations: Set, first_seconds: int):
+    """
+    Takes a checkpoint at every checkpoint interval until every truck has completed its route. Checkpoints are taken
+        after the other events at their time.
+
+    Args:
+        clock (VirtualClock): The simulation clock.
+        visited_locations (Set[Location]): The locations visited by any truck.
+        first_seconds (int): The earliest time of the first checkpoint in seconds since midnight.
+
+    Time Complexity: O(c * (n + r * l)), where c is the number of checkpoints.
+    Space Complexity: O(c * (n + r * l))
+    """
+
+    seconds = DeliveryRunner.checkpoints.get_next_seconds(first_seconds)
+    while DeliveryRunner.trucks:
+        await _wait(clock, clock.schedule(seconds, DeliveryEvent.CHECKPOINT.value))
+        if not DeliveryRunner.trucks:
+            break
+        DeliveryRunner.checkpoints.take(clock.seconds, visited_locations)
+        seconds += DeliveryRunner.checkpoints.interval_seconds
+
+
+def _get_packages_to_deliver(truck: Truck) -> Optional[List[Package]]:
+    """
+    Retrieves the packages a truck delivers at its current location when a package was re-routed there, since the
+        location's packages may then be spread over several trucks.
+
+    Args:
+        truck (Truck): The truck at the location.
+
+    Returns:
+        List[Package]: The packages at the location on the truck, or None to deliver every package at the location.
+
+    Time Complexity: O(n^2)
+    Space Complexity: O(n)
+    """
+
+    if not truck.current_location.has_rerouted_package:
+        return None
+    return [package for package in truck.current_location.package_set if truck.is_package_on_truck(package)]
+
+
+def _handle_arrival(truck: Truck, visited_locations: Set) -> int:
+    """
+    Moves a truck to its next location, then delivers its packages, reloads at the hub for the next route run, or
+        completes the truck's route.
+
+    Args:
+        truck (Truck): The arriving truck.
+        visited_locations (Set[Location]): The locations visited by any truck.
+
+    Returns:
+        int: The time taken to reload the truck in seconds, 0 if it did not reload.
+
+    Time Complexity: O(n^2)
+    Space Complexity: O(n)
+    """
+
+    run = truck.current_run
+    truck.previous_location = truck.current_location
+    truck.current_location = truck.next_location
+    del run.ordered_route[0]
+    if not run.ordered_route:
+        if not truck.route_runs:
+            truck.deliver(_get_packages_to_deliver(truck))
+            _display_route_completion(truck)
+            truck.current_run = None
+            truck.previous_location = None
+            truck.next_location = None
+            DeliveryRunner.trucks.discard(truck)
+        elif truck.current_location.is_hub:
+            truck.previous_location = None
+            _display_reload_info(truck)
+            truck.current_run = _pop_next_run(truck)
+            del truck.current_run.ordered_route[0]
+            truck.next_location = truck.current_run.ordered_route[0]
+            return _reload_for_next_run(truck, truck.current_run)
+        return 0
+
+    packages = _get_packages_to_deliver(truck)
+    if not truck.current_location.is_hub and truck.current_location in visited_locations and not packages:
+        _display_returned_to_visited_location_message(truck)
+    else:
+        visited_locations.add(truck.current_location)
+        delivered_packages = truck.deliver(packages)
+        _display_delivery_info(truck, delivered_packages)
+    truck.next_location = run.ordered_route[0]
+    _display_next_location(truck)
+    return 0
+
+
+async def _drive_run(clock: VirtualClock, truck: Truck, visited_locations: Set, start_seconds: int,
+                     is_resumed=False):
+    """
+    Dispatches a truck on its current route run and drives it from location to location until the run is complete,
+        displaying that the truck is traveling between arrivals unless the simulation is headless.
+
+    Args:
+        clock (VirtualClock): The simulation clock.
+        truck (Truck): The departing truck.
+        visited_locations (Set[Location]): The locations visited by any truck.
+        start_seconds (int): The start time of the deliveries in seconds since midnight.
+        is_resumed (bool): Flag indicating if the truck resumes a run it departed on before a checkpoint, so it is not
+            dispatched again.
+
+    Returns:
+        int: The time taken to reload the truck at the hub for its next route run in seconds, 0 if it did not reload.
+
+    Time Complexity: O(l * n^2 + w log w), where l is the number of locations on the run.
+    Space Complexity: O(n)
+    """
+
+    run = truck.current_run
+    load_seconds = 0
+    if not is_resumed:
+        truck.dispatch()
+        _display_starting_route_message(truck)
+        _record_truck_state(clock, truck, True)
+    arrival_seconds = _get_seconds_at_next(truck)
+    arrival = clock.schedule(arrival_seconds, DeliveryEvent.ARRIVAL.value)
+    traveling = None
+    if not config.HEADLESS_SIMULATION_ENABLED:
+        traveling_seconds = _get_traveling_seconds(truck, start_seconds, clock.seconds + 1)
+        traveling = clock.schedule(traveling_seconds, DeliveryEvent.TRAVELING.value)
+    while truck.current_run is run:
+        # Messages due at the second of an arrival are skipped, since the arrival has its own message.
+        if traveling is not None and traveling_seconds <= arrival_seconds:
+            await _wait(clock, traveling, truck)
+            if traveling_seconds != arrival_seconds:
+                UI.print(f'{truck.clock} | Truck #{truck.truck_id} traveling', think=True)
+            traveling_seconds = _get_traveling_seconds(truck, start_seconds, traveling_seconds + 1)
+            traveling = clock.schedule(traveling_seconds, DeliveryEvent.TRAVELING.value)
+            continue
+        await _wait(clock, arrival, truck)
+        load_seconds = _handle_arrival(truck, visited_locations)
+        _record_truck_state(clock, truck, truck.current_run is run)
+        if truck.current_run is run:
+            arrival_seconds = _get_seconds_at_next(truck)
+            arrival = clock.schedule(arrival_seconds, DeliveryEvent.ARRIVAL.value)
+    if traveling is not None:
+        traveling.cancel()
+    return load_seconds
+
+
+async def _drive_truck(clock: VirtualClock, truck: Truck, visited_locations: Set, start_seconds: int,
+                       resumed_state: TruckState = None):
+    """
+    Drives a truck through all of its route runs. Before each departure the truck finishes loading, waits at the hub
+        for status updates until the delayed packages of the run have arrived, reloading with them, then departs at
+        the planned start time of the run or at once if it is already late.
+
+    Args:
+        clock (VirtualClock): The simulation clock.
+        truck (Truck): The truck with route runs.
+        visited_locations (Set[Location]): The locations visited by any truck.
+        start_seconds (int): The start time of the deliveries in seconds since midnight.
+        resumed_state (TruckState, optional): The state of the truck at the checkpoint the deliveries resume from.
+            Defaults to None (the truck starts its first run).
+
+    Time Complexity: O(l * n^2 + w log w), where l is the number of locations on the truck's runs.
+    Space Complexity: O(n)
+    """
+
+    load_seconds = 0
+    if resumed_state is None:
+        _start_first_run(truck, visited_locations)
+        _record_truck_state(clock, truck, False)
+    elif resumed_state.is_driving:
+        load_seconds = await _drive_run(clock, truck, visited_locations, start_seconds, is_resumed=True)
+    while truck.current_run is not None:
+        run = truck.current_run
+        if load_seconds:
+            # Packages that arrived at the hub while the truck was loading are loaded at once.
+            await _wait(clock, clock.schedule(clock.seconds + load_seconds, DeliveryEvent.LOAD_COMPLETION.value), truck)
+            _reload_for_next_run(truck, run, fast_reload=True)
+            _record_truck_state(clock, truck, False)
+        while _is_awaiting_packages(run) and not DeliveryRunner.status_updates.is_closed:
+            status_updates = await DeliveryRunner.status_updates.wait()
+            _set_clocks(clock, truck)
+            if any([isinstance(status_update, DelayedPackagesArrivedException)
+                    for status_update in status_updates or ()]):
+                _reload_for_next_run(truck, run, fast_reload=True)
+                _record_truck_state(clock, truck, False)
+        departure = clock.schedule(TimeConversion.get_seconds(run.start_time), DeliveryEvent.DEPARTURE.value)
+        await _wait(clock, departure, truck)
+        load_seconds = await _drive_run(clock, truck, visited_locations, start_seconds)
+
+
 class DeliveryRunner:
     """
     Class responsible for loading trucks, commencing deliveries, and managing the delivery process.
@@ -283,145 +830,215 @@ class DeliveryRunner:
     Attributes:
         global_clock (time): The current global time.
         trucks (Set[Truck]): Set of trucks available for deliveries.
+        fleet (FleetRegistry): The trucks of the day keyed by truck ID, with their planned route runs.
         route_runs (Set[RouteRun]): Set of route runs to be completed.
+        status_updates (Broadcast): The batch of update events of each package status update during the deliveries,
+            a list of AddressUpdateException and DelayedPackagesArrivedException.
+        checkpoints (CheckpointRecorder): The checkpoints and truck events of the deliveries, or None if checkpoints
+            are disabled in config.
+        plan_id (int): The ID of the plan of the day in the event store, or None if it was not saved.
     """
 
     global_clock: time = config.STANDARD_PACKAGE_LOAD_START_TIME
     trucks: Set[Truck] = set()
+    fleet: FleetRegistry = None
     route_runs: Set[RouteRun] = set()
+    status_updates: Broadcast = None
+    checkpoints: CheckpointRecorder = None
+    plan_id: int = None
 
     @staticmethod
     def load_trucks():
         """
-        Loads the trucks with packages for delivery.
+        Loads the trucks with packages for delivery, saving the plan to the event store unless disabled.
 
         Time Complexity: O(n^2)
         Space Complexity: O(n)
         """
 
-        trucks: List[Truck] = list(RouteBuilder.build_optimized_runs())
+        if config.ANYTIME_PLANNING_ENABLED:
+            trucks: List[Truck] = list(AnytimePlanner.plan(on_incumbent=_display_incumbent_plan_message))
+        else:
+            trucks: List[Truck] = list(RouteBuilder.build_optimized_runs())
+        fleet = FleetRegistry(trucks)
+        runs: List[RouteRun] = fleet.get_runs()
+        fleet.assign_shifts()
+        _display_driver_report(fleet, runs)
         _display_initial_truck_loading_message()
         unused_trucks = [truck for truck in trucks if not truck.route_runs]
         for unused_truck in unused_trucks:
             UI.print(f'Truck #{unused_truck.truck_id} not needed today. Will remain at hub facility', think=True)
-        print('\n\n')
-        runs: List[RouteRun] = [run for truck in trucks for run in truck.route_runs]
-        runs.sort()
+        UI.print('', extra_lines=2, log_enabled=False)
         for run in runs:
-            truck = [truck for truck in trucks if truck.truck_id == run.assigned_truck_id][0]
+            truck = fleet.get_truck(run.assigned_truck_id)
             if truck.is_loaded():
                 continue
             truck.set_clock(DeliveryRunner.global_clock)
             UI.print(f'Loading Truck #{truck.truck_id}', think=True, extra_lines=1,
-                     color=UI.ASSIGNED_COLOR[truck.truck_id])
-            _reload_for_next_run(truck, run)
-            print('\n\n')
+                     color=UI.get_assigned_color(truck.truck_id))
+            load_seconds = _reload_for_next_run(truck, run)
+            truck.set_clock(TimeConversion.increment_time(DeliveryRunner.global_clock, load_seconds))
+            UI.print('', extra_lines=2, log_enabled=False)
         DeliveryRunner.trucks = set(trucks)
+        DeliveryRunner.fleet = fleet
         DeliveryRunner.route_runs = set(runs)
+        _save_plan(runs)
         UI.print('Initial truck loading complete', color=Color.GREEN, sleep_seconds=2, extra_lines=2)
 
     @staticmethod
     def commence_deliveries():
         """
-        Commences the package deliveries.
+        Commences the package deliveries and waits for input once they are complete.
 
-        Time Complexity: O(n^2 * m)
-        Space Complexity: O(n)
+        Time Complexity: O(w log w + n^2 * m), where w is the number of wake-ups.
+        Space Complexity: O(n + w)
+        """
+
+        asyncio.run(DeliveryRunner.run_deliveries())
+        UI.press_enter_to_continue(simulation_end=True)
+
+    @staticmethod
+    async def run_deliveries(clock: VirtualClock = None, checkpoint: Checkpoint = None):
+        """
+        Runs the package deliveries on a virtual clock. Every truck is a task that waits for its next departure,
+            arrival, or status update, so the clock jumps from one to the next instead of advancing one second at a
+            time. Other tasks spawned on the clock, such as exporters awaiting DeliveryRunner.status_updates, run
+            alongside the deliveries. Unless disabled in config, checkpoints are taken along the way.
+
+        Args:
+            clock (VirtualClock, optional): The clock to run on. Defaults to None (a new clock).
+            checkpoint (Checkpoint, optional): A checkpoint of DeliveryRunner.checkpoints to resume the deliveries
+                from. Defaults to None (the deliveries start from the beginning).
+
+        Time Complexity: O(w log w + n^2 * m), where w is the number of wake-ups.
+        Space Complexity: O(n + w)
         """
 
         # Determines the start and completion times for the deliveries.
         start_time = min([run.start_time for run in DeliveryRunner.route_runs])
         completion_time = max([run.estimated_completion_time for run in DeliveryRunner.route_runs])
-
-        # Initializes the global clock with the start time.
-        DeliveryRunner.global_clock = copy(start_time)
-        _display_deliveries_commencing_message(start_time)
-
-        # Creates a list of important status update times.
-        important_update_times = _get_important_status_update_times()
-
-        visited_locations = set()
-        while DeliveryRunner.route_runs and (DeliveryRunner.global_clock <= completion_time):
-            important_time = None
-            if important_update_times and DeliveryRunner.global_clock == important_update_times[0]:
-                important_time = important_update_times.pop(0)
-            for truck in copy(DeliveryRunner.trucks):
+        start_seconds = TimeConversion.get_seconds(start_time)
+
+        # Initializes the global clock and the trucks with the start time, or restores them to the checkpoint, and
+        # schedules the pending package transitions.
+        if checkpoint is None:
+            DeliveryRunner.global_clock = copy(start_time)
+            _display_deliveries_commencing_message(start_time)
+            current_seconds = start_seconds
+            truck_states = dict()
+            visited_locations = set()
+            for truck in DeliveryRunner.trucks:
                 truck.set_clock(DeliveryRunner.global_clock)
-                run: RouteRun = truck.current_run
-
-                # Status update is performed if there is an expected important update.
-                if important_time:
-                    try:
-                        PackageHandler.bulk_status_update(DeliveryRunner.global_clock)
-                    except AddressUpdateException as address_update_exception:
-                        _display_address_update_message(address_update_exception.message)
-                    except DelayedPackagesArrivedException:
-                        _display_delayed_packages_arrival_message()
-                        for truck_at_hub in DeliveryRunner.trucks:
-                            truck_at_hub.set_clock(DeliveryRunner.global_clock)
-                            if truck_at_hub.current_location.is_hub and truck_at_hub.current_run:
-                                _reload_for_next_run(truck_at_hub, truck_at_hub.current_run, fast_reload=True)
-
-                # Truck continues deliveries until all locations of the ordered route are complete
-                if run and (run.start_time <= truck.clock):
-                    analysis_dict = run.run_analysis_dict[(truck.previous_location, truck.current_location)]
-                    time_at_next = analysis_dict[RunInfo.ESTIMATED_TIME_AT_NEXT]
-                    if run and truck.clock == run.start_time:
-                        _display_starting_route_message(truck)
-
-                    # Truck makes delivery upon arrive at next location or completes route run
-                    if time_at_next == DeliveryRunner.global_clock:
-                        truck.previous_location = truck.current_location
-                        truck.current_location = truck.next_location
-                        del run.ordered_route[0]
-                        if not run.ordered_route:
-                            if not truck.route_runs:
-                                truck.deliver()
-                                _display_route_completion(truck)
-                                truck.current_run = None
-                                truck.previous_location = None
-                                truck.next_location = None
-                            elif truck.current_location.is_hub and truck.route_runs:
-                                truck.previous_location = None
-                                truck.route_runs.sort()
-                                _display_reload_info(truck)
-                                truck.current_run = truck.route_runs.pop(0)
-                                del truck.current_run.ordered_route[0]
-                                truck.next_location = truck.current_run.ordered_route[0]
-                                _reload_for_next_run(truck, truck.current_run)
-                            continue
-
-                        if not truck.current_location.is_hub and truck.current_location in visited_locations:
-                            _display_returned_to_visited_location_message(truck)
-                        else:
-                            visited_locations.add(truck.current_location)
-                            delivered_packages = truck.deliver()
-                            _display_delivery_info(truck, delivered_packages)
-                        truck.next_location = run.ordered_route[0]
-                        _display_next_location(truck)
-                    elif (TimeConversion.seconds_between_times(start_time, DeliveryRunner.global_clock)
-                          % (750 // truck.truck_id) == 0):
-                        UI.print(f'{truck.clock} | Truck #{truck.truck_id} traveling', think=True)
-                elif truck.route_runs:
-
-                    # Truck begins a route run if it has one to start if it's the start time
-                    for i in range(len(sorted(truck.route_runs))):
-                        if TimeConversion.is_time_at_or_before_other_time(truck.clock, truck.route_runs[i].start_time):
-                            truck.current_run = truck.route_runs.pop(i)
-                            truck.current_location = truck.current_run.ordered_route[0]
-                            truck.next_location = truck.current_run.ordered_route[1]
-                            if truck.current_run.start_time == truck.clock:
-                                _display_starting_route_message(truck)
-                            visited_locations.add(truck.current_location)
-                            del truck.current_run.ordered_route[0]
-                            break
-                elif run:
-                    continue
-                else:
-                    DeliveryRunner.trucks.remove(truck)
-            DeliveryRunner.global_clock = TimeConversion.increment_time(DeliveryRunner.global_clock, time_seconds=1)
+                heapq.heapify(truck.route_runs)
+            DeliveryRunner.trucks.difference_update([truck for truck in DeliveryRunner.fleet if not truck.route_runs])
+            DeliveryRunner.checkpoints = CheckpointRecorder(
+                DeliveryRunner.trucks, DeliveryRunner.route_runs, PackageHandler.all_packages,
+                start_seconds) if config.CHECKPOINT_INTERVAL_SECONDS else None
+            UI.CHECKPOINTS = DeliveryRunner.checkpoints
+        else:
+            DeliveryRunner.trucks = DeliveryRunner.checkpoints.restore(checkpoint)
+            DeliveryRunner.global_clock = TimeConversion.get_time(checkpoint.seconds)
+            current_seconds = checkpoint.seconds
+            truck_states = checkpoint.truck_states
+            visited_locations = set(checkpoint.visited_locations)
+        PackageHandler.schedule_transitions()
+        first_event_seconds = current_seconds if checkpoint is None else current_seconds + 1
+        if clock is None:
+            clock = VirtualClock(current_seconds)
+        clock.seconds = max(clock.seconds, current_seconds)
+
+        # Starts the status updates at the important update times, a task for every truck with route runs, and the
+        # checkpoints.
+        DeliveryRunner.status_updates = Broadcast(clock)
+        update_seconds = [TimeConversion.get_seconds(important_time) for important_time
+                          in sorted(set(_get_important_status_update_times()))]
+        clock.spawn(_update_statuses(clock, [seconds for seconds in update_seconds if first_event_seconds <= seconds]))
+        for truck in DeliveryRunner.trucks:
+            clock.spawn(_drive_truck(clock, truck, visited_locations, start_seconds,
+                                     truck_states.get(truck.truck_id)))
+        if DeliveryRunner.checkpoints is not None:
+            clock.spawn(_take_checkpoints(clock, visited_locations, first_event_seconds))
+
+        # Advances the clock until every route run is complete, then saves the status events.
+        await clock.run()
+        _save_events()
 
         if len([package for package in PackageHandler.all_packages if package.status != DeliveryStatus.DELIVERED]) == 0:
             _display_route_completion_message(completion_time)
 
+    @staticmethod
+    def resume_deliveries(checkpoint: Checkpoint):
+        """
+        Resumes the package deliveries from a checkpoint of DeliveryRunner.checkpoints, discarding everything that
+            happened after it, and waits for input once they are complete.
+
+        Args:
+            checkpoint (Checkpoint): The checkpoint.
+
+        Time Complexity: O(w log w + n^2 * m)
+        Space Complexity: O(n + w)
+        """
+
+        asyncio.run(DeliveryRunner.run_deliveries(checkpoint=checkpoint))
         UI.press_enter_to_continue(simulation_end=True)
+
+    @staticmethod
+    def simulate(seed: int = 0, package_file: str = config.PACKAGE_CSV_FILE,
+                 carryover_packages: Iterable[Package] = ()) -> SimulationResult:
+        """
+        Loads, plans, and delivers a day as a headless simulation, with no output, no waiting on input, and no
+            simulated loading time. The day is loaded afresh, so simulations with the same arguments have the same
+            result.
+
+        Args:
+            seed (int): The random seed for planning. Defaults to 0.
+            package_file (str): The filepath of the CSV file of the day's packages. Defaults to
+                config.PACKAGE_CSV_FILE.
+            carryover_packages (Iterable[Package]): The undelivered packages of the previous day. Defaults to none.
+
+        Returns:
+            SimulationResult: The delivery times, mileage per truck, and late packages of the day.
+
+        Time Complexity: O(n^2 * m + e log e)
+        Space Complexity: O(n + e)
+        """
+
+        headless_simulation_enabled = config.HEADLESS_SIMULATION_ENABLED
+        config.HEADLESS_SIMULATION_ENABLED = True
+        random.seed(seed)
+        PackageHandler.load_day(package_file, carryover_packages)
+        DeliveryRunner.global_clock = config.STANDARD_PACKAGE_LOAD_START_TIME
+        try:
+            DeliveryRunner.load_trucks()
+            DeliveryRunner.commence_deliveries()
+        finally:
+            config.HEADLESS_SIMULATION_ENABLED = headless_simulation_enabled
+        return SimulationResult(seed, PackageHandler.all_packages, DeliveryRunner.route_runs)
+
+    @staticmethod
+    def simulate_days(package_files: Iterable[str], seed: int = 0) -> List[SimulationResult]:
+        """
+        Simulates successive delivery days headless, one package file per day. The locations and their distance data
+            are loaded once and reused, while packages left undelivered at the end of a day are carried over to the
+            next day.
+
+        Args:
+            package_files (Iterable[str]): The filepaths of the daily package CSV files, in order of day. Files are
+                read as the days are reached, so the iterable can stream them.
+            seed (int): The random seed for planning the first day, incremented for each following day. Defaults to 0.
+
+        Returns:
+            List[SimulationResult]: The result of every day, in order of day.
+
+        Time Complexity: O(d * (n^2 * m + e log e))
+        Space Complexity: O(d * n + e)
+        """
+
+        results = []
+        carryover_packages = []
+        for day, package_file in enumerate(package_files):
+            result = DeliveryRunner.simulate(seed + day, package_file, carryover_packages)
+            carryover_packages = [PackageHandler.package_hash.get_package(package_id)
+                                  for package_id in result.undelivered_package_ids]
+            results.append(result)
+        return results
@@ -0,0 +1,216 @@
+import heapq
+from bisect import bisect_right, insort
+from typing import Dict, Iterable, List
+
+from src import config
+from src.constants.color import Color
+from src.models.route_run import RouteRun
+from src.ui import UI
+from src.utilities.time_conversion import TimeConversion
+
+__all__ = ['DriverScheduler', 'DriverSchedule', 'ScheduledRun']
+
+
+class ScheduledRun:
+    """
+    A route run assigned to a driver.
+
+    Attributes:
+        run (RouteRun): The route run.
+        driver_id (int): The ID of the driver, starting at 1.
+        start_time (time): The time the driver departs, which is later than planned if no driver was free.
+        completion_time (time): The time the run is completed.
+        delay_seconds (int): The number of seconds the run departs later than planned.
+    """
+
+    def __init__(self, run: RouteRun, driver_id: int, start_seconds: int, completion_seconds: int):
+        """
+        Initializes a ScheduledRun object.
+
+        Args:
+            run (RouteRun): The route run.
+            driver_id (int): The ID of the driver.
+            start_seconds (int): The departure in seconds since midnight.
+            completion_seconds (int): The completion in seconds since midnight.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.run = run
+        self.driver_id = driver_id
+        self.start_time = TimeConversion.get_time(start_seconds)
+        self.completion_time = TimeConversion.get_time(completion_seconds)
+        self.delay_seconds = start_seconds - TimeConversion.get_seconds(run.start_time)
+
+
+class DriverSchedule:
+    """
+    The assignment of drivers to route runs over the day.
+
+    Attributes:
+        number_of_drivers (int): The number of drivers scheduled.
+        scheduled_runs (List[ScheduledRun]): The scheduled runs in order of departure.
+        makespan (time): The time the last run is completed, or None if there are no runs.
+        idle_seconds (Dict[int, int]): The seconds each driver waits at the hub between runs, keyed by driver ID.
+        total_delay_seconds (int): The total seconds runs depart later than planned.
+    """
+
+    def __init__(self, number_of_drivers: int, scheduled_runs: List[ScheduledRun]):
+        """
+        Initializes a DriverSchedule object.
+
+        Args:
+            number_of_drivers (int): The number of drivers scheduled.
+            scheduled_runs (List[ScheduledRun]): The scheduled runs in order of departure.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+
+        self.number_of_drivers = number_of_drivers
+        self.scheduled_runs = scheduled_runs
+        self.makespan = max([scheduled_run.completion_time for scheduled_run in scheduled_runs], default=None)
+        self.idle_seconds = {driver_id: 0 for driver_id in range(1, number_of_drivers + 1)}
+        last_completions = dict()
+        for scheduled_run in scheduled_runs:
+            if scheduled_run.driver_id in last_completions:
+                self.idle_seconds[scheduled_run.driver_id] += TimeConversion.get_seconds_between_times(
+                    last_completions[scheduled_run.driver_id], scheduled_run.start_time)
+            last_completions[scheduled_run.driver_id] = scheduled_run.completion_time
+        self.total_delay_seconds = sum([scheduled_run.delay_seconds for scheduled_run in scheduled_runs])
+
+    def get_driver_runs(self, driver_id: int) -> List[ScheduledRun]:
+        """
+        Retrieves the runs of a driver in order of departure.
+
+        Args:
+            driver_id (int): The ID of the driver.
+
+        Returns:
+            List[ScheduledRun]: The runs of the driver.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+
+        return [scheduled_run for scheduled_run in self.scheduled_runs if scheduled_run.driver_id == driver_id]
+
+
+class DriverScheduler:
+    """
+    Assigns drivers to planned route runs as intervals over the day.
+
+    Runs are taken in order of the time they can depart. Each run goes to the free driver who has waited the least,
+        keeping the drivers who have been free the longest for later runs and cutting the time spent idle at the hub.
+        When no driver is free the run waits for the first driver back at the hub, which delays the later runs of its
+        truck as well. A driver whose run does not return to the hub has finished their shift.
+    """
+
+    @staticmethod
+    def schedule(runs: Iterable[RouteRun], number_of_drivers: int = config.NUM_DRIVERS) -> DriverSchedule:
+        """
+        Schedules drivers over the runs.
+
+        Args:
+            runs (Iterable[RouteRun]): The planned route runs with their start and estimated completion times.
+            number_of_drivers (int): The number of drivers available. Defaults to config.NUM_DRIVERS.
+
+        Returns:
+            DriverSchedule: The driver schedule.
+
+        Time Complexity: O(r log r + r * d)
+        Space Complexity: O(r + d)
+        """
+
+        truck_runs: Dict[int, List[RouteRun]] = dict()
+        for run in sorted(runs):
+            truck_runs.setdefault(run.assigned_truck_id, []).append(run)
+        ready_runs = []
+        for i, (truck_id, runs_on_truck) in enumerate(truck_runs.items()):
+            runs_on_truck.reverse()
+            run = runs_on_truck.pop()
+            heapq.heappush(ready_runs, (TimeConversion.get_seconds(run.start_time), i, truck_id, run))
+        free_drivers = [(0, driver_id) for driver_id in range(1, number_of_drivers + 1)]
+        scheduled_runs = []
+        while ready_runs and free_drivers:
+            ready_seconds, i, truck_id, run = heapq.heappop(ready_runs)
+            driver_index = max(bisect_right(free_drivers, (ready_seconds, number_of_drivers + 1)) - 1, 0)
+            free_seconds, driver_id = free_drivers.pop(driver_index)
+            start_seconds = max(ready_seconds, free_seconds)
+            duration_seconds = TimeConversion.get_seconds_between_times(run.start_time,
+                                                                        run.estimated_completion_time)
+            completion_seconds = start_seconds + duration_seconds
+            scheduled_runs.append(ScheduledRun(run, driver_id, start_seconds, completion_seconds))
+            if run.ends_at_hub():
+                insort(free_drivers, (completion_seconds, driver_id))
+            if truck_runs[truck_id]:
+                next_run = truck_runs[truck_id].pop()
+                heapq.heappush(ready_runs, (max(TimeConversion.get_seconds(next_run.start_time), completion_seconds),
+                                            i, truck_id, next_run))
+        scheduled_runs.sort(key=lambda scheduled_run: (scheduled_run.start_time, scheduled_run.driver_id))
+        return DriverSchedule(number_of_drivers, scheduled_runs)
+
+    @staticmethod
+    def get_required_drivers(runs: Iterable[RouteRun]) -> int:
+        """
+        Finds the fewest drivers that can drive every run without delaying any of them.
+
+        Args:
+            runs (Iterable[RouteRun]): The planned route runs.
+
+        Returns:
+            int: The number of drivers required.
+
+        Time Complexity: O(r^2 log r + r^3)
+        Space Complexity: O(r)
+        """
+
+        runs = list(runs)
+        for number_of_drivers in range(1, len(runs) + 1):
+            schedule = DriverScheduler.schedule(runs, number_of_drivers)
+            if len(schedule.scheduled_runs) == len(runs) and not schedule.total_delay_seconds:
+                return number_of_drivers
+        return len(runs)
+
+    @staticmethod
+    def display_report(runs: Iterable[RouteRun], number_of_drivers: int = config.NUM_DRIVERS,
+                       schedule: DriverSchedule = None) -> DriverSchedule:
+        """
+        Schedules drivers over the runs and displays the driver shifts, reporting when more drivers would shorten
+            the day.
+
+        Args:
+            runs (Iterable[RouteRun]): The planned route runs.
+            number_of_drivers (int): The number of drivers available. Defaults to config.NUM_DRIVERS.
+            schedule (DriverSchedule, optional): The schedule of the drivers over the runs, such as the shifts
+                assigned by a FleetRegistry. Defaults to None (scheduled here).
+
+        Returns:
+            DriverSchedule: The driver schedule.
+
+        Time Complexity: O(r^2 log r + r^3)
+        Space Complexity: O(r)
+        """
+
+        runs = list(runs)
+        if schedule is None:
+            schedule = DriverScheduler.schedule(runs, number_of_drivers)
+        for driver_id in range(1, number_of_drivers + 1):
+            shift = ', '.join([f'Truck #{scheduled_run.run.assigned_truck_id} {scheduled_run.start_time}-'
+                               f'{scheduled_run.completion_time}'
+                               for scheduled_run in schedule.get_driver_runs(driver_id)])
+            UI.print(f'Driver #{driver_id} | {shift or "No runs"} | '
+                     f'Idle at hub: {schedule.idle_seconds[driver_id] // 60} minutes')
+        required_drivers = DriverScheduler.get_required_drivers(runs)
+        if len(schedule.scheduled_runs) < len(runs):
+            UI.print(f'{len(runs) - len(schedule.scheduled_runs)} runs have no driver | '
+                     f'{required_drivers - number_of_drivers} more drivers are needed to drive every run',
+                     color=Color.RED, extra_lines=1)
+        elif required_drivers > number_of_drivers:
+            more_drivers_schedule = DriverScheduler.schedule(runs, required_drivers)
+            if more_drivers_schedule.makespan < schedule.makespan:
+                UI.print(f'{required_drivers - number_of_drivers} more drivers would complete the day at '
+                         f'{more_drivers_schedule.makespan} instead of {schedule.makespan}', color=Color.YELLOW,
+                         extra_lines=1)
+        return schedule
@@ -0,0 +1,330 @@
+import sqlite3
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.constants.run_info import RunInfo
+from src.models.event_log import EventLog
+from src.models.route_run import RouteRun
+from src.utilities.time_conversion import TimeConversion
+
+__all__ = ['EventStore']
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS plans (
+    plan_id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    total_mileage REAL NOT NULL,
+    completion_seconds INTEGER
+);
+CREATE TABLE IF NOT EXISTS runs (
+    plan_id INTEGER NOT NULL REFERENCES plans (plan_id),
+    run_index INTEGER NOT NULL,
+    truck_id INTEGER,
+    start_seconds INTEGER NOT NULL,
+    completion_seconds INTEGER,
+    mileage REAL NOT NULL,
+    PRIMARY KEY (plan_id, run_index)
+);
+CREATE TABLE IF NOT EXISTS stops (
+    plan_id INTEGER NOT NULL,
+    run_index INTEGER NOT NULL,
+    stop_index INTEGER NOT NULL,
+    location_name TEXT NOT NULL,
+    address TEXT NOT NULL,
+    estimated_seconds INTEGER NOT NULL,
+    estimated_mileage REAL NOT NULL,
+    PRIMARY KEY (plan_id, run_index, stop_index),
+    FOREIGN KEY (plan_id, run_index) REFERENCES runs (plan_id, run_index)
+);
+CREATE TABLE IF NOT EXISTS status_events (
+    plan_id INTEGER NOT NULL REFERENCES plans (plan_id),
+    event_index INTEGER NOT NULL,
+    package_id INTEGER NOT NULL,
+    seconds INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    location_name TEXT NOT NULL,
+    address TEXT NOT NULL,
+    truck_id INTEGER,
+    PRIMARY KEY (plan_id, event_index)
+);
+CREATE INDEX IF NOT EXISTS runs_by_truck ON runs (plan_id, truck_id);
+CREATE INDEX IF NOT EXISTS status_events_by_package ON status_events (plan_id, package_id, seconds);
+CREATE INDEX IF NOT EXISTS status_events_by_truck ON status_events (plan_id, truck_id, seconds);
+CREATE INDEX IF NOT EXISTS status_events_by_time ON status_events (plan_id, seconds);
+'''
+
+
+def _get_stop_rows(plan_id: int, run_index: int, run: RouteRun) -> Iterator[tuple]:
+    """
+    Generates the rows of the stops of a route run, with their estimated arrival time and mileage.
+
+    Args:
+        plan_id (int): The ID of the plan.
+        run_index (int): The index of the run in the plan.
+        run (RouteRun): The run, with its full route.
+
+    Returns:
+        Iterator[tuple]: The rows of the stops table.
+
+    Time Complexity: O(l), where l is the number of locations on the run.
+    Space Complexity: O(1)
+    """
+
+    previous_location = None
+    for stop_index, location in enumerate(run.ordered_route):
+        analysis_dict = run.run_analysis_dict[(previous_location, location)]
+        yield (plan_id, run_index, stop_index, location.name, location.get_full_address(),
+               TimeConversion.get_seconds(analysis_dict[RunInfo.ESTIMATED_TIME]),
+               analysis_dict[RunInfo.ESTIMATED_MILEAGE])
+        previous_location = location
+
+
+def _get_event_rows(plan_id: int, event_log: EventLog) -> Iterator[tuple]:
+    """
+    Generates the rows of the status events of an event log.
+
+    Args:
+        plan_id (int): The ID of the plan.
+        event_log (EventLog): The event log.
+
+    Returns:
+        Iterator[tuple]: The rows of the status_events table.
+
+    Time Complexity: O(e), where e is the number of events.
+    Space Complexity: O(1)
+    """
+
+    for event_index in range(len(event_log)):
+        package_id, seconds, status, location, truck_id = event_log.get_event(event_index)
+        yield (plan_id, event_index, package_id, seconds, status.name, location.name, location.get_full_address(),
+               truck_id)
+
+
+class EventStore:
+    """
+    A local SQLite database of delivery plans, their route runs and stops, and the status events of the simulated
+        deliveries, so past days can be queried after the process exits.
+
+    The database is opened in write-ahead logging mode, each plan or event log is written in a single transaction of
+        batched inserts, and the status events are indexed by package, truck, and time. Times are stored in seconds
+        since midnight and statuses by DeliveryStatus name.
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Opens the database, creating its tables and indexes if needed.
+
+        Args:
+            filepath (str): The filepath of the database file, or ':memory:' for an in-memory database.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._connection = sqlite3.connect(filepath)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('PRAGMA foreign_keys=ON')
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        """
+        Returns the store for use in a with statement.
+
+        Returns:
+            EventStore: The store.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Closes the store at the end of a with statement.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.close()
+
+    def close(self):
+        """
+        Closes the database connection.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._connection.close()
+
+    def save_plan(self, runs: Iterable[RouteRun]) -> int:
+        """
+        Saves a delivery plan with its route runs and their stops. The runs must still have their full routes, so the
+            plan is saved before the deliveries start.
+
+        Args:
+            runs (Iterable[RouteRun]): The route runs of the plan.
+
+        Returns:
+            int: The ID of the saved plan.
+
+        Time Complexity: O(r log r + r * l)
+        Space Complexity: O(r)
+        """
+
+        runs = sorted(runs, key=lambda run: (run.assigned_truck_id, run.start_time))
+        completion_times = [run.estimated_completion_time for run in runs]
+        with self._connection:
+            plan_id = self._connection.execute(
+                'INSERT INTO plans (created_at, total_mileage, completion_seconds) VALUES (?, ?, ?)',
+                (datetime.now().isoformat(timespec='seconds'), sum([run.estimated_mileage for run in runs]),
+                 TimeConversion.get_seconds(max(completion_times)) if completion_times else None)).lastrowid
+            self._connection.executemany(
+                'INSERT INTO runs (plan_id, run_index, truck_id, start_seconds, completion_seconds, mileage)'
+                ' VALUES (?, ?, ?, ?, ?, ?)',
+                [(plan_id, run_index, run.assigned_truck_id, TimeConversion.get_seconds(run.start_time),
+                  TimeConversion.get_seconds(run.estimated_completion_time), run.estimated_mileage)
+                 for run_index, run in enumerate(runs)])
+            for run_index, run in enumerate(runs):
+                self._connection.executemany(
+                    'INSERT INTO stops (plan_id, run_index, stop_index, location_name, address, estimated_seconds,'
+                    ' estimated_mileage) VALUES (?, ?, ?, ?, ?, ?, ?)', _get_stop_rows(plan_id, run_index, run))
+        return plan_id
+
+    def save_events(self, plan_id: int, event_log: EventLog):
+        """
+        Saves the status events of the deliveries of a plan, replacing any saved before, such as those of deliveries
+            that were since resumed from a checkpoint.
+
+        Args:
+            plan_id (int): The ID of the plan.
+            event_log (EventLog): The event log of the deliveries.
+
+        Time Complexity: O(e log e)
+        Space Complexity: O(1)
+        """
+
+        with self._connection:
+            self._connection.execute('DELETE FROM status_events WHERE plan_id = ?', (plan_id,))
+            self._connection.executemany(
+                'INSERT INTO status_events (plan_id, event_index, package_id, seconds, status, location_name, address,'
+                ' truck_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)', _get_event_rows(plan_id, event_log))
+
+    def get_latest_plan_id(self) -> Optional[int]:
+        """
+        Retrieves the ID of the most recently saved plan.
+
+        Returns:
+            int: The ID of the plan, or None if no plan was saved.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._connection.execute('SELECT MAX(plan_id) FROM plans').fetchone()[0]
+
+    def get_runs(self, plan_id: int) -> List[Tuple[int, int, int, int, float]]:
+        """
+        Retrieves the route runs of a plan.
+
+        Args:
+            plan_id (int): The ID of the plan.
+
+        Returns:
+            List[Tuple[int, int, int, int, float]]: The run index, truck ID, start and estimated completion times in
+                seconds since midnight, and estimated mileage of each run, in order of run index.
+
+        Time Complexity: O(r)
+        Space Complexity: O(r)
+        """
+
+        return self._connection.execute(
+            'SELECT run_index, truck_id, start_seconds, completion_seconds, mileage FROM runs WHERE plan_id = ?'
+            ' ORDER BY run_index', (plan_id,)).fetchall()
+
+    def get_stops(self, plan_id: int, run_index: int) -> List[Tuple[str, str, int, float]]:
+        """
+        Retrieves the stops of a route run.
+
+        Args:
+            plan_id (int): The ID of the plan.
+            run_index (int): The index of the run in the plan.
+
+        Returns:
+            List[Tuple[str, str, int, float]]: The location name, full address, estimated arrival time in seconds since
+                midnight, and estimated mileage of each stop, in order of the route.
+
+        Time Complexity: O(l)
+        Space Complexity: O(l)
+        """
+
+        return self._connection.execute(
+            'SELECT location_name, address, estimated_seconds, estimated_mileage FROM stops'
+            ' WHERE plan_id = ? AND run_index = ? ORDER BY stop_index', (plan_id, run_index)).fetchall()
+
+    def get_package_history(self, plan_id: int, package_id: int) -> List[Tuple[int, str, str, Optional[int]]]:
+        """
+        Retrieves the status events of a package.
+
+        Args:
+            plan_id (int): The ID of the plan.
+            package_id (int): The ID of the package.
+
+        Returns:
+            List[Tuple[int, str, str, int]]: The time in seconds since midnight, status name, location name, and truck
+                ID of each event, in order of time.
+
+        Time Complexity: O(log e + k), where k is the number of events of the package.
+        Space Complexity: O(k)
+        """
+
+        return self._connection.execute(
+            'SELECT seconds, status, location_name, truck_id FROM status_events WHERE plan_id = ? AND package_id = ?'
+            ' ORDER BY seconds, event_index', (plan_id, package_id)).fetchall()
+
+    def get_truck_events(self, plan_id: int, truck_id: int) -> List[Tuple[int, int, str, str]]:
+        """
+        Retrieves the status events made by a truck.
+
+        Args:
+            plan_id (int): The ID of the plan.
+            truck_id (int): The ID of the truck.
+
+        Returns:
+            List[Tuple[int, int, str, str]]: The time in seconds since midnight, package ID, status name, and location
+                name of each event, in order of time.
+
+        Time Complexity: O(log e + k), where k is the number of events of the truck.
+        Space Complexity: O(k)
+        """
+
+        return self._connection.execute(
+            'SELECT seconds, package_id, status, location_name FROM status_events WHERE plan_id = ? AND truck_id = ?'
+            ' ORDER BY seconds, event_index', (plan_id, truck_id)).fetchall()
+
+    def get_deliveries_between(self, plan_id: int, start_seconds: int,
+                               end_seconds: int) -> List[Tuple[int, int, Optional[int]]]:
+        """
+        Retrieves the deliveries made in a period of time.
+
+        Args:
+            plan_id (int): The ID of the plan.
+            start_seconds (int): The start of the period in seconds since midnight, inclusive.
+            end_seconds (int): The end of the period in seconds since midnight, exclusive.
+
+        Returns:
+            List[Tuple[int, int, int]]: The time in seconds since midnight, package ID, and truck ID of each delivery,
+                in order of time.
+
+        Time Complexity: O(log e + k), where k is the number of events in the period.
+        Space Complexity: O(k)
+        """
+
+        return self._connection.execute(
+            "SELECT seconds, package_id, truck_id FROM status_events WHERE plan_id = ? AND seconds >= ?"
+            " AND seconds < ? AND status = 'DELIVERED' ORDER BY seconds, event_index",
+            (plan_id, start_seconds, end_seconds)).fetchall()
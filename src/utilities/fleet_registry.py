@@ -0,0 +1,117 @@
+from typing import Dict, Iterable, List, Optional
+
+from src import config
+from src.models.route_run import RouteRun
+from src.models.truck import Truck
+from src.utilities.driver_scheduler import DriverSchedule, DriverScheduler
+
+__all__ = ['FleetRegistry']
+
+
+class FleetRegistry:
+    """
+    An indexed registry of the delivery fleet.
+
+    Trucks are looked up by ID, the route runs planned on the trucks are listed in order of start time, and drivers
+        are scheduled over the runs by the DriverScheduler. The runs stay on the trucks, whose route runs the delivery
+        runner works through, so the registry never holds a copy of them.
+
+    Attributes:
+        trucks_by_id (Dict[int, Truck]): The trucks keyed by truck ID.
+        number_of_drivers (int): The number of drivers available for the day.
+        driver_schedule (DriverSchedule): The schedule of the drivers over the runs, or None until shifts are
+            assigned.
+    """
+
+    def __init__(self, trucks: Iterable[Truck] = None, number_of_drivers: int = config.NUM_DRIVERS):
+        """
+        Initializes the registry with the given trucks, or a new fleet of config.NUM_DELIVERY_TRUCKS trucks.
+
+        Args:
+            trucks (Iterable[Truck], optional): The trucks of the fleet. Defaults to None (a new fleet).
+            number_of_drivers (int): The number of drivers available. Defaults to config.NUM_DRIVERS.
+
+        Time Complexity: O(n)
+        Space Complexity: O(n)
+        """
+
+        if trucks is None:
+            trucks = [Truck(truck_id) for truck_id in range(1, config.NUM_DELIVERY_TRUCKS + 1)]
+        self.trucks_by_id: Dict[int, Truck] = {truck.truck_id: truck for truck in trucks}
+        self.number_of_drivers = number_of_drivers
+        self.driver_schedule: Optional[DriverSchedule] = None
+
+    def __len__(self):
+        """
+        Returns the number of trucks in the fleet.
+
+        Returns:
+            int: The number of trucks.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return len(self.trucks_by_id)
+
+    def __iter__(self):
+        """
+        Iterates over the trucks of the fleet in order of truck ID.
+
+        Returns:
+            Iterator[Truck]: The trucks of the fleet.
+
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        """
+
+        return iter(self.trucks_by_id.values())
+
+    def get_truck(self, truck_id: int) -> Truck:
+        """
+        Retrieves a truck by ID.
+
+        Args:
+            truck_id (int): The ID of the truck.
+
+        Returns:
+            Truck: The truck, or None if the fleet has no truck with the ID.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self.trucks_by_id.get(truck_id)
+
+    def get_runs(self, truck_id: int = None) -> List[RouteRun]:
+        """
+        Retrieves the route runs of a truck, or of the whole fleet, in order of start time. Runs with the same start
+            time are kept in order of truck and then in the order of their truck's route runs.
+
+        Args:
+            truck_id (int, optional): The ID of the truck. Defaults to None (every truck).
+
+        Returns:
+            List[RouteRun]: The route runs in order of start time.
+
+        Time Complexity: O(r log r), where r is the number of route runs.
+        Space Complexity: O(r)
+        """
+
+        trucks = [self.get_truck(truck_id)] if truck_id else list(self)
+        runs = [run for truck in trucks if truck is not None for run in truck.route_runs]
+        return sorted(runs, key=lambda run: run.start_time)
+
+    def assign_shifts(self) -> DriverSchedule:
+        """
+        Schedules the drivers of the fleet over the queued runs with the DriverScheduler, keeping the schedule.
+
+        Returns:
+            DriverSchedule: The driver schedule.
+
+        Time Complexity: O(r log r + r * d), where d is the number of drivers.
+        Space Complexity: O(r + d)
+        """
+
+        self.driver_schedule = DriverScheduler.schedule(self.get_runs(), self.number_of_drivers)
+        return self.driver_schedule
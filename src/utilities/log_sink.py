@@ -0,0 +1,295 @@
+import os
+import re
+import threading
+from collections import deque
+from queue import Full, Queue
+from typing import Iterator, List, Optional, Tuple
+
+from src import config
+
+__all__ = ['LogSink']
+
+_ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*m')
+_CLOSE_SENTINEL = None
+_WRITER_POLL_SECONDS = 0.1
+
+
+class LogSink:
+    """
+    The delivery log, kept as a bounded ring buffer of the most recent lines and streamed by a background thread to a
+        size-rotated log file, so memory stays flat however long the simulation runs.
+
+    Lines are handed to the writer thread through a bounded queue, so a slow disk applies backpressure rather than
+        growing the queue. If the writer thread stops on an error, lines are still kept in memory but are no longer
+        written to the log file, rather than blocking on the full queue. The log file is rotated to filepath.1 through
+        filepath.N, oldest last, before a line would take it past its maximum size. Reading, paging, and searching the
+        log stream the files from oldest to newest.
+
+    Attributes:
+        filepath (str): The filepath of the current log file.
+        is_enabled (bool): Flag indicating if written lines are logged, cleared to discard lines temporarily.
+    """
+
+    def __init__(self, filepath: str, buffer_lines: int = config.LOG_BUFFER_LINES,
+                 max_bytes: int = config.LOG_MAX_BYTES, backup_count: int = config.LOG_BACKUP_COUNT):
+        """
+        Initializes a LogSink object. The log file and writer thread are created on the first write, replacing the
+            log files of an earlier session.
+
+        Args:
+            filepath (str): The filepath of the log file.
+            buffer_lines (int, optional): The number of recent lines kept in memory. Defaults to
+                config.LOG_BUFFER_LINES.
+            max_bytes (int, optional): The size at which the log file is rotated. Defaults to config.LOG_MAX_BYTES.
+            backup_count (int, optional): The number of rotated log files kept. Defaults to config.LOG_BACKUP_COUNT.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.filepath = filepath
+        self.is_enabled = True
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._recent_lines = deque(maxlen=buffer_lines)
+        self._queue = Queue(maxsize=buffer_lines)
+        self._line_count = 0
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Returns the number of lines written to the log.
+
+        Returns:
+            int: The number of lines.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return self._line_count
+
+    def _get_backup_filepath(self, backup_number: int) -> str:
+        """
+        Gets the filepath of a rotated log file.
+
+        Args:
+            backup_number (int): The number of the rotated log file, where 1 is the most recent.
+
+        Returns:
+            str: The filepath of the rotated log file.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return f'{self.filepath}.{backup_number}'
+
+    def _remove_files(self):
+        """
+        Removes the log file and its rotated log files.
+
+        Time Complexity: O(b), where b is the number of rotated log files.
+        Space Complexity: O(1)
+        """
+
+        for filepath in [self.filepath] + [self._get_backup_filepath(i) for i in range(1, self._backup_count + 1)]:
+            if os.path.exists(filepath):
+                os.remove(filepath)
+
+    def _rotate(self):
+        """
+        Shifts every rotated log file one number older, dropping the oldest, and rotates the log file to filepath.1.
+
+        Time Complexity: O(b)
+        Space Complexity: O(1)
+        """
+
+        if self._backup_count == 0:
+            os.remove(self.filepath)
+            return
+        for backup_number in range(self._backup_count - 1, 0, -1):
+            if os.path.exists(self._get_backup_filepath(backup_number)):
+                os.replace(self._get_backup_filepath(backup_number), self._get_backup_filepath(backup_number + 1))
+        os.replace(self.filepath, self._get_backup_filepath(1))
+
+    def _write_lines(self):
+        """
+        Runs the writer thread, appending queued lines to the log file in batches and rotating it when it is full,
+            until the sink is closed.
+
+        Time Complexity: O(l), where l is the number of lines written.
+        Space Complexity: O(q), where q is the capacity of the queue.
+        """
+
+        file = open(self.filepath, 'a', encoding='utf-8')
+        size = file.tell()
+        is_closed = False
+        while not is_closed:
+            lines = [self._queue.get()]
+            while not self._queue.empty():
+                lines.append(self._queue.get_nowait())
+            for line in lines:
+                if line is _CLOSE_SENTINEL:
+                    is_closed = True
+                    break
+                line += '\n'
+                line_size = len(line.encode('utf-8'))
+                if size and size + line_size > self._max_bytes:
+                    file.close()
+                    self._rotate()
+                    file = open(self.filepath, 'a', encoding='utf-8')
+                    size = 0
+                file.write(line)
+                size += line_size
+            file.flush()
+            for _ in lines:
+                self._queue.task_done()
+        file.close()
+
+    def _put(self, writer: threading.Thread, line: Optional[str]):
+        """
+        Hands a line to the writer thread, waiting while the queue is full for as long as the writer thread runs.
+
+        Args:
+            writer (threading.Thread): The writer thread.
+            line (str): The line, or the close sentinel.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        while writer.is_alive():
+            try:
+                self._queue.put(line, timeout=_WRITER_POLL_SECONDS)
+                return
+            except Full:
+                continue
+
+    def write(self, line: str):
+        """
+        Logs a line, starting the writer thread on the first line.
+
+        Args:
+            line (str): The line, without its line ending.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if not self.is_enabled:
+            return
+        with self._lock:
+            if self._writer is None:
+                self._remove_files()
+                self._writer = threading.Thread(target=self._write_lines, name='LogSinkWriter', daemon=True)
+                self._writer.start()
+            writer = self._writer
+        self._recent_lines.append(line)
+        self._line_count += 1
+        self._put(writer, line)
+
+    def flush(self):
+        """
+        Waits until the writer thread has written every logged line to the log file, or has stopped.
+
+        Time Complexity: O(q)
+        Space Complexity: O(1)
+        """
+
+        writer = self._writer
+        if writer is None:
+            return
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks and writer.is_alive():
+                self._queue.all_tasks_done.wait(_WRITER_POLL_SECONDS)
+
+    def close(self):
+        """
+        Writes every logged line and stops the writer thread. A later write starts a new log.
+
+        Time Complexity: O(q)
+        Space Complexity: O(1)
+        """
+
+        with self._lock:
+            if self._writer is None:
+                return
+            self._put(self._writer, _CLOSE_SENTINEL)
+            self._writer.join()
+            self._writer = None
+
+    def get_recent_lines(self) -> List[str]:
+        """
+        Retrieves the most recent lines, which are kept in memory.
+
+        Returns:
+            List[str]: The lines, oldest first.
+
+        Time Complexity: O(r), where r is the number of lines kept in memory.
+        Space Complexity: O(r)
+        """
+
+        return list(self._recent_lines)
+
+    def read_lines(self) -> Iterator[str]:
+        """
+        Reads every line still in the log files, after waiting for the logged lines to be written.
+
+        Returns:
+            Iterator[str]: The lines without their line endings, oldest first.
+
+        Time Complexity: O(f), where f is the size of the log files.
+        Space Complexity: O(1)
+        """
+
+        self.flush()
+        filepaths = [self._get_backup_filepath(i) for i in range(self._backup_count, 0, -1)] + [self.filepath]
+        for filepath in filepaths:
+            if os.path.exists(filepath):
+                with open(filepath, encoding='utf-8') as file:
+                    for line in file:
+                        yield line.rstrip('\n')
+
+    def get_page(self, page_index: int, page_size: int = config.LOG_PAGE_LINES) -> List[str]:
+        """
+        Retrieves a page of the lines still in the log files.
+
+        Args:
+            page_index (int): The index of the page, where 0 is the oldest.
+            page_size (int, optional): The number of lines per page. Defaults to config.LOG_PAGE_LINES.
+
+        Returns:
+            List[str]: The lines of the page, empty past the last page.
+
+        Time Complexity: O(f)
+        Space Complexity: O(p), where p is the page size.
+        """
+
+        start = page_index * page_size
+        page = []
+        for line_index, line in enumerate(self.read_lines()):
+            if line_index >= start + page_size:
+                break
+            if line_index >= start:
+                page.append(line)
+        return page
+
+    def search(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Finds the lines still in the log files containing a text, ignoring case and color codes.
+
+        Args:
+            text (str): The text to search for.
+
+        Returns:
+            List[Tuple[int, str]]: The line number, counting from 1, and the line of each match, oldest first.
+
+        Time Complexity: O(f)
+        Space Complexity: O(m), where m is the number of matching lines.
+        """
+
+        text = text.lower()
+        return [(line_number, line) for line_number, line in enumerate(self.read_lines(), 1)
+                if text in _ANSI_ESCAPE_PATTERN.sub('', line).lower()]
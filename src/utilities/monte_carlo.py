@@ -0,0 +1,281 @@
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from src import config
+from src.models.package import Package
+from src.models.truck import Truck
+from src.utilities.package_handler import PackageHandler
+from src.utilities.route_builder import RouteBuilder
+from src.utilities.time_conversion import TimeConversion
+
+__all__ = ['MonteCarloSimulator', 'MonteCarloResult']
+
+# (deadline seconds, delayed hub arrival seconds or None, delivery location index, address update seconds or None,
+#  weight), keyed by package ID.
+PackagePlan = Dict[int, Tuple[int, int, int, int, int]]
+# Per truck: (truck ID, runs), where a run is (planned start seconds, required package IDs, legs of
+#  (miles, location index)).
+TruckPlan = List[Tuple[int, List[Tuple[int, Tuple[int, ...], Tuple[Tuple[float, int], ...]]]]]
+
+
+def _get_plan(trucks: Iterable[Truck]) -> Tuple[PackagePlan, TruckPlan]:
+    """
+    Captures a route plan as plain tuples, so replications can run in other processes without the model objects.
+
+    Args:
+        trucks (Iterable[Truck]): The trucks with their planned route runs.
+
+    Returns:
+        Tuple[PackagePlan, TruckPlan]: The packages and the runs of every truck in order of start time.
+
+    Time Complexity: O(n + r * l)
+    Space Complexity: O(n + r * l)
+    """
+
+    location_indexes = {location: i for i, location in enumerate(PackageHandler.all_locations)}
+    constraint_graph = PackageHandler.constraint_graph
+    package_store = Package.package_store
+    dispatch_seconds = TimeConversion.get_seconds(config.DELIVERY_DISPATCH_TIME)
+    package_plan = dict()
+    for package, deadline_seconds, release_seconds, location_index, weight in zip(
+            package_store.get_packages(), package_store.get_column('deadline_seconds'),
+            package_store.get_column('release_seconds'), package_store.get_column('location_index'),
+            package_store.get_column('weight')):
+        update_seconds = None
+        address_update = None if package.is_verified_address else constraint_graph.get_address_update(package.location)
+        if address_update and address_update[1]:
+            update_seconds = TimeConversion.get_seconds(address_update[0])
+            location_index = location_indexes[address_update[1]]
+        package_plan[package.package_id] = (deadline_seconds, release_seconds if release_seconds > dispatch_seconds
+                                            else None, location_index, update_seconds, int(weight))
+    truck_plan = []
+    for truck in sorted(trucks, key=lambda _truck: _truck.truck_id):
+        runs = []
+        for run in sorted(truck.route_runs):
+            legs = tuple([(previous_location.distance(location), location_indexes[location])
+                          for previous_location, location in zip(run.ordered_route, run.ordered_route[1:])])
+            package_ids = tuple(sorted([package.package_id for package in run.required_packages]))
+            runs.append((TimeConversion.get_seconds(run.start_time), package_ids, legs))
+        if runs:
+            truck_plan.append((truck.truck_id, runs))
+    return package_plan, truck_plan
+
+
+def _replicate(package_plan: PackagePlan, truck_plan: TruckPlan, seed: int) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """
+    Simulates one day of the plan with random travel speeds, delayed package arrivals and reload times.
+
+    Every leg is driven at a speed drawn from a triangular distribution around config.DELIVERY_TRUCK_MPH. A run
+        departs at its planned start time, or later if the truck is still on the previous run, is reloading, or is
+        waiting on a delayed package. Packages are delivered at the first stop at their location once their address
+        is confirmed.
+
+    Args:
+        package_plan (PackagePlan): The packages of the plan.
+        truck_plan (TruckPlan): The runs of every truck.
+        seed (int): The random seed of the replication.
+
+    Returns:
+        Tuple[Dict[int, int], Dict[int, int]]: The delivery time of every delivered package and the finish time of
+            every truck, in seconds since midnight.
+
+    Time Complexity: O(r * l * p)
+    Space Complexity: O(n)
+    """
+
+    rng = random.Random(seed)
+    jitter = config.MONTE_CARLO_ARRIVAL_JITTER_SECONDS
+    arrival_seconds = {package_id: hub_arrival + rng.uniform(-jitter, jitter)
+                       for package_id, (_, hub_arrival, _, _, _) in package_plan.items() if hub_arrival is not None}
+    delivery_seconds = dict()
+    finish_seconds = dict()
+    for truck_id, runs in truck_plan:
+        clock = 0
+        carried = set()
+        for i, (start_seconds, package_ids, legs) in enumerate(runs):
+            loaded = [package_id for package_id in package_ids
+                      if package_id not in carried and package_id not in delivery_seconds]
+            if i:
+                clock += sum([rng.randint(min(package_plan[package_id][4], config.PACKAGE_LOAD_SPEED_MAX_SECONDS),
+                                          config.PACKAGE_LOAD_SPEED_MAX_SECONDS) for package_id in loaded])
+            clock = max([clock, start_seconds] + [arrival_seconds.get(package_id, 0) for package_id in loaded])
+            carried.update(loaded)
+            for miles, location_index in legs:
+                speed = rng.triangular(config.MONTE_CARLO_MIN_SPEED_MPH, config.MONTE_CARLO_MAX_SPEED_MPH,
+                                       config.DELIVERY_TRUCK_MPH)
+                clock += miles / speed * 3600
+                delivered_ids = [package_id for package_id in carried if package_plan[package_id][2] == location_index]
+                for package_id in delivered_ids:
+                    update_seconds = package_plan[package_id][3]
+                    if update_seconds is None or update_seconds <= clock:
+                        delivery_seconds[package_id] = round(clock)
+                        carried.remove(package_id)
+        finish_seconds[truck_id] = round(clock)
+    return delivery_seconds, finish_seconds
+
+
+def _replicate_all(package_plan: PackagePlan, truck_plan: TruckPlan,
+                   seeds: Sequence[int]) -> Tuple[Dict[int, int], Dict[int, List[int]]]:
+    """
+    Runs a batch of replications, counting the on-time deliveries of every package and collecting the finish times
+        of every truck.
+
+    Args:
+        package_plan (PackagePlan): The packages of the plan.
+        truck_plan (TruckPlan): The runs of every truck.
+        seeds (Sequence[int]): The random seed of every replication.
+
+    Returns:
+        Tuple[Dict[int, int], Dict[int, List[int]]]: The number of on-time deliveries keyed by package ID, and the
+            finish times in seconds keyed by truck ID.
+
+    Time Complexity: O(k * r * l * p), where k is the number of replications.
+    Space Complexity: O(n + k * t)
+    """
+
+    on_time_counts = {package_id: 0 for package_id in package_plan}
+    finish_times = {truck_id: [] for truck_id, _ in truck_plan}
+    for seed in seeds:
+        delivery_seconds, finish_seconds = _replicate(package_plan, truck_plan, seed)
+        for package_id, delivered_seconds in delivery_seconds.items():
+            if delivered_seconds <= package_plan[package_id][0]:
+                on_time_counts[package_id] += 1
+        for truck_id, seconds in finish_seconds.items():
+            finish_times[truck_id].append(seconds)
+    return on_time_counts, finish_times
+
+
+def _get_percentile(sorted_values: List[int], percentile: float) -> int:
+    """
+    Finds a percentile of sorted values with the nearest-rank method.
+
+    Args:
+        sorted_values (List[int]): The values in ascending order.
+        percentile (float): The percentile, between 0 and 100.
+
+    Returns:
+        int: The value at the percentile.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    return sorted_values[max(math.ceil(percentile / 100 * len(sorted_values)) - 1, 0)]
+
+
+class MonteCarloResult:
+    """
+    The outcome of many stochastic replications of a route plan.
+
+    Attributes:
+        replications (int): The number of replications.
+        on_time_probability (Dict[int, float]): The share of replications delivering each package on time, keyed by
+            package ID.
+        finish_time_percentiles (Dict[int, Dict[float, time]]): The finish time of each truck at each percentile,
+            keyed by truck ID then percentile.
+    """
+
+    def __init__(self, replications: int, on_time_counts: Dict[int, int], finish_times: Dict[int, List[int]],
+                 percentiles: Iterable[float]):
+        """
+        Initializes a MonteCarloResult object from the combined counts of every replication.
+
+        Args:
+            replications (int): The number of replications.
+            on_time_counts (Dict[int, int]): The number of on-time deliveries keyed by package ID.
+            finish_times (Dict[int, List[int]]): The finish times in seconds keyed by truck ID.
+            percentiles (Iterable[float]): The finish time percentiles to report.
+
+        Time Complexity: O(t * k log k)
+        Space Complexity: O(n + t)
+        """
+
+        self.replications = replications
+        self.on_time_probability = {package_id: count / replications
+                                    for package_id, count in sorted(on_time_counts.items())}
+        self.finish_time_percentiles = dict()
+        for truck_id, truck_finish_times in sorted(finish_times.items()):
+            truck_finish_times = sorted(truck_finish_times)
+            self.finish_time_percentiles[truck_id] = {
+                percentile: TimeConversion.get_time(_get_percentile(truck_finish_times, percentile))
+                for percentile in percentiles}
+
+    def get_at_risk_packages(self, threshold: float = 0.95) -> List[int]:
+        """
+        Retrieves the packages delivered on time in fewer replications than the threshold.
+
+        Args:
+            threshold (float): The lowest acceptable on-time probability. Defaults to 0.95.
+
+        Returns:
+            List[int]: The IDs of the at-risk packages, from the least likely to be on time.
+
+        Time Complexity: O(n log n)
+        Space Complexity: O(n)
+        """
+
+        return sorted([package_id for package_id, probability in self.on_time_probability.items()
+                       if probability < threshold], key=lambda package_id: self.on_time_probability[package_id])
+
+
+class MonteCarloSimulator:
+    """
+    Estimates how reliably a fixed route plan delivers on time when travel and arrival times vary.
+
+    The plan is captured once as plain data and replayed under random per-leg speeds, delayed package arrival jitter
+        and reload times. Each replication has its own seed, so results do not depend on how the replications are
+        split across worker processes.
+    """
+
+    @staticmethod
+    def run(trucks: Iterable[Truck] = None, replications: int = config.MONTE_CARLO_REPLICATIONS, seed: int = 0,
+            max_workers: int = None, percentiles: Iterable[float] = config.MONTE_CARLO_PERCENTILES) -> MonteCarloResult:
+        """
+        Runs seeded replications of a route plan across a process pool.
+
+        Args:
+            trucks (Iterable[Truck], optional): The trucks with their planned route runs. Defaults to None (the plan
+                from RouteBuilder, built headless with the seed on the current package state, so each process can plan
+                once).
+            replications (int): The number of replications. Defaults to config.MONTE_CARLO_REPLICATIONS.
+            seed (int): The seed of the first replication, incremented for each following one. Defaults to 0.
+            max_workers (int, optional): The number of worker processes, or 1 to run in this process. Defaults to
+                None (one per CPU).
+            percentiles (Iterable[float]): The finish time percentiles to report.
+                Defaults to config.MONTE_CARLO_PERCENTILES.
+
+        Returns:
+            MonteCarloResult: The on-time probability of every package and the finish time percentiles of every truck.
+
+        Time Complexity: O(k * r * l * p / w), where w is the number of workers.
+        Space Complexity: O(n + k * t)
+        """
+
+        if trucks is None:
+            headless_simulation_enabled = config.HEADLESS_SIMULATION_ENABLED
+            config.HEADLESS_SIMULATION_ENABLED = True
+            random.seed(seed)
+            try:
+                trucks = RouteBuilder.build_optimized_runs()
+            finally:
+                config.HEADLESS_SIMULATION_ENABLED = headless_simulation_enabled
+        package_plan, truck_plan = _get_plan(trucks)
+        seeds = range(seed, seed + replications)
+        max_workers = min(max_workers or os.cpu_count() or 1, replications)
+        if max_workers <= 1:
+            on_time_counts, finish_times = _replicate_all(package_plan, truck_plan, seeds)
+            return MonteCarloResult(replications, on_time_counts, finish_times, percentiles)
+        on_time_counts = {package_id: 0 for package_id in package_plan}
+        finish_times = {truck_id: [] for truck_id, _ in truck_plan}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            batches = [seeds[i::max_workers] for i in range(max_workers)]
+            for batch_on_time_counts, batch_finish_times in executor.map(
+                    _replicate_all, [package_plan] * max_workers, [truck_plan] * max_workers, batches):
+                for package_id, count in batch_on_time_counts.items():
+                    on_time_counts[package_id] += count
+                for truck_id, truck_finish_times in batch_finish_times.items():
+                    finish_times[truck_id].extend(truck_finish_times)
+        return MonteCarloResult(replications, on_time_counts, finish_times, percentiles)
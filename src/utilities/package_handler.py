@@ -1,13 +1,18 @@
 from copy import copy
 from datetime import time
-from typing import Set, Tuple
+from typing import Iterable, List, Set, Tuple
 
 from src import config
 from src.constants.delivery_status import DeliveryStatus
+from src.constants.package_transition import PackageTransition
 from src.exceptions import DelayedPackagesArrivedException, AddressUpdateException
+from src.models.address_index import AddressIndex
 from src.models.location import Location
 from src.models.package import Package
+from src.models.status_timeline import PackageState, StatusTimeline
+from src.models.transition_queue import TransitionQueue
 from src.models.truck import Truck
+from src.utilities.constraint_graph import ConstraintGraph
 from src.utilities.csv_parser import CsvParser
 from src.utilities.custom_hash import CustomHash
 from src.utilities.time_conversion import TimeConversion
@@ -15,44 +20,6 @@ from src.utilities.time_conversion import TimeConversion
 __all__ = ['PackageHandler']
 
 
-def _is_package_arriving_at_hub(package: Package, current_time: time) -> bool:
-    """
-    Checks if a package is arriving at the hub based on its status and the current time.
-
-    Args:
-        package (Package): The package to check.
-        current_time (time): The current time.
-
-    Returns:
-        bool: True if the package is arriving at the hub, False otherwise.
-
-    Time Complexity: O(1)
-    Space Complexity: O(1)
-    """
-
-    return (package.status is DeliveryStatus.ON_ROUTE_TO_DEPOT and
-            TimeConversion.is_time_at_or_before_other_time(package.hub_arrival_time, current_time))
-
-
-def _is_package_address_updating(package: Package, current_time: time) -> bool:
-    """
-    Checks if a package's address is being updated based on the current time and package properties.
-
-    Args:
-        package (Package): The package to check.
-        current_time (time): The current time.
-
-    Returns:
-        bool: True if the package's address is being updated, False otherwise.
-
-    Time Complexity: O(1)
-    Space Complexity: O(1)
-    """
-
-    return (TimeConversion.is_time_at_or_before_other_time(config.PACKAGE_9_ADDRESS_CHANGE_TIME, current_time) and
-            not package.is_verified_address)
-
-
 class PackageHandler:
     """
     A class that handles the management and operations related to packages.
@@ -61,6 +28,9 @@ class PackageHandler:
         all_locations (Tuple[Location]): A tuple of all locations.
         all_packages (Tuple[Package]): A tuple of all packages.
         package_hash (CustomHash): A custom hash data structure used for package lookup.
+        address_index (AddressIndex): The index of the locations by canonicalized street address and zip code.
+        constraint_graph (ConstraintGraph): The delivery constraints compiled from the ingested packages.
+        pending_transitions (TransitionQueue): The scheduled hub arrivals and address updates of the packages.
         Truck.hub_location (Location): The hub location for the trucks.
     """
 
@@ -68,13 +38,20 @@ class PackageHandler:
     all_packages: Tuple[Package] = CsvParser.initialize_packages(all_locations)
     package_hash = CustomHash(config.NUM_TRUCK_CAPACITY)
     package_hash.add_all_packages(all_packages)
+    Package.package_index.rebuild(all_packages)
+    Package.package_store.rebuild(all_packages, all_locations)
+    address_index = AddressIndex(all_locations)
+    constraint_graph = ConstraintGraph(all_locations, all_packages, address_index)
+    pending_transitions = TransitionQueue()
+    pending_transitions.schedule_packages(all_packages)
     Truck.hub_location = [location for location in all_locations if location.is_hub][0]
 
     @staticmethod
     def update_delivery_location(current_time: time, locations_list: Tuple[Location],
                                  package: Package, updated_address: str):
         """
-        Updates the delivery location of a package based on the updated address.
+        Updates the delivery location of a package based on the updated address, which is resolved through the
+            address index.
 
         Args:
             current_time (time): The current time.
@@ -83,61 +60,122 @@ class PackageHandler:
             updated_address (str): The updated address for the package.
 
         Returns:
-            bool: True if the delivery location was successfully updated, False otherwise.
+            bool: False if the updated address did not match a location.
 
-        Time Complexity: O(n)
-        Space Complexity: O(1)
+        Time Complexity: O(a), where a is the length of the address, or O(m * a) for locations other than
+            all_locations, whose index is built first.
+        Space Complexity: O(a)
 
         Raises:
             AddressUpdateException: If the package's location is successfully updated.
         """
 
-        try:
-            address, city, state_zip = updated_address.split(', ')
-            zip_code = int(state_zip.split(' ')[1])
-            for location in locations_list:
-                if str(address).startswith(location.address) and location.zip_code == zip_code:
-                    old_location = package.location
-                    old_location.package_set.remove(package)
-                    package.location = location
-                    package.location.package_set.add(package)
-                    package.is_verified_address = True
-                    package.special_note = '\u001b[9m' + package.special_note + '\033[0m'
-                    package.update_status(package.status, current_time)
-                    raise AddressUpdateException(package, old_location)
-        except (ValueError, TypeError):
+        address_index = (PackageHandler.address_index if locations_list is PackageHandler.all_locations
+                         else AddressIndex(locations_list))
+        location = address_index.find_address(updated_address)
+        if location is None:
             return False
-        return False
+        old_location = package.location
+        old_location.package_set.remove(package)
+        package.location = location
+        package.location.package_set.add(package)
+        package.is_verified_address = True
+        package.special_note = '\u001b[9m' + package.special_note + '\033[0m'
+        package.update_status(package.status, current_time)
+        raise AddressUpdateException(package, old_location)
 
     @staticmethod
-    def bulk_status_update(current_time: time, packages=all_packages):
+    def load_day(filepath: str = config.PACKAGE_CSV_FILE, carryover_packages: Iterable[Package] = ()):
         """
-        Performs a bulk status update for packages based on the current time.
+        Replaces the packages with those of a new day, keeping the locations and their distance data. Undelivered
+            packages from the previous day are carried over after the packages of the new day.
+
+        Args:
+            filepath (str): The filepath of the CSV file of the day's packages. Defaults to config.PACKAGE_CSV_FILE.
+            carryover_packages (Iterable[Package]): The undelivered packages of the previous day. Defaults to none.
+
+        Time Complexity: O(n * m)
+        Space Complexity: O(n + m)
+        """
+
+        for location in PackageHandler.all_locations:
+            location.clear_packages()
+        Package.event_log.clear()
+        StatusTimeline.start_day()
+        packages = CsvParser.initialize_packages(PackageHandler.all_locations, filepath)
+        first_carryover_id = max([package.package_id for package in packages], default=0) + 1
+        packages += CsvParser.initialize_carryover_packages(carryover_packages, first_carryover_id,
+                                                                PackageHandler.address_index)
+        for location in PackageHandler.all_locations:
+            if not location.package_set:
+                location.been_assigned = True
+        PackageHandler.all_packages = packages
+        PackageHandler.package_hash = CustomHash(config.NUM_TRUCK_CAPACITY)
+        PackageHandler.package_hash.add_all_packages(packages)
+        Package.package_index.rebuild(packages)
+        Package.package_store.rebuild(packages, PackageHandler.all_locations)
+        PackageHandler.constraint_graph = ConstraintGraph(PackageHandler.all_locations, packages,
+                                                          PackageHandler.address_index)
+        PackageHandler.schedule_transitions()
+
+    @staticmethod
+    def schedule_transitions():
+        """
+        Replaces the pending transitions with those of the current package states, such as after the packages are
+            restored to a checkpoint.
+
+        Time Complexity: O(n log n)
+        Space Complexity: O(n)
+        """
+
+        PackageHandler.pending_transitions = TransitionQueue()
+        PackageHandler.pending_transitions.schedule_packages(PackageHandler.all_packages)
+
+    @staticmethod
+    def bulk_status_update(current_time: time, packages: Tuple[Package] = None) -> List[Exception]:
+        """
+        Applies the package transitions due at the current time: delayed packages arrive at the hub and expected
+            address updates are made. Every due transition is applied, and the outcome is returned as a batch of
+            update events rather than raised.
 
         Args:
             current_time (time): The current time.
-            packages (Tuple[Package]): The packages to update. Defaults to all_packages.
+            packages (Tuple[Package]): The packages to update. Defaults to None (the pending transitions of
+                all_packages).
 
-        Raises:
-            DelayedPackagesArrivedException: If delayed packages have arrived.
+        Returns:
+            List[Exception]: A DelayedPackagesArrivedException with the packages that arrived, if any,
+                followed by an AddressUpdateException for each address update, in order of due time.
 
-        Time Complexity: O(n)
-        Space Complexity: O(1)
+        Time Complexity: O(d log q) for all packages, where d is the number of due transitions and q the number of
+            pending transitions, O(n log n) otherwise.
+        Space Complexity: O(d)
         """
 
-        delayed_packages_arrived = False
-        for package in packages:
-            if _is_package_arriving_at_hub(package, current_time):
-                package.update_status(DeliveryStatus.AT_HUB, current_time)
-                delayed_packages_arrived = True
-            if _is_package_address_updating(package, current_time):
-                PackageHandler.update_delivery_location(current_time, PackageHandler.all_locations, package,
-                                                        config.EXCEPTED_UPDATES[package.package_id]['address'])
-        if delayed_packages_arrived:
-            raise DelayedPackagesArrivedException
+        if packages is None:
+            transition_queue = PackageHandler.pending_transitions
+        else:
+            transition_queue = TransitionQueue()
+            transition_queue.schedule_packages(packages)
+        arrived_packages = []
+        address_updates = []
+        for transition, package, address in transition_queue.pop_due(TimeConversion.get_seconds(current_time)):
+            if transition is PackageTransition.HUB_ARRIVAL:
+                if package.status is DeliveryStatus.ON_ROUTE_TO_DEPOT:
+                    package.update_status(DeliveryStatus.AT_HUB, current_time)
+                    arrived_packages.append(package)
+            elif not package.is_verified_address:
+                try:
+                    PackageHandler.update_delivery_location(current_time, PackageHandler.all_locations, package,
+                                                            address)
+                except AddressUpdateException as address_update_exception:
+                    address_updates.append(address_update_exception)
+        if arrived_packages:
+            return [DelayedPackagesArrivedException(arrived_packages)] + address_updates
+        return address_updates
 
     @staticmethod
-    def get_bundled_packages(locations=all_locations, all_location_packages=False,
+    def get_bundled_packages(locations: Tuple[Location] = None, all_location_packages=False,
                              ignore_assigned=False) -> Set[Package]:
         """
         Retrieves bundled packages from specified locations.
@@ -150,16 +188,19 @@ class PackageHandler:
         Returns:
             Set[Package]: Set of bundled packages.
 
-        Time Complexity: O(n)
-        Space Complexity: O(n)
+        Time Complexity: O(r) for all locations, where r is the number of packages retrieved, O(n) otherwise.
+        Space Complexity: O(r)
         """
 
         package_bundle_set = set()
-        for location in locations:
-            if location.has_bundled_package:
-                for package in location.package_set:
-                    if package.bundled_package_set:
-                        package_bundle_set.update(package.bundled_package_set)
+        if locations is None:
+            package_bundle_set.update(*Package.package_index.get_bundle_groups())
+        else:
+            for location in locations:
+                if location.has_bundled_package:
+                    for package in location.package_set:
+                        if package.bundled_package_set:
+                            package_bundle_set.update(package.bundled_package_set)
         if ignore_assigned:
             non_assigned_set = copy(package_bundle_set)
             for package in package_bundle_set:
@@ -174,7 +215,7 @@ class PackageHandler:
         return package_bundle_set
 
     @staticmethod
-    def get_delayed_packages(packages=all_packages, ignore_arrived=False) -> Set[Package]:
+    def get_delayed_packages(packages: Tuple[Package] = None, ignore_arrived=False) -> Set[Package]:
         """
         Retrieves delayed packages based on the hub arrival time and delivery dispatch time.
 
@@ -185,22 +226,27 @@ class PackageHandler:
         Returns:
             Set[Package]: Set of delayed packages.
 
-        Time Complexity: O(n)
-        Space Complexity: O(n)
+        Time Complexity: O(r) for all packages, where r is the number of packages retrieved, O(n) otherwise.
+        Space Complexity: O(r)
 
         """
 
+        if packages is None:
+            delayed_packages = Package.package_index.get_packages_released_after(config.DELIVERY_DISPATCH_TIME)
+            if ignore_arrived:
+                delayed_packages = set([package for package in delayed_packages
+                                        if package.status != DeliveryStatus.AT_HUB])
+            return delayed_packages
         delayed_packages = set()
         for package in packages:
-            if (TimeConversion.get_datetime(package.hub_arrival_time) >
-                    TimeConversion.get_datetime(config.DELIVERY_DISPATCH_TIME)):
+            if package.hub_arrival_time > config.DELIVERY_DISPATCH_TIME:
                 if ignore_arrived and package.status == DeliveryStatus.AT_HUB:
                     continue
                 delayed_packages.add(package)
         return delayed_packages
 
     @staticmethod
-    def get_assigned_truck_packages(truck_id: int = None, packages=all_packages):
+    def get_assigned_truck_packages(truck_id: int = None, packages: Tuple[Package] = None):
         """
         Retrieves packages assigned to a specific truck.
 
@@ -211,10 +257,12 @@ class PackageHandler:
         Returns:
             Set[Package]: Set of packages assigned to the specified truck.
 
-        Time Complexity: O(n)
-        Space Complexity: O(n)
+        Time Complexity: O(r) for all packages, where r is the number of packages retrieved, O(n) otherwise.
+        Space Complexity: O(r)
         """
 
+        if packages is None:
+            return Package.package_index.get_truck_packages(truck_id)
         truck_packages = set()
         for package in packages:
             if package.assigned_truck_id:
@@ -224,7 +272,8 @@ class PackageHandler:
 
     @staticmethod
     def get_all_expected_status_update_times(special_times=None, start_time=config.PACKAGE_ARRIVAL_STATUS_UPDATE_TIME,
-                                             end_time=config.DELIVERY_RETURN_TIME, in_locations=all_locations):
+                                             end_time=config.DELIVERY_RETURN_TIME,
+                                             in_locations: Tuple[Location] = None):
         """
         Retrieves all expected status update times based on the provided parameters.
 
@@ -245,19 +294,31 @@ class PackageHandler:
         status_updates_times = set()
         if special_times:
             status_updates_times = status_updates_times.union(special_times)
-        start_date_time = TimeConversion.get_datetime(start_time)
-        end_date_time = TimeConversion.get_datetime(end_time)
-        for location in in_locations:
-            if location.earliest_deadline:
-                earliest_deadline = TimeConversion.get_datetime(location.earliest_deadline)
-                if start_date_time <= earliest_deadline < end_date_time:
-                    status_updates_times.add(earliest_deadline.time())
-            if location.latest_package_arrival:
-                latest_package_arrival_time = TimeConversion.get_datetime(location.latest_package_arrival)
-                if start_date_time <= latest_package_arrival_time < end_date_time:
-                    status_updates_times.add(latest_package_arrival_time.time())
+        for location in PackageHandler.all_locations if in_locations is None else in_locations:
+            if location.earliest_deadline and start_time <= location.earliest_deadline < end_time:
+                status_updates_times.add(location.earliest_deadline)
+            if location.latest_package_arrival and start_time <= location.latest_package_arrival < end_time:
+                status_updates_times.add(location.latest_package_arrival)
         return status_updates_times
 
+    @staticmethod
+    def get_packages_due_by(end_time: time) -> Set[Package]:
+        """
+        Retrieves the packages with a delivery deadline at or before the given time.
+
+        Args:
+            end_time (time): The time.
+
+        Returns:
+            Set[Package]: A set of packages.
+
+        Time Complexity: O(log d + r), where d is the number of distinct deadlines and r the number of packages
+            retrieved.
+        Space Complexity: O(r)
+        """
+
+        return Package.package_index.get_packages_due_by(end_time)
+
     @staticmethod
     def get_package_locations(in_packages: Set[Package], ignore_assigned=False) -> Set[Location]:
         """
@@ -281,7 +342,8 @@ class PackageHandler:
         return locations
 
     @staticmethod
-    def get_available_packages(current_time: time, in_packages=all_packages, ignore_assigned=False) -> Set[Package]:
+    def get_available_packages(current_time: time, in_packages: Tuple[Package] = None,
+                               ignore_assigned=False) -> Set[Package]:
         """
         Retrieves the available packages based on the current time.
 
@@ -293,10 +355,17 @@ class PackageHandler:
         Returns:
             Set[Package]: A set of available packages.
 
-        Time Complexity: O(n)
-        Space Complexity: O(n)
+        Time Complexity: O(r) for all packages, where r is the number of packages released by the current time, O(n)
+            otherwise.
+        Space Complexity: O(r)
         """
 
+        if in_packages is None:
+            available_packages = Package.package_index.get_released_packages(current_time)
+            if ignore_assigned:
+                available_packages = set([package for package in available_packages
+                                          if not package.location.been_assigned])
+            return available_packages
         available_packages = set()
         for package in in_packages:
             if package.location.been_assigned and ignore_assigned:
@@ -306,7 +375,7 @@ class PackageHandler:
         return available_packages
 
     @staticmethod
-    def get_unconfirmed_packages(in_packages=all_packages):
+    def get_unconfirmed_packages(in_packages: Tuple[Package] = None):
         """
         Retrieves the unconfirmed packages from the given packages.
 
@@ -316,10 +385,12 @@ class PackageHandler:
         Returns:
             Set[Package]: A set of unconfirmed packages.
 
-        Time Complexity: O(n)
-        Space Complexity: O(n)
+        Time Complexity: O(r) for all packages, where r is the number of packages retrieved, O(n) otherwise.
+        Space Complexity: O(r)
         """
 
+        if in_packages is None:
+            return Package.package_index.get_unconfirmed_packages()
         unconfirmed_packages = set()
         for package in in_packages:
             if not package.is_verified_address:
@@ -338,14 +409,34 @@ class PackageHandler:
         Returns:
             Package: A snapshot of the package at the target time.
 
-        Time Complexity: O(n)
+        Time Complexity: O(log k), where k is the number of status updates of the package.
         Space Complexity: O(1)
         """
 
         snapshot_package = copy(package)
-        update_time, snapshot_update = package.find_package_state_at_time(target_time)
-        snapshot_package.location = snapshot_update['location']
-        snapshot_package.status = snapshot_update['status']
-        snapshot_package.special_note = snapshot_update['special_note']
-        snapshot_package.is_verified_address = snapshot_update['is_verified_address']
+        package_state = package.status_timeline.get_state_at_time(target_time, package.package_id)
+        snapshot_package.location = package_state.location
+        snapshot_package.status = package_state.status
+        snapshot_package.special_note = package_state.special_note
+        snapshot_package.is_verified_address = package_state.is_verified_address
         return snapshot_package
+
+    @staticmethod
+    def get_package_states_at_time(target_time: time, packages: Iterable[Package] = None) -> List[PackageState]:
+        """
+        Retrieves the state of every package at the target time without copying the packages.
+
+        Args:
+            target_time (time): The target time.
+            packages (Iterable[Package], optional): The packages. Defaults to None (all_packages).
+
+        Returns:
+            List[PackageState]: The state of each package, in order of package ID.
+
+        Time Complexity: O(n log n + n log k)
+        Space Complexity: O(n)
+        """
+
+        packages = PackageHandler.all_packages if packages is None else packages
+        return [package.status_timeline.get_state_at_time(target_time, package.package_id)
+                for package in sorted(packages, key=lambda _package: _package.package_id)]
@@ -0,0 +1,239 @@
+from datetime import time
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from src import config
+from src.constants.delivery_status import DeliveryStatus
+from src.constants.run_info import RunInfo
+from src.exceptions import AddressUpdateException, ReplanningError
+from src.models.location import Location
+from src.models.package import Package
+from src.models.route_run import RouteRun
+from src.models.truck import Truck
+from src.utilities.package_handler import PackageHandler
+from src.utilities.run_planner import RunPlanner
+
+__all__ = ['IncrementalReplanner']
+
+
+def _get_driven_route(truck: Truck) -> List[Location]:
+    """
+    Retrieves the locations a truck has driven to on its current route run, ending at its current location.
+
+    Args:
+        truck (Truck): The truck on a route run.
+
+    Returns:
+        List[Location]: The driven locations, starting at the hub.
+
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+    """
+
+    analysis_dict = truck.current_run.run_analysis_dict[(truck.previous_location, truck.current_location)]
+    return list(analysis_dict[RunInfo.LOCATIONS_VISITED])
+
+
+def _get_delivering_run(trucks: Iterable[Truck], package: Package,
+                        location: Location) -> Optional[Tuple[Truck, RouteRun, bool]]:
+    """
+    Finds the route run that was going to deliver a package at a location, which is the first run still to reach
+        the location and that carries the package.
+
+    Args:
+        trucks (Iterable[Truck]): The trucks with their current and pending route runs.
+        package (Package): The package.
+        location (Location): The location the package was going to be delivered at.
+
+    Returns:
+        Tuple[Truck, RouteRun, bool]: The truck, the run, and a flag indicating if the run is in progress, or None if
+            no run is still to reach the location with the package.
+
+    Time Complexity: O(r * n)
+    Space Complexity: O(1)
+    """
+
+    for truck in sorted(trucks, key=lambda _truck: _truck.truck_id):
+        run = truck.current_run
+        if run is not None and location in run.ordered_route and (package in run.required_packages or
+                                                                   truck.is_package_on_truck(package)):
+            return truck, run, True
+        for run in sorted(truck.route_runs):
+            if location in run.ordered_route[1:] and package in run.required_packages:
+                return truck, run, False
+    return None
+
+
+def _revise_run(truck: Truck, run: RouteRun, is_in_progress: bool, revise: Callable[[RouteRun, int], bool]) -> bool:
+    """
+    Revises the part of a route run the truck has not yet driven, restoring the run if the revision fails.
+
+    Args:
+        truck (Truck): The truck of the run.
+        run (RouteRun): The route run.
+        is_in_progress (bool): Flag indicating if the truck is driving the run.
+        revise (Callable[[RouteRun, int], bool]): The revision, given the run with its full ordered route from the
+            hub departure and the first route index that may be changed, returning False if it failed.
+
+    Returns:
+        bool: True if the run was revised, False otherwise.
+
+    Time Complexity: O(v + n), where v is the time complexity of the revision.
+    Space Complexity: O(n)
+    """
+
+    # The revisions reassign the run's attributes rather than mutating them, so a shallow copy restores the run.
+    previous_state = dict(vars(run))
+    if not is_in_progress:
+        is_revised = revise(run, 1)
+    else:
+        driven_route = _get_driven_route(truck)
+        run.ordered_route = driven_route + run.ordered_route
+        is_revised = revise(run, len(driven_route) + 1)
+        run.ordered_route = run.ordered_route[len(driven_route):]
+    if not is_revised:
+        vars(run).update(previous_state)
+    return is_revised
+
+
+def _move_to_pending_run(truck: Truck, run: RouteRun, package: Package) -> Optional[RouteRun]:
+    """
+    Moves a package from a route run to a later pending run of the same truck with room for it that can deliver it at
+        its new location while meeting its requirements, in order of start time. A package on the truck stays on it
+        through the hub return, and one still at the hub is loaded for the later run instead.
+
+    Args:
+        truck (Truck): The truck.
+        run (RouteRun): The route run that was going to deliver the package.
+        package (Package): The package, with its new location.
+
+    Returns:
+        RouteRun: The pending run now delivering the package, or None if no pending run can deliver it.
+
+    Time Complexity: O(r * (n^3 + k * n^4)), where r is the number of pending runs.
+    Space Complexity: O(n)
+    """
+
+    if package.bundled_package_set:
+        return None
+    for pending_run in sorted(truck.route_runs):
+        if (pending_run is run or pending_run.start_time < run.start_time or
+                len(pending_run.required_packages) >= config.NUM_TRUCK_CAPACITY):
+            continue
+        pending_run.required_packages.add(package)
+        if _revise_run(truck, pending_run, False, lambda revised_run, first_index: RunPlanner.repair(
+                revised_run, first_index, [package.location])):
+            run.required_packages.discard(package)
+            return pending_run
+        pending_run.required_packages.discard(package)
+    return None
+
+
+def _merge_package_constraints(location: Location, package: Package):
+    """
+    Tightens the deadline and latest hub arrival of a location with a package re-routed to it.
+
+    Args:
+        location (Location): The new location of the package.
+        package (Package): The package.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    if not location.earliest_deadline or package.deadline < location.earliest_deadline:
+        location.set_earliest_deadline(package.deadline)
+    if not location.latest_package_arrival or location.latest_package_arrival < package.hub_arrival_time:
+        location.latest_package_arrival = package.hub_arrival_time
+
+
+class IncrementalReplanner:
+    """
+    Revises route runs in place when a disruption occurs during the deliveries.
+
+    Only the runs affected by the disruption are changed, and only the part of each run the truck has not yet
+        driven: the location the truck is heading to stays fixed, any later locations may be reordered. Locations
+        left without packages are removed and new ones are inserted at their cheapest feasible position before the
+        run is shortened with local search, so a revision takes milliseconds rather than a new plan.
+    """
+
+    @staticmethod
+    def replan(trucks: Iterable[Truck], package: Package, old_location: Location) -> List[RouteRun]:
+        """
+        Re-plans the route run that was going to deliver a package at its old location after the package's address
+            changed, routing the run to the package's new location instead. If the run cannot reach the new location
+            while meeting its requirements, the package moves to a later run of the same truck that can, or else the
+            new location is appended to the end of the run, where the package may be delivered late.
+
+        Args:
+            trucks (Iterable[Truck]): The trucks with their current and pending route runs.
+            package (Package): The package, with its new location.
+            old_location (Location): The location the package was going to be delivered at.
+
+        Returns:
+            List[RouteRun]: The re-planned runs, empty if no run was still to deliver the package at its old location.
+
+        Raises:
+            ReplanningError: If no run can be re-planned to deliver the package, in which case every run keeps its
+                previous route and the new location its previous constraints.
+
+        Time Complexity: O(r * (n^3 + k * n^4)), where r is the number of runs of the truck and k is the number of
+            improving moves.
+        Space Complexity: O(n)
+        """
+
+        if package.status is DeliveryStatus.DELIVERED or package.location is old_location:
+            return []
+        delivering_run = _get_delivering_run(trucks, package, old_location)
+        if delivering_run is None:
+            return []
+        truck, run, is_in_progress = delivering_run
+        location = package.location
+        previous_constraints = (location.earliest_deadline, location.latest_package_arrival,
+                                location.has_rerouted_package)
+        _merge_package_constraints(location, package)
+        location.has_rerouted_package = True
+        remove_locations = [old_location] if all(
+            old_package.status is DeliveryStatus.DELIVERED for old_package in old_location.package_set) else []
+        if _revise_run(truck, run, is_in_progress, lambda revised_run, first_index: RunPlanner.repair(
+                revised_run, first_index, [location], remove_locations)):
+            return [run]
+        pending_run = _move_to_pending_run(truck, run, package)
+        if pending_run is not None:
+            return [pending_run]
+        if _revise_run(truck, run, is_in_progress, lambda revised_run, first_index: RunPlanner.append(
+                revised_run, first_index, location)):
+            return [run]
+        location.earliest_deadline, location.latest_package_arrival, location.has_rerouted_package = (
+            previous_constraints)
+        raise ReplanningError(run, package)
+
+    @staticmethod
+    def update_address(trucks: Iterable[Truck], package: Package, updated_address: str,
+                       current_time: time) -> List[RouteRun]:
+        """
+        Updates the delivery address of a package, such as one reported during the deliveries, and re-plans the
+            route run that was going to deliver it.
+
+        Args:
+            trucks (Iterable[Truck]): The trucks with their current and pending route runs.
+            package (Package): The package.
+            updated_address (str): The updated address, formatted as "Address, City, State Zip".
+            current_time (time): The time of the update.
+
+        Returns:
+            List[RouteRun]: The re-planned runs, empty if the address did not match a location or no run was still to
+                deliver the package.
+
+        Raises:
+            ReplanningError: If no run can be re-planned to deliver the package.
+
+        Time Complexity: O(n^3 + k * n^4)
+        Space Complexity: O(n)
+        """
+
+        try:
+            PackageHandler.update_delivery_location(current_time, PackageHandler.all_locations, package,
+                                                    updated_address)
+        except AddressUpdateException as address_update_exception:
+            return IncrementalReplanner.replan(trucks, package, address_update_exception.old_location)
+        return []
@@ -1,6 +1,6 @@
 import random
 from copy import copy
-from typing import Set
+from typing import Dict, Set
 
 from src import config
 from src.constants.color import Color
@@ -13,6 +13,7 @@ from src.models.route_run import RouteRun
 from src.models.truck import Truck
 from src.utilities.package_handler import PackageHandler
 from src.utilities.run_planner import RunPlanner
+from src.utilities.savings_planner import SavingsPlanner
 from src.utilities.time_conversion import TimeConversion
 from src.ui import UI
 
@@ -264,8 +265,8 @@ def _analyze_target_location(index_number: int, target_location: Location):
         if target_location.has_bundled_package:
             UI.print(f'Checking if bundled package locations match are required to be assigned to the same truck',
                      think=True)
-            if not (PackageHandler.get_bundled_packages(all_location_packages=True)
-                    .intersection(PackageHandler.get_assigned_truck_packages())):
+            if PackageHandler.constraint_graph.bundle_locations.isdisjoint(
+                    PackageHandler.constraint_graph.get_pinned_locations()):
                 UI.print('No conflicts detected.', sleep_seconds=4, color=Color.GREEN)
             return RunFocus.BUNDLED_PACKAGE
 
@@ -279,20 +280,21 @@ def _initialize_trucks(required_truck_ids: Set[int], number_of_delivery_trucks=c
         number_of_delivery_trucks (int): The total number of delivery trucks.
 
     Returns:
-        Tuple[Set[Truck], Set[Truck]]: A tuple containing the available trucks and unavailable trucks.
+        Tuple[Dict[int, Truck], Dict[int, Truck]]: A tuple containing the available trucks and unavailable trucks,
+            keyed by truck ID.
 
-    Time Complexity: O(n * m)
+    Time Complexity: O(n + m)
     Space Complexity: O(n)
     """
 
-    available_trucks: Set[Truck] = {Truck(truck_id) for truck_id in range(1, number_of_delivery_trucks + 1)}
-    unavailable_trucks = set()
+    available_trucks: Dict[int, Truck] = {truck_id: Truck(truck_id)
+                                          for truck_id in range(1, number_of_delivery_trucks + 1)}
+    unavailable_trucks: Dict[int, Truck] = dict()
     for truck_id in required_truck_ids:
-        for truck in copy(available_trucks):
-            if truck_id == truck.truck_id:
-                truck.has_assigned_packages = True
-                unavailable_trucks.add(truck)
-                available_trucks.remove(truck)
+        if truck_id in available_trucks:
+            truck = available_trucks.pop(truck_id)
+            truck.has_assigned_packages = True
+            unavailable_trucks[truck_id] = truck
     return available_trucks, unavailable_trucks
 
 
@@ -365,7 +367,7 @@ def _analyze_route_run(index_number: int, run: RouteRun):
                      sleep_seconds=1, color=Color.BLUE)
             for package in packages:
                 _display_package_details(package)
-            print()
+            UI.print('', log_enabled=False)
         visited_locations.append(location)
     if run.ordered_route[-1].is_hub:
         UI.print(f'Expected arrival back at the hub is {run.estimated_completion_time}',
@@ -377,22 +379,22 @@ def _analyze_route_run(index_number: int, run: RouteRun):
                      color=Color.RED, sleep_seconds=4, extra_lines=1)
             for package in undelivered_packages:
                 _display_package_details(package)
-            print()
+            UI.print('', log_enabled=False)
     UI.print(f'\nThe total expected miles on this run is {run.estimated_mileage:.1f} '
              f'with an expected completion time of {run.estimated_completion_time} |'
              f' The expected package delivery total is {run.package_total()}',
              sleep_seconds=7, color=Color.GREEN, extra_lines=3)
 
 
-def _select_truck_for_run(target_location: Location, available_truck_pool: Set[Truck],
-                          unavailable_truck_pool: Set[Truck]) -> Truck:
+def _select_truck_for_run(target_location: Location, available_truck_pool: Dict[int, Truck],
+                          unavailable_truck_pool: Dict[int, Truck]) -> Truck:
     """
        Selects a truck for a run based on the target location and the available and unavailable truck pools.
 
        Args:
            target_location (Location): The target location for the run.
-           available_truck_pool (Set[Truck]): The set of available trucks.
-           unavailable_truck_pool (Set[Truck]): The set of unavailable trucks.
+           available_truck_pool (Dict[int, Truck]): The available trucks keyed by truck ID.
+           unavailable_truck_pool (Dict[int, Truck]): The unavailable trucks keyed by truck ID.
 
        Returns:
            Truck: The selected truck for the run.
@@ -407,31 +409,24 @@ def _select_truck_for_run(target_location: Location, available_truck_pool: Set[T
         remaining_ids = set([package.assigned_truck_id for package in PackageHandler.all_packages
                              if package.assigned_truck_id and not package.location.been_assigned])
         target_location.assigned_truck_id = remaining_ids.pop()
-    for available_truck in copy(available_truck_pool):
-        if (isinstance(target_location, Location) and (target_location.has_required_truck_package or
-                                                       target_location.assigned_truck_id)):
-            if target_location.assigned_truck_id and available_truck.truck_id == target_location.assigned_truck_id:
-                truck = available_truck
-        elif isinstance(target_location, dict):
-            truck_id, target_set = copy(target_location).popitem()
-            if truck_id == available_truck.truck_id:
-                truck = available_truck
-        else:
-            truck = random.choice(list(available_truck_pool))
-            break
-    if truck:
-        available_truck_pool.remove(truck)
-        unavailable_truck_pool.add(truck)
-    if not truck:
+    if (isinstance(target_location, Location) and (target_location.has_required_truck_package or
+                                                   target_location.assigned_truck_id)):
+        truck = available_truck_pool.get(target_location.assigned_truck_id)
+    elif isinstance(target_location, dict):
+        truck_id, target_set = copy(target_location).popitem()
+        truck = available_truck_pool.get(truck_id)
+    elif available_truck_pool:
+        truck = random.choice(list(available_truck_pool.values()))
+    if truck is not None:
+        unavailable_truck_pool[truck.truck_id] = available_truck_pool.pop(truck.truck_id)
+    else:
         truck_id = None
         if isinstance(target_location, Location) and target_location.assigned_truck_id and unavailable_truck_pool:
             truck_id = target_location.assigned_truck_id
         elif isinstance(target_location, dict):
             paired_target_id, target_set = copy(target_location).popitem()
             truck_id = paired_target_id
-        for unavailable_truck in unavailable_truck_pool:
-            if unavailable_truck.truck_id == truck_id:
-                truck = unavailable_truck
+        truck = unavailable_truck_pool.get(truck_id)
     return truck
 
 
@@ -469,7 +464,7 @@ def _create_optimized_runs(targets) -> Set[Truck]:
     required_truck_ids = set([pair.keys() for pair in targets if isinstance(pair, dict)].pop())
     UI.print('Finding available delivery trucks', think=True, color=Color.YELLOW)
     available_truck_pool, unavailable_truck_pool = _initialize_trucks(required_truck_ids)
-    UI.print(f'{len(available_truck_pool.union(unavailable_truck_pool))} trucks found', sleep_seconds=4, extra_lines=1)
+    UI.print(f'{len(available_truck_pool) + len(unavailable_truck_pool)} trucks found', sleep_seconds=4, extra_lines=1)
     run_set = set()
     for i, target_location in enumerate(targets):
         run = None
@@ -506,7 +501,7 @@ def _create_optimized_runs(targets) -> Set[Truck]:
         UI.print(f'All deliveries expected to be completed by {latest_time} with a total mileage of {total_mileage:.1f}'
                  , extra_lines=1, sleep_seconds=3)
         UI.print('Continuing to "Deliveries" phase', color=Color.YELLOW, think=True, extra_lines=3)
-    return available_truck_pool.union(unavailable_truck_pool)
+    return set(available_truck_pool.values()).union(unavailable_truck_pool.values())
 
 
 class RouteBuilder:
@@ -514,7 +509,8 @@ class RouteBuilder:
     @staticmethod
     def build_optimized_runs():
         """
-        Builds optimized runs based on the best targets.
+        Builds optimized runs based on the best targets, or with the savings constructor when
+            config.SAVINGS_CONSTRUCTOR_ENABLED is set.
 
         Returns:
             Set[Truck]: The set of trucks assigned to the runs.
@@ -523,6 +519,9 @@ class RouteBuilder:
         Space Complexity: O(n)
         """
 
+        if config.SAVINGS_CONSTRUCTOR_ENABLED:
+            UI.print('Building runs by merging hub round trips with the highest savings', think=True, extra_lines=1)
+            return SavingsPlanner.build_runs()
         best_targets = _calculate_best_targets()
         assigned_trucks = _create_optimized_runs(best_targets)
         return assigned_trucks
@@ -77,8 +77,8 @@ def _combine_closest_locations(run: RouteRun, closest_location, next_closest_loc
         available_location_pool = _get_available_locations(run.start_time)
         while len(run.locations) < minimum and len(run.locations) <= len(available_location_pool):
             if any([_location for _location in run.locations if _location.has_bundled_package]):
-                bundle_locations = PackageHandler.get_package_locations(
-                    PackageHandler.get_bundled_packages(ignore_assigned=True))
+                bundle_locations = set([location for location in PackageHandler.constraint_graph.bundle_locations
+                                        if not location.been_assigned])
                 run.locations.update(bundle_locations)
             target_best = _best_closest_location(run, run.target_location)
             closest_best = _best_closest_location(run, closest_location)
@@ -104,8 +104,9 @@ def _get_focused_targets(run: RouteRun, minimum=8):
     """
     if run.focused_run is RunFocus.ASSIGNED_TRUCK:
         run.locations.add(run.target_location)
-        run.locations.update(PackageHandler.get_package_locations(
-            PackageHandler.get_assigned_truck_packages(truck_id=run.assigned_truck_id), ignore_assigned=True))
+        run.locations.update([location for location in
+                              PackageHandler.constraint_graph.get_pinned_locations(truck_id=run.assigned_truck_id)
+                              if not location.been_assigned])
 
     if len(run.locations) < minimum and run.package_total() <= config.NUM_TRUCK_CAPACITY:
         highest_sum_of_miles_sorted_locations = (sorted(run.locations,
@@ -210,6 +211,7 @@ def _fill_in(run: RouteRun, allowable_extra_mileage=3.5):
             for location, mileage in last_location_dict:
                 if mileage <= allowable_extra_mileage:
                     if (_is_valid_fill_in(run, location) and location not in run.ordered_route and
+                            not _is_assigned_to_other_truck(run, location) and
                             run.package_total(set(run.ordered_route).union({location})) < config.NUM_TRUCK_CAPACITY):
                         run.ordered_route.append(location)
                         continue
@@ -459,13 +461,13 @@ def _get_delayed_locations(run: RouteRun):
     Returns:
         set: The set of delayed locations.
 
-    Time Complexity: O(n)
-    Space Complexity: O(n)
+    Time Complexity: O(k), where k is the number of delayed locations.
+    Space Complexity: O(k)
     """
 
-    delayed_packages = PackageHandler.get_delayed_packages(ignore_arrived=True)
-    delayed_locations = PackageHandler.get_package_locations(delayed_packages)
-    return delayed_locations.difference(_get_available_locations(run.start_time, ignore_assigned=True))
+    constraint_graph = PackageHandler.constraint_graph
+    return set([location for location in constraint_graph.delayed_locations if location.been_assigned or
+                not _is_earlier_time(constraint_graph.get_release_time(location), run.start_time)])
 
 
 def _get_unconfirmed_locations(run: RouteRun):
@@ -478,13 +480,13 @@ def _get_unconfirmed_locations(run: RouteRun):
     Returns:
         set: The set of unconfirmed locations.
 
-    Time Complexity: O(n)
-    Space Complexity: O(n)
+    Time Complexity: O(k), where k is the number of unconfirmed locations.
+    Space Complexity: O(k)
     """
 
-    unconfirmed_packages = PackageHandler.get_unconfirmed_packages()
-    unconfirmed_locations = PackageHandler.get_package_locations(unconfirmed_packages)
-    return unconfirmed_locations.intersection(_get_available_locations(run.start_time, ignore_assigned=True))
+    constraint_graph = PackageHandler.constraint_graph
+    return set([location for location in constraint_graph.unconfirmed_locations if not location.been_assigned and
+                _is_earlier_time(constraint_graph.get_release_time(location), run.start_time)])
 
 
 def _get_assigned_truck_locations(run: RouteRun):
@@ -497,15 +499,34 @@ def _get_assigned_truck_locations(run: RouteRun):
     Returns:
         set: The set of assigned truck locations.
 
-    Time Complexity: O(n)
-    Space Complexity: O(n)
+    Time Complexity: O(k), where k is the number of locations restricted to a truck.
+    Space Complexity: O(k)
+    """
+
+    if not run.assigned_truck_id:
+        return set()
+    constraint_graph = PackageHandler.constraint_graph
+    return set([location for location in constraint_graph.get_pinned_locations()
+                if constraint_graph.get_truck_pin(location) != run.assigned_truck_id])
+
+
+def _is_assigned_to_other_truck(run: RouteRun, location: Location) -> bool:
+    """
+    Check if the given location has a package assigned to a truck other than the route run's truck.
+
+    Args:
+        run (RouteRun): The route run.
+        location (Location): The location to check.
+
+    Returns:
+        bool: True if a package at the location is assigned to another truck, False otherwise.
+
+    Time Complexity: O(p), where p is the number of packages at the location.
+    Space Complexity: O(1)
     """
 
-    all_assigned_truck_packages = PackageHandler.get_assigned_truck_packages()
-    all_run_assigned_packages = PackageHandler.get_assigned_truck_packages(truck_id=run.assigned_truck_id)
-    all_assigned_truck_locations = PackageHandler.get_package_locations(all_assigned_truck_packages)
-    all_run_assigned_locations = PackageHandler.get_package_locations(all_run_assigned_packages)
-    return all_assigned_truck_locations - all_run_assigned_locations
+    return run.assigned_truck_id is not None and any(
+        [package.assigned_truck_id not in (None, run.assigned_truck_id) for package in location.package_set])
 
 
 def _in_close_proximity_to_locations(in_location: Location, target_locations: Set[Location], distance=1.75) -> bool:
@@ -648,7 +669,7 @@ def _is_earlier_time(first_time: time, second_time: time):
     Space Complexity: O(1)
     """
 
-    return TimeConversion.is_time_at_or_before_other_time(first_time, second_time)
+    return first_time <= second_time
 
 
 def _get_run_analysis_dict(run: RouteRun):
@@ -864,12 +885,217 @@ def _simulate_load(run: RouteRun, truck: Truck):
     run.required_packages = truck.unload()
 
 
+def _get_route_mileage(ordered_route) -> float:
+    """
+    Calculates the total mileage of an ordered route.
+
+    Args:
+        ordered_route (List[Location]): The ordered route.
+
+    Returns:
+        float: The total mileage of the route.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+
+    return sum([ordered_route[i - 1].distance(ordered_route[i]) for i in range(1, len(ordered_route))])
+
+
+def _is_traversable_route(ordered_route) -> bool:
+    """
+    Checks that an ordered route never stays at the same location and never repeats a leg, since the run analysis
+        dictionary is keyed by legs.
+
+    Args:
+        ordered_route (List[Location]): The ordered route.
+
+    Returns:
+        bool: True if the route can be analyzed and simulated, False otherwise.
+
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+    """
+
+    legs = set()
+    for i in range(1, len(ordered_route)):
+        leg = (ordered_route[i - 1], ordered_route[i])
+        if leg[0] is leg[1] or leg in legs:
+            return False
+        legs.add(leg)
+    return True
+
+
+def _is_updated_location_after_update(ordered_route) -> bool:
+    """
+    Checks that the corrected location of every package awaiting an address update is only reached after the
+        location it is waiting at, so the package is delivered once its address has been updated.
+
+    Args:
+        ordered_route (List[Location]): The ordered route.
+
+    Returns:
+        bool: True if no corrected location is reached before its package's original location, False otherwise.
+
+    Time Complexity: O(n^2)
+    Space Complexity: O(n)
+    """
+
+    for i, location in enumerate(ordered_route):
+        address_update = PackageHandler.constraint_graph.get_address_update(location)
+        if address_update and address_update[1] in ordered_route[:i]:
+            return False
+    return True
+
+
+def _is_valid_reordering(run: RouteRun, ordered_route) -> bool:
+    """
+    Checks if a reordered route still meets every requirement of the run.
+
+    Args:
+        run (RouteRun): The route run.
+        ordered_route (List[Location]): The reordered route.
+
+    Returns:
+        bool: True if every location of the reordered route meets its requirements, False otherwise.
+
+    Time Complexity: O(n^2)
+    Space Complexity: O(n)
+    """
+
+    if not _is_traversable_route(ordered_route) or not _is_updated_location_after_update(ordered_route):
+        return False
+    original_route, error_type, error_location = run.ordered_route, run.error_type, run.error_location
+    run.ordered_route = ordered_route
+    run_analysis_dict = _get_run_analysis_dict(run)
+    run.ordered_route, run.error_type, run.error_location = original_route, error_type, error_location
+    return all([info[RunInfo.IS_VALID_RUN_AT_LOCATION] for info in run_analysis_dict.values()])
+
+
+def _get_movable_range(run: RouteRun, first_index: int = 1):
+    """
+    Gets the range of route indexes that may be reordered, keeping the hub departure and any hub return in place.
+
+    Args:
+        run (RouteRun): The route run.
+        first_index (int): The first index that may be reordered. Defaults to 1, after the hub departure.
+
+    Returns:
+        range: The movable route indexes.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    last_index = len(run.ordered_route) - 1
+    if run.ordered_route[last_index].is_hub:
+        last_index -= 1
+    return range(first_index, last_index + 1)
+
+
+def _two_opt_move(run: RouteRun, first_index: int = 1):
+    """
+    Finds the first reversal of a route segment that shortens the run without breaking its requirements.
+
+    Args:
+        run (RouteRun): The route run.
+        first_index (int): The first index that may be reordered. Defaults to 1.
+
+    Returns:
+        List[Location] or None: The improved ordered route, or None if no improving reversal exists.
+
+    Time Complexity: O(n^4)
+    Space Complexity: O(n)
+    """
+
+    route = run.ordered_route
+    route_mileage = _get_route_mileage(route)
+    movable_range = _get_movable_range(run, first_index)
+    for i in movable_range:
+        for j in range(i + 1, movable_range.stop):
+            candidate = route[:i] + route[i:j + 1][::-1] + route[j + 1:]
+            if not _is_traversable_route(candidate):
+                continue
+            if _get_route_mileage(candidate) < route_mileage - 1e-9 and _is_valid_reordering(run, candidate):
+                return candidate
+    return None
+
+
+def _relocate_move(run: RouteRun, first_index: int = 1):
+    """
+    Finds the first relocation of a single location within the route that shortens the run without breaking its
+        requirements.
+
+    Args:
+        run (RouteRun): The route run.
+        first_index (int): The first index that may be reordered. Defaults to 1.
+
+    Returns:
+        List[Location] or None: The improved ordered route, or None if no improving relocation exists.
+
+    Time Complexity: O(n^4)
+    Space Complexity: O(n)
+    """
+
+    route = run.ordered_route
+    route_mileage = _get_route_mileage(route)
+    movable_range = _get_movable_range(run, first_index)
+    for i in movable_range:
+        remaining_route = route[:i] + route[i + 1:]
+        for j in range(first_index, movable_range.stop):
+            if j == i:
+                continue
+            candidate = remaining_route[:j] + [route[i]] + remaining_route[j:]
+            if not _is_traversable_route(candidate):
+                continue
+            if _get_route_mileage(candidate) < route_mileage - 1e-9 and _is_valid_reordering(run, candidate):
+                return candidate
+    return None
+
+
+def _get_insertion_index(run: RouteRun, location: Location, first_index: int) -> int:
+    """
+    Finds the cheapest position to insert a location into the reorderable part of a route, preferring positions
+        that keep every requirement of the run met.
+
+    Args:
+        run (RouteRun): The route run.
+        location (Location): The location to insert.
+        first_index (int): The first index that may be reordered.
+
+    Returns:
+        int or None: The index to insert the location at, or None if no part of the route may be reordered.
+
+    Time Complexity: O(n^3)
+    Space Complexity: O(n)
+    """
+
+    route = run.ordered_route
+    movable_range = _get_movable_range(run, first_index)
+
+    def get_added_mileage(index: int) -> float:
+        added_mileage = route[index - 1].distance(location)
+        if index < len(route):
+            added_mileage += location.distance(route[index]) - route[index - 1].distance(route[index])
+        return added_mileage
+
+    indexes = sorted([index for index in range(first_index, movable_range.stop + 1)
+                      if route[index - 1] is not location and (index == len(route) or route[index] is not location)],
+                     key=get_added_mileage)
+    for index in indexes:
+        if _is_valid_reordering(run, route[:index] + [location] + route[index:]):
+            return index
+    return indexes[0] if indexes else None
+
+
 class RunPlanner:
     """
     A class that provides methods for planning and building route runs.
 
     Methods:
         build: Builds a route run based on the target location, truck, and other parameters.
+        refine: Shortens a built route run by reordering its locations.
+        repair: Re-plans the unvisited part of a route run after its locations change.
     """
 
     @staticmethod
@@ -901,8 +1127,8 @@ class RunPlanner:
         elif target_location.been_assigned or target_location.is_hub:
             return
         run.focused_run = run_focus
-        latest_delayed_time = max([package.hub_arrival_time for package in PackageHandler.get_delayed_packages()])
-        if (not _is_earlier_time(run.target_location.earliest_deadline, latest_delayed_time) and
+        latest_delayed_time = PackageHandler.constraint_graph.latest_delayed_arrival
+        if (latest_delayed_time and not _is_earlier_time(run.target_location.earliest_deadline, latest_delayed_time) and
                 run.start_time == config.DELIVERY_DISPATCH_TIME):
             run.start_time = latest_delayed_time
         run.ordered_route = [Truck.hub_location]
@@ -917,3 +1143,167 @@ class RunPlanner:
         run.set_assigned_truck_id()
         truck.route_runs.append(run)
         return run
+
+    @staticmethod
+    def refine(run: RouteRun, max_moves: int = None) -> float:
+        """
+        Shortens a built route run with segment reversal and single location relocation moves, only accepting
+            reorderings that keep every delivery deadline and departure requirement met.
+
+        Args:
+            run (RouteRun): The built route run to refine.
+            max_moves (int, optional): The maximum number of improving moves to apply. Defaults to None (no limit).
+
+        Returns:
+            float: The mileage saved on the run.
+
+        Time Complexity: O(k * n^4), where k is the number of improving moves
+        Space Complexity: O(n)
+        """
+
+        original_mileage = _get_route_mileage(run.ordered_route)
+        if not _is_valid_reordering(run, run.ordered_route):
+            return 0
+        moves = 0
+        while max_moves is None or moves < max_moves:
+            improved_route = _two_opt_move(run) or _relocate_move(run)
+            if not improved_route:
+                break
+            run.ordered_route = improved_route
+            moves += 1
+        if not moves:
+            return 0
+        error_type, error_location = run.error_type, run.error_location
+        run.run_analysis_dict = _get_run_analysis_dict(run)
+        run.error_type, run.error_location = error_type, error_location
+        run.set_estimated_mileage()
+        run.set_estimated_completion_time()
+        return original_mileage - _get_route_mileage(run.ordered_route)
+
+    @staticmethod
+    def repair(run: RouteRun, first_index: int, insert_locations=(), remove_locations=()) -> bool:
+        """
+        Re-plans the part of a route run from the first index onward, removing and inserting locations and then
+            shortening it, while the part before the index is kept as driven. Each inserted location goes to the
+            cheapest position that keeps the requirements of the run met, and the run is then refined with the same
+            moves as refine, restricted to the re-planned part.
+
+        Args:
+            run (RouteRun): The route run, with its full ordered route from the hub departure.
+            first_index (int): The first route index that may be changed, at least 1.
+            insert_locations (Iterable[Location]): The locations to add if not already in the re-planned part or the
+                location just before it.
+            remove_locations (Iterable[Location]): The locations to remove from the re-planned part.
+
+        Returns:
+            bool: True if every location was inserted and the re-planned run meets every requirement, False otherwise.
+
+        Time Complexity: O(i * n^3 + k * n^4), where i is the number of inserted locations and k is the number of
+            improving moves.
+        Space Complexity: O(n)
+        """
+
+        error_type, error_location = run.error_type, run.error_location
+        route = run.ordered_route
+        remove_locations = set(remove_locations)
+        run.ordered_route = route[:first_index]
+        for location in route[first_index:]:
+            # Removing a revisited location's neighbor would otherwise leave the truck staying at the same location.
+            if location not in remove_locations and location is not run.ordered_route[-1]:
+                run.ordered_route.append(location)
+        is_inserted = True
+        for location in insert_locations:
+            if location not in run.ordered_route[first_index - 1:]:
+                index = _get_insertion_index(run, location, first_index)
+                if index is None:
+                    is_inserted = False
+                    continue
+                run.ordered_route = run.ordered_route[:index] + [location] + run.ordered_route[index:]
+        is_valid = is_inserted and _is_valid_reordering(run, run.ordered_route)
+        while is_valid:
+            improved_route = _two_opt_move(run, first_index) or _relocate_move(run, first_index)
+            if not improved_route:
+                break
+            run.ordered_route = improved_route
+        run.locations = set([location for location in run.ordered_route if not location.is_hub])
+        run.run_analysis_dict = _get_run_analysis_dict(run)
+        run.error_type, run.error_location = error_type, error_location
+        run.set_estimated_mileage()
+        run.set_estimated_completion_time()
+        return is_valid
+
+    @staticmethod
+    def append(run: RouteRun, first_index: int, location: Location) -> bool:
+        """
+        Appends a location to the end of a route run, before its hub return, for when no position of the location
+            meets the requirements of the run, such as when a package re-routed to it can only be delivered late. If
+            the truck is already heading back to the hub, it delivers the location from the hub and returns again.
+
+        Args:
+            run (RouteRun): The route run, with its full ordered route from the hub departure.
+            first_index (int): The first route index that may be changed, at least 1.
+            location (Location): The location to append.
+
+        Returns:
+            bool: True if the location was appended or the truck still reaches it on the route, False if the route
+                would repeat a leg, in which case the route is unchanged.
+
+        Time Complexity: O(n^2)
+        Space Complexity: O(n)
+        """
+
+        route = run.ordered_route
+        if location in route[first_index - 1:]:
+            return True
+        index = len(route) - 1 if route[-1].is_hub else len(route)
+        if index >= first_index:
+            ordered_route = route[:index] + [location] + route[index:]
+        else:
+            ordered_route = route + [location, route[-1]]
+        if not _is_traversable_route(ordered_route):
+            return False
+        error_type, error_location = run.error_type, run.error_location
+        run.ordered_route = ordered_route
+        run.locations = set([location for location in run.ordered_route if not location.is_hub])
+        run.run_analysis_dict = _get_run_analysis_dict(run)
+        run.error_type, run.error_location = error_type, error_location
+        run.set_estimated_mileage()
+        run.set_estimated_completion_time()
+        return True
+
+    @staticmethod
+    def build_from_route(ordered_route, truck: Truck, start_time: time) -> RouteRun:
+        """
+        Builds a route run from an ordered route chosen by another constructor, applying the same analysis, truck
+            loading and location assignment as a planned run.
+
+        Args:
+            ordered_route (List[Location]): The ordered route, starting at the hub.
+            truck (Truck): The truck assigned to the route run.
+            start_time (time): The start time for the route run.
+
+        Returns:
+            RouteRun: The constructed route run. If the route does not meet its requirements, the run is returned
+                with its error type set and is not added to the truck.
+
+        Time Complexity: O(n^2)
+        Space Complexity: O(n)
+        """
+
+        run = RouteRun(return_to_hub=ordered_route[-1].is_hub, start_time=start_time)
+        run.ordered_route = list(ordered_route)
+        run.locations = set([location for location in ordered_route if not location.is_hub])
+        run.target_location = max(run.locations, key=lambda _location: _location.hub_distance)
+        run.assigned_truck_id = truck.truck_id
+        run.run_analysis_dict = _get_run_analysis_dict(run)
+        _check_requirements_met(run)
+        if run.error_type:
+            return run
+        _simulate_load(run, truck)
+        _set_locations_as_assigned(run)
+        run.set_required_packages()
+        run.set_estimated_mileage()
+        run.set_estimated_completion_time()
+        run.set_assigned_truck_id()
+        truck.route_runs.append(run)
+        return run
@@ -0,0 +1,399 @@
+import math
+from typing import Dict, List, Set
+
+from src import config
+from src.models.location import Location
+from src.models.truck import Truck
+from src.utilities.fleet_registry import FleetRegistry
+from src.utilities.package_handler import PackageHandler
+from src.utilities.run_planner import RunPlanner
+from src.utilities.time_conversion import TimeConversion
+
+__all__ = ['SavingsPlanner']
+
+
+def _get_route_window(route: List[Location], ready_seconds: int):
+    """
+    Calculates the earliest and latest hub departure for a route that keeps every requirement of its locations met.
+
+    Args:
+        route (List[Location]): The delivery locations of the route in order, excluding the hub.
+        ready_seconds (int): The earliest time in seconds the truck is ready to depart.
+
+    Returns:
+        Tuple[int, int]: The earliest and latest departure in seconds since midnight.
+
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+    """
+
+    seconds_per_mile = 3600 / config.DELIVERY_TRUCK_MPH
+    earliest_departure = ready_seconds
+    latest_departure = math.inf
+    travel_seconds = 0
+    update_seconds = dict()
+    for location in route:
+        address_update = PackageHandler.constraint_graph.get_address_update(location)
+        if address_update:
+            for update_location in {location, address_update[1]}:
+                update_seconds[update_location] = max(update_seconds.get(update_location, 0),
+                                                      TimeConversion.get_seconds(address_update[0]))
+    previous_location = Truck.hub_location
+    for location in route:
+        travel_seconds += previous_location.distance(location) * seconds_per_mile
+        earliest_departure = max(earliest_departure, TimeConversion.get_seconds(location.latest_package_arrival))
+        if location in update_seconds:
+            earliest_departure = max(earliest_departure, math.ceil(update_seconds[location] - travel_seconds))
+        latest_departure = min(latest_departure,
+                               math.floor(TimeConversion.get_seconds(location.earliest_deadline) - travel_seconds))
+        previous_location = location
+    return earliest_departure, latest_departure
+
+
+def _get_round_trip_seconds(route: List[Location]) -> int:
+    """
+    Calculates the travel time in seconds of a route that departs and returns to the hub.
+
+    Args:
+        route (List[Location]): The delivery locations of the route in order, excluding the hub.
+
+    Returns:
+        int: The round trip travel time in seconds.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+
+    stops = [Truck.hub_location] + route + [Truck.hub_location]
+    miles = sum([stops[i - 1].distance(stops[i]) for i in range(1, len(stops))])
+    return math.ceil(miles * 3600 / config.DELIVERY_TRUCK_MPH)
+
+
+def _get_reload_seconds(route: List[Location]) -> int:
+    """
+    Calculates the longest time in seconds it can take to load the packages of a route at the hub.
+
+    Args:
+        route (List[Location]): The delivery locations of the route, excluding the hub.
+
+    Returns:
+        int: The worst case loading time in seconds.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+
+    return sum([len(location.package_set) for location in route]) * config.PACKAGE_LOAD_SPEED_MAX_SECONDS
+
+
+def _get_bundle_groups(locations: List[Location]) -> List[Set[Location]]:
+    """
+    Groups the locations whose packages must be delivered together by the same truck. A package awaiting an address
+        update is grouped with its corrected location, since the truck carrying it has to deliver it there.
+
+    Args:
+        locations (List[Location]): The locations to group.
+
+    Returns:
+        List[Set[Location]]: The groups of bundled locations.
+
+    Time Complexity: O(n^2)
+    Space Complexity: O(n)
+    """
+
+    constraint_graph = PackageHandler.constraint_graph
+    bundle_groups = []
+    for location in locations:
+        groups = []
+        if location in constraint_graph.bundle_locations:
+            groups.append(set(constraint_graph.get_bundle_group(location)))
+        address_update = constraint_graph.get_address_update(location)
+        if address_update and address_update[1]:
+            groups.append({location, address_update[1]})
+        for group in groups:
+            group.intersection_update(locations)
+            for overlapping_group in [bundle_group for bundle_group in bundle_groups if bundle_group & group]:
+                group.update(overlapping_group)
+                bundle_groups.remove(overlapping_group)
+            bundle_groups.append(group)
+    return bundle_groups
+
+
+def _get_nearest_neighbor_order(locations: Set[Location]) -> List[Location]:
+    """
+    Orders locations by repeatedly visiting the nearest unvisited location, starting from the hub.
+
+    Args:
+        locations (Set[Location]): The locations to order.
+
+    Returns:
+        List[Location]: The ordered locations.
+
+    Time Complexity: O(n^2)
+    Space Complexity: O(n)
+    """
+
+    ordered_locations = []
+    remaining_locations = set(locations)
+    current_location = Truck.hub_location
+    while remaining_locations:
+        current_location = min(remaining_locations, key=lambda _location: current_location.distance(_location))
+        ordered_locations.append(current_location)
+        remaining_locations.remove(current_location)
+    return ordered_locations
+
+
+def _get_seed_routes(locations: List[Location]) -> List[List[Location]]:
+    """
+    Builds the routes that merging starts from. Bundled locations share a route, locations restricted to the same
+        truck share as few routes as capacity and deadlines allow, and every other location gets its own round trip.
+
+    Args:
+        locations (List[Location]): The delivery locations.
+
+    Returns:
+        List[List[Location]]: The seed routes, excluding the hub.
+
+    Time Complexity: O(n^2)
+    Space Complexity: O(n)
+    """
+
+    ready_seconds = TimeConversion.get_seconds(config.DELIVERY_DISPATCH_TIME)
+    seed_routes = [_get_nearest_neighbor_order(group) for group in _get_bundle_groups(locations)]
+    seeded_locations = set([location for route in seed_routes for location in route])
+    truck_ids = sorted(_get_route_truck_ids([location for location in locations if location not in seeded_locations]))
+    for truck_id in truck_ids:
+        pinned_locations = set([location for location in locations if location not in seeded_locations and
+                                _get_route_truck_ids([location]) == {truck_id}])
+        pinned_routes = [route for route in seed_routes if _get_route_truck_ids(route) == {truck_id}]
+        route = pinned_routes[0] if pinned_routes else []
+        if not route:
+            seed_routes.append(route)
+        for location in _get_nearest_neighbor_order(pinned_locations):
+            earliest_departure, latest_departure = _get_route_window(route + [location], ready_seconds)
+            if (sum([_location.package_total() for _location in route]) + location.package_total() >
+                    config.NUM_TRUCK_CAPACITY or earliest_departure > latest_departure):
+                route = []
+                seed_routes.append(route)
+            route.append(location)
+            seeded_locations.add(location)
+    seed_routes += [[location] for location in locations if location not in seeded_locations]
+    return [route for route in seed_routes if route]
+
+
+def _get_route_truck_ids(route: List[Location]) -> Set[int]:
+    """
+    Retrieves the truck IDs that packages on the route are restricted to.
+
+    Args:
+        route (List[Location]): The delivery locations of the route.
+
+    Returns:
+        Set[int]: The restricted truck IDs.
+
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+    """
+
+    return set([PackageHandler.constraint_graph.get_truck_pin(location) for location in route
+                if PackageHandler.constraint_graph.get_truck_pin(location)])
+
+
+def _get_savings(locations: List[Location]) -> list:
+    """
+    Calculates the mileage saved by serving each pair of locations on one run instead of two hub round trips,
+        row by row over the distance matrix, sorted by descending savings.
+
+    Args:
+        locations (List[Location]): The delivery locations.
+
+    Returns:
+        list: The (savings, first index, second index) tuples with positive savings.
+
+    Time Complexity: O(n^2 log n)
+    Space Complexity: O(n^2)
+    """
+
+    hub_distances = [location.hub_distance for location in locations]
+    savings = []
+    for i, location in enumerate(locations):
+        distance_row = location.distance_dict
+        savings += [(hub_distances[i] + hub_distances[j] - distance_row[locations[j]], i, j)
+                    for j in range(i + 1, len(locations))]
+    savings = [saving for saving in savings if saving[0] > 0]
+    savings.sort(key=lambda saving: saving[0], reverse=True)
+    return savings
+
+
+def _merge_routes(first_route: List[Location], first_location: Location, second_route: List[Location],
+                  second_location: Location, ready_seconds: int):
+    """
+    Joins two routes at the given end locations, trying both travel directions of the joined route.
+
+    Args:
+        first_route (List[Location]): The route ending or starting at first_location.
+        first_location (Location): The end location of the first route to join.
+        second_route (List[Location]): The route ending or starting at second_location.
+        second_location (Location): The end location of the second route to join.
+        ready_seconds (int): The earliest time in seconds the truck is ready to depart.
+
+    Returns:
+        List[Location] or None: The joined route with the most departure slack, or None if neither direction keeps
+            every requirement met.
+
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+    """
+
+    if first_route[-1] is not first_location:
+        first_route = first_route[::-1]
+    if second_route[0] is not second_location:
+        second_route = second_route[::-1]
+    best_route = None
+    best_slack = None
+    for merged_route in (first_route + second_route, second_route[::-1] + first_route[::-1]):
+        earliest_departure, latest_departure = _get_route_window(merged_route, ready_seconds)
+        slack = latest_departure - earliest_departure
+        if slack >= 0 and (best_slack is None or slack > best_slack):
+            best_route = merged_route
+            best_slack = slack
+    return best_route
+
+
+def _construct_routes(locations: List[Location]) -> List[List[Location]]:
+    """
+    Constructs delivery routes by merging hub round trips in order of descending savings while respecting truck
+        capacity, bundled packages, truck restrictions and deadlines.
+
+    Args:
+        locations (List[Location]): The delivery locations.
+
+    Returns:
+        List[List[Location]]: The constructed routes, excluding the hub.
+
+    Time Complexity: O(n^2 log n)
+    Space Complexity: O(n^2)
+    """
+
+    ready_seconds = TimeConversion.get_seconds(config.DELIVERY_DISPATCH_TIME)
+    routes: Dict[int, List[Location]] = dict(enumerate(_get_seed_routes(locations)))
+    route_ids: Dict[Location, int] = dict()
+    for route_id, route in routes.items():
+        for location in route:
+            route_ids[location] = route_id
+    package_totals = {route_id: sum([location.package_total() for location in route])
+                      for route_id, route in routes.items()}
+    truck_ids = {route_id: _get_route_truck_ids(route) for route_id, route in routes.items()}
+
+    for saving, i, j in _get_savings(locations):
+        first_location, second_location = locations[i], locations[j]
+        first_id, second_id = route_ids[first_location], route_ids[second_location]
+        if first_id == second_id:
+            continue
+        first_route, second_route = routes[first_id], routes[second_id]
+        if (first_location not in (first_route[0], first_route[-1]) or
+                second_location not in (second_route[0], second_route[-1]) or
+                package_totals[first_id] + package_totals[second_id] > config.NUM_TRUCK_CAPACITY or
+                len(truck_ids[first_id] | truck_ids[second_id]) > 1):
+            continue
+        merged_route = _merge_routes(first_route, first_location, second_route, second_location, ready_seconds)
+        if not merged_route:
+            continue
+        if len(first_route) < len(second_route):
+            first_id, second_id = second_id, first_id
+        for location in routes[second_id]:
+            route_ids[location] = first_id
+        routes[first_id] = merged_route
+        package_totals[first_id] += package_totals.pop(second_id)
+        truck_ids[first_id] |= truck_ids.pop(second_id)
+        del routes[second_id]
+    return list(routes.values())
+
+
+def _schedule_routes(routes: List[List[Location]], trucks: Dict[int, Truck]):
+    """
+    Assigns the routes in order of their latest allowed departure to a driver and a truck, preferring the pairing that
+        keeps the route within its departure window and returns to the hub the soonest, then builds the route runs.
+
+    A driver back at the hub may take over any truck at the hub, so a preloaded truck can depart straight away while
+        reusing a truck waits for it to be reloaded. Trucks that packages are restricted to are kept for those routes.
+        A run only skips the return to the hub when it is the last run of both its driver and its truck.
+
+    Args:
+        routes (List[List[Location]]): The constructed routes.
+        trucks (Dict[int, Truck]): The trucks keyed by truck ID.
+
+    Raises:
+        RouteBuilderError: If a scheduled route does not meet its requirements, such as a route that no pairing of
+            driver and truck can depart in time for.
+
+    Time Complexity: O(r * (d * t + log r) + n^2)
+    Space Complexity: O(n)
+    """
+
+    dispatch_seconds = TimeConversion.get_seconds(config.DELIVERY_DISPATCH_TIME)
+    restricted_truck_ids = set()
+    for route in routes:
+        restricted_truck_ids |= _get_route_truck_ids(route)
+    unrestricted_truck_ids = [truck_id for truck_id in trucks if truck_id not in restricted_truck_ids] or list(trucks)
+    driver_ready_seconds = [dispatch_seconds] * config.NUM_DRIVERS
+    truck_ready_seconds = {truck_id: dispatch_seconds for truck_id in trucks}
+    truck_reloads = {truck_id: False for truck_id in trucks}
+    schedule = []
+    for route in sorted(routes, key=lambda _route: _get_route_window(_route, dispatch_seconds)[1]):
+        best_key = None
+        for driver in range(config.NUM_DRIVERS):
+            for truck_id in sorted(_get_route_truck_ids(route) or unrestricted_truck_ids):
+                truck_ready = truck_ready_seconds[truck_id]
+                if truck_reloads[truck_id]:
+                    truck_ready += _get_reload_seconds(route)
+                earliest_departure, latest_departure = _get_route_window(
+                    route, max(driver_ready_seconds[driver], truck_ready))
+                key = (earliest_departure > latest_departure, earliest_departure + _get_round_trip_seconds(route),
+                       truck_id, driver, earliest_departure)
+                if best_key is None or key < best_key:
+                    best_key = key
+        _, return_seconds, truck_id, driver, departure = best_key
+        driver_ready_seconds[driver] = return_seconds
+        truck_ready_seconds[truck_id] = return_seconds
+        truck_reloads[truck_id] = True
+        schedule.append((departure, driver, truck_id, route))
+    for i, (departure, driver, truck_id, route) in enumerate(schedule):
+        later_schedule = schedule[i + 1:]
+        return_to_hub = (any([_driver == driver for _, _driver, _, _ in later_schedule]) or
+                         any([_truck_id == truck_id for _, _, _truck_id, _ in later_schedule]))
+        ordered_route = [Truck.hub_location] + route + ([Truck.hub_location] if return_to_hub else [])
+        run = RunPlanner.build_from_route(ordered_route, trucks[truck_id], TimeConversion.get_time(departure))
+        if run.error_type:
+            raise run.error_type
+
+
+class SavingsPlanner:
+    """
+    Builds route runs with the Clarke-Wright savings method.
+
+    Every delivery location starts on its own hub round trip, with bundled locations starting on a shared one. Round
+        trips are merged in order of descending savings whenever the merged run stays within truck capacity, keeps
+        truck restrictions consistent and meets every deadline, then the runs are scheduled onto one truck per driver.
+    """
+
+    @staticmethod
+    def build_runs() -> Set[Truck]:
+        """
+        Builds route runs for every unassigned delivery location.
+
+        Returns:
+            Set[Truck]: The set of trucks assigned to the runs.
+
+        Raises:
+            RouteBuilderError: If a constructed route cannot be scheduled to meet its requirements.
+
+        Time Complexity: O(n^2 log n)
+        Space Complexity: O(n^2)
+        """
+
+        locations = [location for location in PackageHandler.all_locations
+                     if not location.is_hub and not location.been_assigned and location.package_set]
+        fleet = FleetRegistry()
+        _schedule_routes(_construct_routes(locations), fleet.trucks_by_id)
+        return set(fleet)
@@ -0,0 +1,193 @@
+import csv
+import io
+import json
+from datetime import time
+from typing import Iterable, List, Optional, Tuple
+
+from src.constants.color import Color
+from src.constants.delivery_status import DeliveryStatus
+from src.models.location import Location
+from src.models.package import Package
+from src.utilities.package_handler import PackageHandler
+from src.utilities.time_conversion import TimeConversion
+
+__all__ = ['StatusReport']
+
+_FIELD_NAMES = ('package_id', 'update_time', 'status', 'location', 'address', 'deadline')
+
+ReportRow = Tuple[int, int, Tuple[DeliveryStatus, ...], Location, Optional[time]]
+
+
+class _FormatCache(dict):
+    """
+    A dictionary that formats each missing key once with a format function, for values repeated across report rows.
+    """
+
+    def __init__(self, format_function):
+        """
+        Initializes an empty _FormatCache object.
+
+        Args:
+            format_function (Callable): The function formatting a key.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        super().__init__()
+        self._format_function = format_function
+
+    def __missing__(self, key):
+        """
+        Formats and stores a key missing from the cache.
+
+        Args:
+            key (Hashable): The key.
+
+        Returns:
+            The formatted key.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        value = self[key] = self._format_function(key)
+        return value
+
+
+def _get_record_values(rows: List[ReportRow]) -> List[tuple]:
+    """
+    Converts report rows to the values of CSV rows and JSON objects, with the latest status of each package.
+
+    Args:
+        rows (List[ReportRow]): The report rows.
+
+    Returns:
+        List[tuple]: The package ID, update time, status name, location name, full address, and deadline of each
+            package, with times in ISO format and a deadline of None if the package has none.
+
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+    """
+
+    formatted_times = _FormatCache(lambda seconds: TimeConversion.get_time(seconds).isoformat())
+    formatted_deadlines = _FormatCache(lambda deadline: deadline.isoformat() if deadline else None)
+    addresses = _FormatCache(Location.get_full_address)
+    return [(package_id, formatted_times[seconds], statuses[-1].name, location.name, addresses[location],
+             formatted_deadlines[deadline]) for package_id, seconds, statuses, location, deadline in rows]
+
+
+class StatusReport:
+    """
+    Provides utility methods for reporting the status of every package at a time as a plain-text table, CSV or JSON.
+
+    The state of every package is computed in a single pass over the status timelines, and each report is rendered
+        into one buffer. Values that repeat across rows, such as times, addresses and statuses, are formatted once
+        per distinct value.
+    """
+
+    @staticmethod
+    def get_rows(target_time: time, packages: Iterable[Package] = None) -> List[ReportRow]:
+        """
+        Retrieves the state of every package at the target time.
+
+        Args:
+            target_time (time): The target time.
+            packages (Iterable[Package], optional): The packages. Defaults to None (all_packages).
+
+        Returns:
+            List[ReportRow]: The package ID, latest update time in seconds since midnight, statuses at that time in
+                order of update, delivery location, and deadline of each package, in order of package ID.
+
+        Time Complexity: O(n log n + n log k)
+        Space Complexity: O(n)
+        """
+
+        packages = PackageHandler.all_packages if packages is None else packages
+        target_seconds = TimeConversion.get_seconds(target_time)
+        rows = []
+        for package in sorted(packages, key=lambda _package: _package.package_id):
+            seconds, status, location = package.status_timeline.get_row_at_seconds(target_seconds)
+            rows.append((package.package_id, seconds, status if isinstance(status, tuple) else (status,), location,
+                         package.deadline))
+        return rows
+
+    @staticmethod
+    def to_text(target_time: time, packages: Iterable[Package] = None, is_colored: bool = False) -> str:
+        """
+        Renders the status of every package at the target time as a table with one line per status, the latest
+            status of a package first.
+
+        Args:
+            target_time (time): The target time.
+            packages (Iterable[Package], optional): The packages. Defaults to None (all_packages).
+            is_colored (bool, optional): Flag indicating if each package's lines are colored by its latest status.
+                Defaults to False.
+
+        Returns:
+            str: The table.
+
+        Time Complexity: O(n log n + n log k)
+        Space Complexity: O(n)
+        """
+
+        rows = StatusReport.get_rows(target_time, packages)
+        addresses = {location: location.get_full_address() for location in set([row[3] for row in rows])}
+        address_length = max([len(address) for address in addresses.values()], default=0)
+        formatted_addresses = {location: address.center(address_length) for location, address in addresses.items()}
+        formatted_statuses = {status: f' | Status: "{status}"' for status in DeliveryStatus}
+        formatted_times = _FormatCache(lambda seconds: str(TimeConversion.get_time(seconds)))
+        buffer = io.StringIO()
+        for package_id, seconds, statuses, location, _ in rows:
+            prefix = (f'{formatted_times[seconds]} | Package ID: {package_id:02} |'
+                      f' Destination: {formatted_addresses[location]}')
+            if is_colored:
+                buffer.write(statuses[-1].color.value)
+            buffer.write('\n'.join([prefix + formatted_statuses[status] for status in reversed(statuses)]))
+            if is_colored:
+                buffer.write(Color.COLOR_ESCAPE.value)
+            buffer.write('\n')
+        return buffer.getvalue()
+
+    @staticmethod
+    def to_csv(target_time: time, packages: Iterable[Package] = None) -> str:
+        """
+        Renders the status of every package at the target time as CSV, with a header row and one row per package
+            holding its latest status.
+
+        Args:
+            target_time (time): The target time.
+            packages (Iterable[Package], optional): The packages. Defaults to None (all_packages).
+
+        Returns:
+            str: The CSV.
+
+        Time Complexity: O(n log n + n log k)
+        Space Complexity: O(n)
+        """
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(_FIELD_NAMES)
+        writer.writerows(_get_record_values(StatusReport.get_rows(target_time, packages)))
+        return buffer.getvalue()
+
+    @staticmethod
+    def to_json(target_time: time, packages: Iterable[Package] = None) -> str:
+        """
+        Renders the status of every package at the target time as a JSON array with one object per package holding
+            its latest status.
+
+        Args:
+            target_time (time): The target time.
+            packages (Iterable[Package], optional): The packages. Defaults to None (all_packages).
+
+        Returns:
+            str: The JSON.
+
+        Time Complexity: O(n log n + n log k)
+        Space Complexity: O(n)
+        """
+
+        return json.dumps([dict(zip(_FIELD_NAMES, values))
+                           for values in _get_record_values(StatusReport.get_rows(target_time, packages))])
@@ -1,13 +1,77 @@
-from datetime import datetime, time, timedelta
+from datetime import datetime, time
+from functools import lru_cache
 
 from src import config
 
+SECONDS_PER_DAY = 86400
+
+
+@lru_cache(maxsize=None)
+def _get_time(seconds: int) -> time:
+    """
+    Converts a whole number of seconds since midnight to a time. Results are cached, as there is one per second of
+        the day.
+
+    Args:
+        seconds (int): The number of seconds since midnight, within a day.
+
+    Returns:
+        time: The converted time.
+
+    Time Complexity: O(1)
+    Space Complexity: O(1)
+    """
+
+    return time(hour=seconds // 3600, minute=seconds // 60 % 60, second=seconds % 60)
+
 
 class TimeConversion:
     """
     Provides utility methods for time conversions and calculations.
+
+    Times are stored as datetime.time, while all arithmetic is done on whole seconds since midnight of a single day.
     """
 
+    @staticmethod
+    def get_seconds(in_time: time) -> int:
+        """
+        Converts a time to the number of seconds since midnight.
+
+        Args:
+            in_time (time): The time to convert.
+
+        Returns:
+            int: The number of seconds since midnight.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        return in_time.hour * 3600 + in_time.minute * 60 + in_time.second
+
+    @staticmethod
+    def get_time(seconds: float) -> time:
+        """
+        Converts a number of seconds since midnight to a time, rounded to the second.
+
+        Args:
+            seconds (float): The number of seconds since midnight.
+
+        Returns:
+            time: The converted time.
+
+        Raises:
+            ValueError: If the seconds are not within the day, such as a time incremented past midnight.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        seconds = round(seconds)
+        if not 0 <= seconds < SECONDS_PER_DAY:
+            raise ValueError(f'{seconds} seconds since midnight is not within the day')
+        return _get_time(seconds)
+
     @staticmethod
     def convert_time_difference_to_miles(origin_time: time, target_time: time,
                                          miles_per_hour=config.DELIVERY_TRUCK_MPH) -> float:
@@ -87,9 +151,7 @@ class TimeConversion:
         Space Complexity: O(1)
         """
 
-        in_datetime = TimeConversion.get_datetime(origin_time)
-        in_datetime = in_datetime + timedelta(seconds=time_seconds)
-        return in_datetime.time()
+        return TimeConversion.get_time(TimeConversion.get_seconds(origin_time) + time_seconds)
 
     @staticmethod
     def get_seconds_between_times(origin_time: time, target_time: time) -> int:
@@ -107,9 +169,7 @@ class TimeConversion:
         Space Complexity: O(1)
         """
 
-        start_datetime = TimeConversion.get_datetime(origin_time)
-        end_datetime = TimeConversion.get_datetime(target_time)
-        return (end_datetime - start_datetime).seconds if origin_time < target_time else 0
+        return max(TimeConversion.get_seconds(target_time) - TimeConversion.get_seconds(origin_time), 0)
 
     @staticmethod
     def is_time_at_or_before_other_time(origin_time: time, other_time: time) -> bool:
@@ -127,7 +187,7 @@ class TimeConversion:
         Space Complexity: O(1)
         """
 
-        return TimeConversion.get_datetime(origin_time) <= TimeConversion.get_datetime(other_time)
+        return origin_time <= other_time
 
     @staticmethod
     def add_time_delta(origin_time: time, time_seconds: int) -> time:
@@ -145,7 +205,7 @@ class TimeConversion:
         Space Complexity: O(1)
         """
 
-        return (TimeConversion.get_datetime(origin_time) + timedelta(seconds=time_seconds)).time()
+        return TimeConversion.get_time(TimeConversion.get_seconds(origin_time) + time_seconds)
 
     @staticmethod
     def seconds_between_times(origin_time: time, target_time: time) -> float:
@@ -163,6 +223,4 @@ class TimeConversion:
         Space Complexity: O(1)
         """
 
-        time_difference = TimeConversion.get_datetime(target_time) - TimeConversion.get_datetime(origin_time)
-        seconds = time_difference.total_seconds()
-        return seconds
+        return float(TimeConversion.get_seconds(target_time) - TimeConversion.get_seconds(origin_time))
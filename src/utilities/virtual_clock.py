@@ -0,0 +1,256 @@
+import asyncio
+import heapq
+from itertools import count
+from typing import Any, Coroutine, List, Optional
+
+__all__ = ['VirtualClock', 'Broadcast']
+
+
+class VirtualClock:
+    """
+    A simulated clock shared by asyncio tasks.
+
+    Tasks spawned on the clock wait for simulated times instead of real ones. Once every task is waiting, the clock
+        jumps straight to the earliest wake-up and resumes the task waiting for it, so one wake-up is handled at a time
+        in order of time, then priority, then the order the wake-ups were scheduled. Tasks that do not wait on the
+        clock, such as I/O, keep running on the event loop in between.
+
+    Attributes:
+        seconds (int): The current simulated time in seconds since midnight.
+    """
+
+    def __init__(self, start_seconds: int = 0):
+        """
+        Initializes a VirtualClock object.
+
+        Args:
+            start_seconds (int): The simulated start time in seconds since midnight. Defaults to 0.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.seconds = start_seconds
+        self._wake_ups = []
+        self._sequence = count()
+        self._tasks: List[asyncio.Task] = []
+        self._running = 0
+        self._is_stopped = False
+        self._idle: Optional[asyncio.Event] = None
+
+    def spawn(self, coroutine: Coroutine) -> asyncio.Task:
+        """
+        Starts a task on the clock. Must be called from a running event loop.
+
+        Args:
+            coroutine (Coroutine): The coroutine of the task.
+
+        Returns:
+            asyncio.Task: The task.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if self._idle is None:
+            self._idle = asyncio.Event()
+        self._running += 1
+        self._idle.clear()
+        task = asyncio.ensure_future(self._run_task(coroutine))
+        self._tasks.append(task)
+        return task
+
+    def schedule(self, wake_seconds: int, priority: int = 0) -> asyncio.Future:
+        """
+        Schedules a wake-up without waiting for it, so its place in the order is kept while the task waits on other
+            wake-ups first. The wake-up must be awaited with wait() once the task has nothing earlier to wait for.
+
+        Args:
+            wake_seconds (int): The time of the wake-up in seconds since midnight, no earlier than the current time.
+            priority (int): The order of wake-ups at the same time, lowest first. Defaults to 0.
+
+        Returns:
+            asyncio.Future: The wake-up.
+
+        Time Complexity: O(log w), where w is the number of scheduled wake-ups.
+        Space Complexity: O(1)
+        """
+
+        wake_up = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._wake_ups, (max(wake_seconds, self.seconds), priority, next(self._sequence), wake_up))
+        return wake_up
+
+    async def wait(self, wake_up: asyncio.Future) -> Any:
+        """
+        Waits for a scheduled wake-up or a broadcast.
+
+        Args:
+            wake_up (asyncio.Future): The wake-up.
+
+        Returns:
+            Any: The value the wake-up was resolved with.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if not wake_up.done():
+            self._running -= 1
+            if not self._running:
+                self._idle.set()
+        return await wake_up
+
+    async def sleep_until(self, wake_seconds: int, priority: int = 0):
+        """
+        Waits until a simulated time.
+
+        Args:
+            wake_seconds (int): The time to wake up in seconds since midnight.
+            priority (int): The order of wake-ups at the same time, lowest first. Defaults to 0.
+
+        Time Complexity: O(log w)
+        Space Complexity: O(1)
+        """
+
+        await self.wait(self.schedule(wake_seconds, priority))
+
+    async def run(self, until_seconds: int = None):
+        """
+        Advances the clock through the wake-ups until every task has finished, no wake-up is left, or the next wake-up
+            is after the given time. Tasks still waiting are then cancelled.
+
+        Args:
+            until_seconds (int, optional): The last time to wake up at. Defaults to None (no limit).
+
+        Raises:
+            Exception: Any exception raised by a task.
+
+        Time Complexity: O(w log w)
+        Space Complexity: O(w)
+        """
+
+        if self._idle is None:
+            self._idle = asyncio.Event()
+            self._idle.set()
+        try:
+            while True:
+                await self._idle.wait()
+                for task in self._tasks:
+                    if task.done() and not task.cancelled() and task.exception():
+                        raise task.exception()
+                if not self._wake_ups or (until_seconds is not None and self._wake_ups[0][0] > until_seconds):
+                    break
+                wake_seconds, _, _, wake_up = heapq.heappop(self._wake_ups)
+                if not wake_up.cancelled():
+                    self.seconds = wake_seconds
+                    self.resolve(wake_up)
+        finally:
+            self._is_stopped = True
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def resolve(self, wake_up: asyncio.Future, value: Any = None):
+        """
+        Resumes the task waiting for a wake-up.
+
+        Args:
+            wake_up (asyncio.Future): The wake-up.
+            value (Any): The value to resume the task with. Defaults to None.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self._running += 1
+        self._idle.clear()
+        wake_up.set_result(value)
+
+    async def _run_task(self, coroutine: Coroutine) -> Any:
+        """
+        Runs a task, marking the clock idle once the task finishes and no other task is running.
+
+        Args:
+            coroutine (Coroutine): The coroutine of the task.
+
+        Returns:
+            Any: The result of the coroutine.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        try:
+            return await coroutine
+        finally:
+            if not self._is_stopped:
+                self._running -= 1
+                if not self._running:
+                    self._idle.set()
+
+
+class Broadcast:
+    """
+    An awaitable event published to every task waiting on it.
+
+    Attributes:
+        is_closed (bool): Flag indicating if nothing more will be published, so waiting would never end.
+    """
+
+    def __init__(self, clock: VirtualClock):
+        """
+        Initializes a Broadcast object.
+
+        Args:
+            clock (VirtualClock): The clock of the waiting tasks.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        self.is_closed = False
+        self._clock = clock
+        self._waiters: List[asyncio.Future] = []
+
+    async def wait(self) -> Any:
+        """
+        Waits for the next value to be published.
+
+        Returns:
+            Any: The published value, or None if the broadcast is closed.
+
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+
+        if self.is_closed:
+            return None
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        return await self._clock.wait(waiter)
+
+    def publish(self, value: Any = None):
+        """
+        Publishes a value, resuming the waiting tasks in the order they started waiting.
+
+        Args:
+            value (Any): The value to publish. Defaults to None.
+
+        Time Complexity: O(k), where k is the number of waiting tasks.
+        Space Complexity: O(1)
+        """
+
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            self._clock.resolve(waiter, value)
+
+    def close(self):
+        """
+        Closes the broadcast, resuming the waiting tasks with None.
+
+        Time Complexity: O(k)
+        Space Complexity: O(1)
+        """
+
+        self.is_closed = True
+        self.publish()
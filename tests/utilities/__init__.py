@@ -0,0 +1,13 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+from src.ui import UI
+from src.utilities.log_sink import LogSink
+
+# The tests log to a temporary file, so they never replace the delivery log of the repository.
+_log_directory = tempfile.mkdtemp()
+atexit.register(shutil.rmtree, _log_directory, ignore_errors=True)
+UI.LOG = LogSink(os.path.join(_log_directory, 'delivery_log.txt'))
+atexit.register(UI.LOG.close)
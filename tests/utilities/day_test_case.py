@@ -0,0 +1,16 @@
+from unittest import TestCase
+
+from src import config
+from src.utilities.delivery_runner import DeliveryRunner
+from src.utilities.package_handler import PackageHandler
+
+
+class DayTestCase(TestCase):
+    """
+    A test case that starts every test on a freshly loaded day, before any truck is loaded, so tests never see the
+        packages or clock left by an earlier test.
+    """
+
+    def setUp(self) -> None:
+        PackageHandler.load_day()
+        DeliveryRunner.global_clock = config.STANDARD_PACKAGE_LOAD_START_TIME
@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+from src import config
+from src.models.address_index import AddressIndex
+from src.utilities.package_handler import PackageHandler
+
+
+class TestAddressIndex(TestCase):
+    def setUp(self) -> None:
+        self.locations = PackageHandler.all_locations
+        self.address_index = AddressIndex(self.locations)
+        self.location = [location for location in self.locations if location.address == '410 S State St'][0]
+
+    def test_find_address(self):
+        assert self.address_index.find_address(config.PACKAGE_9_UPDATED_ADDRESS) is self.location
+        assert self.address_index.find_address('410 South State Street., Salt Lake City, UT 84111') is self.location
+        assert self.address_index.find_address('410 s. state st, Salt Lake City, UT 84111') is self.location
+        assert self.address_index.find_address('410 S State St Apt 2, Salt Lake City, UT 84111') is self.location
+        for location in self.locations:
+            assert self.address_index.find_address(location.get_full_address()) is location
+
+    def test_find_address_without_match(self):
+        assert self.address_index.find_address('410 S State St, Salt Lake City, UT 84119') is None
+        assert self.address_index.find_address('411 S State St, Salt Lake City, UT 84111') is None
+        assert self.address_index.find_address('410 S State St') is None
+        assert self.address_index.find_address('410 S State St, Salt Lake City, UT') is None
+        assert self.address_index.find_address(None) is None
+
+    def test_find_exact(self):
+        assert self.address_index.find('410 South State Street', 84111, is_prefix_match=False) is self.location
+        assert self.address_index.find('410 S State St Apt 2', 84111, is_prefix_match=False) is None
+        assert self.address_index.find('410 S State', 84111, is_prefix_match=False) is None
+        assert self.address_index.find('410 S State', 84111) is None
@@ -0,0 +1,16 @@
+from src.utilities.anytime_planner import AnytimePlanner
+from src.utilities.package_handler import PackageHandler
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestAnytimePlanner(DayTestCase):
+
+    def test_plan(self):
+        incumbents = []
+        trucks = AnytimePlanner.plan(time_budget_seconds=2,
+                                     on_incumbent=lambda *incumbent: incumbents.append(incumbent))
+        assert incumbents
+        assert not [location for location in PackageHandler.all_locations if not location.been_assigned]
+        mileages = [mileage for _, mileage, _ in incumbents]
+        assert all(mileages[i] < mileages[i - 1] for i in range(1, len(mileages)))
+        assert mileages[-1] == sum([run.estimated_mileage for truck in trucks for run in truck.route_runs])
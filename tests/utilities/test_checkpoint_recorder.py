@@ -0,0 +1,68 @@
+import random
+from datetime import time
+
+from src import config
+from src.constants.delivery_status import DeliveryStatus
+from src.utilities.checkpoint_recorder import CheckpointRecorder
+from src.utilities.delivery_runner import DeliveryRunner
+from src.utilities.package_handler import PackageHandler
+from src.utilities.time_conversion import TimeConversion
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestCheckpointRecorder(DayTestCase):
+
+    def setUp(self) -> None:
+        config.HEADLESS_SIMULATION_ENABLED = True
+        super().setUp()
+        random.seed(0)
+
+    def tearDown(self) -> None:
+        config.HEADLESS_SIMULATION_ENABLED = False
+
+    def _get_histories(self):
+        return [(package.package_id, package.status, package.delivery_time, package.location,
+                 list(package.status_update_dict.items())) for package in PackageHandler.all_packages]
+
+    def test_get_next_seconds(self):
+        recorder = CheckpointRecorder([], [], [], start_seconds=1000, interval_seconds=300)
+        assert recorder.get_next_seconds(0) == 1000
+        assert recorder.get_next_seconds(1000) == 1000
+        assert recorder.get_next_seconds(1001) == 1300
+        assert recorder.get_next_seconds(1600) == 1600
+
+    def test_get_state_at_time(self):
+        DeliveryRunner.load_trucks()
+        DeliveryRunner.commence_deliveries()
+        recorder = DeliveryRunner.checkpoints
+        seconds = [checkpoint.seconds for checkpoint in recorder.checkpoints]
+        assert seconds == sorted(seconds) and all(later - earlier == config.CHECKPOINT_INTERVAL_SECONDS
+                                                  for earlier, later in zip(seconds, seconds[1:]))
+        previous_mileage = dict()
+        for target_time in [time(8), time(9, 7), time(10, 21), time(11, 45), time(18)]:
+            truck_states, package_states = recorder.get_state_at_time(target_time)
+            assert [(package_state.status, package_state.location) for package_state in package_states] == [
+                (package_state.status, package_state.location)
+                for package_state in PackageHandler.get_package_states_at_time(target_time)]
+            for truck_id, truck_state in truck_states.items():
+                assert truck_state.seconds <= TimeConversion.get_seconds(target_time)
+                assert truck_state.mileage >= previous_mileage.get(truck_id, 0)
+                previous_mileage[truck_id] = truck_state.mileage
+        truck_states, _ = recorder.get_state_at_time(time(18))
+        assert all(truck_state.current_run is None and not truck_state.package_ids
+                   for truck_state in truck_states.values())
+        assert abs(sum(truck_state.mileage for truck_state in truck_states.values()) -
+                   sum(run.estimated_mileage for run in DeliveryRunner.route_runs)) < 1e-6
+
+    def test_resume_deliveries(self):
+        DeliveryRunner.load_trucks()
+        DeliveryRunner.commence_deliveries()
+        histories = self._get_histories()
+        checkpoint = DeliveryRunner.checkpoints.find_checkpoint(TimeConversion.get_seconds(time(10, 15)))
+        DeliveryRunner.checkpoints.restore(checkpoint)
+        assert any(package.status is not DeliveryStatus.DELIVERED for package in PackageHandler.all_packages)
+        assert all(package.delivery_time is None or package.delivery_time <= time(10, 15)
+                   for package in PackageHandler.all_packages)
+        DeliveryRunner.resume_deliveries(checkpoint)
+        assert self._get_histories() == histories
+        assert DeliveryRunner.checkpoints.checkpoints[-1].seconds > checkpoint.seconds
@@ -0,0 +1,53 @@
+from datetime import time
+
+from src.utilities.constraint_graph import ConstraintGraph
+from src.utilities.package_handler import PackageHandler
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestConstraintGraph(DayTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.locations = PackageHandler.all_locations
+        self.packages = PackageHandler.all_packages
+        self.constraint_graph = ConstraintGraph(self.locations, self.packages)
+        self.package_hash = PackageHandler.package_hash
+
+    def test_bundle_group(self):
+        bundle_group = self.constraint_graph.get_bundle_group(self.package_hash.get_package(13).location)
+        for package_id in [13, 14, 15, 16, 19, 20]:
+            assert self.package_hash.get_package(package_id).location in bundle_group
+            assert self.package_hash.get_package(package_id) in self.constraint_graph.bundle_packages
+        assert bundle_group == self.constraint_graph.bundle_locations
+        assert not self.constraint_graph.get_bundle_group(self.package_hash.get_package(1).location)
+
+    def test_truck_pins(self):
+        for package_id in [3, 18, 36, 38]:
+            location = self.package_hash.get_package(package_id).location
+            assert self.constraint_graph.get_truck_pin(location) == 2
+            assert location in self.constraint_graph.get_pinned_locations(truck_id=2)
+        assert not self.constraint_graph.get_pinned_locations(truck_id=1)
+        assert self.constraint_graph.get_pinned_locations() == self.constraint_graph.get_pinned_locations(truck_id=2)
+        assert self.constraint_graph.get_pinned_locations() is self.constraint_graph.get_pinned_locations()
+        assert self.constraint_graph.get_truck_pin(self.package_hash.get_package(1).location) is None
+
+    def test_release_times_and_deadlines(self):
+        delayed_location = self.package_hash.get_package(6).location
+        assert self.constraint_graph.get_release_time(delayed_location) == time(9, 5)
+        assert delayed_location in self.constraint_graph.delayed_locations
+        assert self.constraint_graph.latest_delayed_arrival == time(9, 5)
+        assert self.constraint_graph.get_deadline(self.package_hash.get_package(15).location) == time(9)
+
+    def test_address_update(self):
+        location = self.package_hash.get_package(9).location
+        update_time, updated_location = self.constraint_graph.get_address_update(location)
+        assert location in self.constraint_graph.unconfirmed_locations
+        assert update_time == time(10, 20)
+        assert updated_location.address == '410 S State St'
+        assert self.constraint_graph.get_address_update(updated_location) is None
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.constraint_graph.bundle_locations = frozenset()
+        with self.assertRaises(TypeError):
+            self.constraint_graph._truck_pins[self.locations[0]] = 1
@@ -6,7 +6,9 @@ from src.constants.delivery_status import DeliveryStatus
 from src.constants.states import State
 from src.constants.utah_cities import UtahCity
 from src.models.location import Location
+from src.models.truck import Truck
 from src.utilities.csv_parser import CsvParser
+from src.utilities.package_handler import PackageHandler
 from src.utilities.time_conversion import TimeConversion
 
 
@@ -15,6 +17,9 @@ class TestCsvParser(TestCase):
         self.locations = CsvParser.initialize_locations()
         self.packages = CsvParser.initialize_packages(self.locations)
 
+    def tearDown(self) -> None:
+        Truck.hub_location = [location for location in PackageHandler.all_locations if location.is_hub][0]
+
     def test_initialize_packages(self):
         for package in self.packages:
             assert package.package_id and isinstance(package.package_id, int)
@@ -47,3 +47,17 @@ class TestCustomHash(TestCase):
         assert len(self.packages) == len(self.custom_hash)
         for package in self.packages:
             assert self.custom_hash.get_package(package.package_id) is package
+
+    def test_resize_and_bulk_operations(self):
+        assert self.custom_hash.add_packages(self.packages) == len(self.packages)
+        assert self.custom_hash.add_packages(self.packages) == 0
+        assert sorted(self.custom_hash, key=lambda package: package.package_id) == sorted(
+            self.packages, key=lambda package: package.package_id)
+        package_ids = [package.package_id for package in self.packages]
+        assert self.custom_hash.get_packages(package_ids + [0]) == list(self.packages) + [None]
+        assert self.custom_hash.remove_packages(package_ids[::2]) == len(package_ids[::2])
+        assert self.custom_hash.get_packages(package_ids[::2]) == [None] * len(package_ids[::2])
+        assert all(package in self.custom_hash for package in self.packages[1::2])
+        for package in self.packages[::2]:
+            assert self.custom_hash.add_package(package)
+        assert len(self.custom_hash) == len(list(self.custom_hash)) == len(self.packages)
@@ -1,13 +1,20 @@
-from unittest import TestCase
+import asyncio
+import random
+from unittest.mock import patch
 
 from src import config
 from src.constants.delivery_status import DeliveryStatus
+from src.constants.run_info import RunInfo
+from src.exceptions import AddressUpdateException, DelayedPackagesArrivedException
+from src.ui import UI
 from src.utilities.delivery_runner import DeliveryRunner
+from src.utilities.driver_scheduler import DriverScheduler
 from src.utilities.package_handler import PackageHandler
+from src.utilities.virtual_clock import VirtualClock
+from tests.utilities.day_test_case import DayTestCase
 
 
-class TestDeliveryRunner(TestCase):
-
+class TestDeliveryRunner(DayTestCase):
     def test_load_trucks(self):
         config.UI_ENABLED = False
         config.UI_ELEMENTS_ENABLED = False
@@ -16,9 +23,160 @@ class TestDeliveryRunner(TestCase):
         assert all(package.status is DeliveryStatus.LOADED for package in PackageHandler.all_packages
                    if package.location.has_required_truck_package)
 
+    def test_load_trucks_headless(self):
+        config.HEADLESS_SIMULATION_ENABLED = True
+        try:
+            with patch.object(DriverScheduler, 'display_report') as display_report:
+                DeliveryRunner.load_trucks()
+        finally:
+            config.HEADLESS_SIMULATION_ENABLED = False
+        display_report.assert_not_called()
+        assert DeliveryRunner.fleet.driver_schedule is not None
+
     def test_commence_deliveries(self):
         config.UI_ENABLED = True
         config.UI_ELEMENTS_ENABLED = False
         DeliveryRunner.load_trucks()
         DeliveryRunner.commence_deliveries()
         assert all(package.status is DeliveryStatus.DELIVERED for package in PackageHandler.all_packages)
+
+    def test_load_trucks_in_batches(self):
+        config.UI_ENABLED = False
+        config.UI_ELEMENTS_ENABLED = False
+        global_clock = DeliveryRunner.global_clock
+        DeliveryRunner.load_trucks()
+        assert DeliveryRunner.global_clock == global_clock
+        for truck in [truck for truck in DeliveryRunner.fleet if truck.route_runs]:
+            load_times = set([update_time for package in truck for update_time, state
+                              in package.status_update_dict.items() if state['status'] is DeliveryStatus.LOADED])
+            assert load_times <= {global_clock}
+            assert truck.clock >= global_clock
+
+    def test_reload_time_delays_departure(self):
+        config.UI_ENABLED = False
+        config.UI_ELEMENTS_ENABLED = False
+        DeliveryRunner.load_trucks()
+        planned_times = set([analysis[RunInfo.ESTIMATED_TIME] for run in DeliveryRunner.route_runs
+                             for analysis in run.run_analysis_dict.values()])
+        load_speed_max_seconds = config.PACKAGE_LOAD_SPEED_MAX_SECONDS
+        config.PACKAGE_LOAD_SPEED_MAX_SECONDS = 3600
+        try:
+            DeliveryRunner.commence_deliveries()
+        finally:
+            config.PACKAGE_LOAD_SPEED_MAX_SECONDS = load_speed_max_seconds
+        assert all(package.status is DeliveryStatus.DELIVERED for package in PackageHandler.all_packages)
+        assert any(package.delivery_time not in planned_times for package in PackageHandler.all_packages)
+
+    def test_commence_deliveries_at_planned_times(self):
+        config.UI_ENABLED = False
+        config.UI_ELEMENTS_ENABLED = False
+        DeliveryRunner.load_trucks()
+        planned_times = set([analysis[RunInfo.ESTIMATED_TIME] for run in DeliveryRunner.route_runs
+                             for analysis in run.run_analysis_dict.values()])
+        DeliveryRunner.commence_deliveries()
+        assert all(package.delivery_time in planned_times for package in PackageHandler.all_packages)
+        assert not DeliveryRunner.trucks
+
+    def test_runs_started_in_order_of_start_time(self):
+        config.UI_ENABLED = False
+        config.UI_ELEMENTS_ENABLED = False
+        delivery_times = []
+        for is_reversed in (False, True):
+            self.setUp()
+            random.seed(0)
+            DeliveryRunner.load_trucks()
+            if is_reversed:
+                for truck in DeliveryRunner.fleet:
+                    truck.route_runs.reverse()
+            DeliveryRunner.commence_deliveries()
+            assert not any([truck.route_runs for truck in DeliveryRunner.fleet])
+            delivery_times.append({package.package_id: package.delivery_time
+                                   for package in PackageHandler.all_packages})
+        assert delivery_times[0] == delivery_times[1]
+
+    def test_run_deliveries_with_observer(self):
+        config.UI_ENABLED = False
+        config.UI_ELEMENTS_ENABLED = False
+        DeliveryRunner.load_trucks()
+        status_updates = []
+
+        async def observe(clock: VirtualClock):
+            while not DeliveryRunner.status_updates.is_closed:
+                batch = await DeliveryRunner.status_updates.wait()
+                for status_update in batch or ():
+                    status_updates.append((clock.seconds, type(status_update)))
+
+        async def run_with_observer():
+            clock = VirtualClock()
+            clock.spawn(observe(clock))
+            await DeliveryRunner.run_deliveries(clock)
+
+        asyncio.run(run_with_observer())
+        assert all(package.status is DeliveryStatus.DELIVERED for package in PackageHandler.all_packages)
+        assert (9 * 3600 + 5 * 60, DelayedPackagesArrivedException) in status_updates
+        assert (10 * 3600 + 20 * 60, AddressUpdateException) in status_updates
+
+    def test_simulate(self):
+        config.UI_ENABLED = True
+        log_length = len(UI.LOG)
+        result = DeliveryRunner.simulate(seed=0)
+        assert not config.HEADLESS_SIMULATION_ENABLED
+        assert len(UI.LOG) == log_length
+        assert result.is_successful
+        assert len(result.delivery_times) == len(PackageHandler.all_packages)
+        assert result.total_mileage == sum([run.estimated_mileage for run in DeliveryRunner.route_runs])
+        assert set(result.truck_mileage.keys()) == set([run.assigned_truck_id for run in DeliveryRunner.route_runs])
+
+    def test_simulate_twice(self):
+        results = [DeliveryRunner.simulate(seed=3) for _ in range(2)]
+        assert results[1].is_successful
+        assert [vars(result) for result in results[1:]] == [vars(results[0])]
+        assert all(package.status is DeliveryStatus.DELIVERED for package in PackageHandler.all_packages)
+
+    def test_simulate_days(self):
+        results = DeliveryRunner.simulate_days([config.PACKAGE_CSV_FILE, config.PACKAGE_CSV_FILE], seed=3)
+        assert [result.seed for result in results] == [3, 4]
+        assert all(result.is_successful for result in results)
+        assert len(PackageHandler.all_packages) == len(results[-1].delivery_times)
+
+    def test_simulate_days_with_carryover(self):
+        simulate = DeliveryRunner.simulate
+        carryover_package_ids = [9, 13]
+
+        def simulate_with_undelivered_packages(seed, package_file, carryover_packages):
+            result = simulate(seed, package_file, carryover_packages)
+            if not carryover_packages:
+                result.undelivered_package_ids = carryover_package_ids
+            return result
+
+        config.SAVINGS_CONSTRUCTOR_ENABLED = True
+        try:
+            with patch.object(DeliveryRunner, 'simulate', side_effect=simulate_with_undelivered_packages) as spy:
+                results = DeliveryRunner.simulate_days([config.PACKAGE_CSV_FILE, config.PACKAGE_CSV_FILE], seed=0)
+        finally:
+            config.SAVINGS_CONSTRUCTOR_ENABLED = False
+        first_day_packages = list(spy.call_args_list[1].args[2])
+        assert [package.package_id for package in first_day_packages] == carryover_package_ids
+        package_count = len(PackageHandler.all_packages) - len(carryover_package_ids)
+        carryover_packages = PackageHandler.all_packages[package_count:]
+        assert [package.package_id for package in carryover_packages] == [package_count + 1, package_count + 2]
+        assert len(results[1].delivery_times) == len(PackageHandler.all_packages)
+        assert not results[1].undelivered_package_ids
+        assert all(package.hub_arrival_time == config.STANDARD_PACKAGE_ARRIVAL_TIME for package in carryover_packages)
+        package = carryover_packages[0]
+        assert package.is_verified_address
+        assert package.location is PackageHandler.address_index.find_address(config.PACKAGE_9_UPDATED_ADDRESS)
+        assert carryover_packages[1].location is first_day_packages[1].location
+
+    def test_simulate_unverified_carryover_day(self):
+        carryover_packages = [PackageHandler.package_hash.get_package(package_id) for package_id in (1, 2, 9, 13, 25)]
+        config.SAVINGS_CONSTRUCTOR_ENABLED = True
+        try:
+            result = DeliveryRunner.simulate(0, config.PACKAGE_CSV_FILE, carryover_packages)
+        finally:
+            config.SAVINGS_CONSTRUCTOR_ENABLED = False
+        assert len(result.delivery_times) == len(PackageHandler.all_packages)
+        assert not result.undelivered_package_ids
+        package = PackageHandler.package_hash.get_package(43)
+        assert package.is_verified_address
+        assert package.status is DeliveryStatus.DELIVERED
@@ -0,0 +1,41 @@
+from datetime import time
+from unittest import TestCase
+
+from src.models.route_run import RouteRun
+from src.utilities.driver_scheduler import DriverScheduler
+
+
+def _get_run(truck_id: int, start_time: time, completion_time: time, return_to_hub=True) -> RouteRun:
+    run = RouteRun(return_to_hub=return_to_hub, start_time=start_time)
+    run.assigned_truck_id = truck_id
+    run._estimated_completion_time = completion_time
+    return run
+
+
+class TestDriverScheduler(TestCase):
+    def setUp(self) -> None:
+        self.runs = [_get_run(1, time(8), time(9)),
+                     _get_run(2, time(8), time(10)),
+                     _get_run(3, time(8, 30), time(9, 30), return_to_hub=False),
+                     _get_run(1, time(9, 30), time(11), return_to_hub=False)]
+
+    def test_schedule(self):
+        schedule = DriverScheduler.schedule(self.runs, number_of_drivers=2)
+        assert len(schedule.scheduled_runs) == 4
+        delayed_run = [scheduled_run for scheduled_run in schedule.scheduled_runs
+                       if scheduled_run.run.assigned_truck_id == 3][0]
+        assert delayed_run.start_time == time(9)
+        assert delayed_run.delay_seconds == 1800
+        assert schedule.makespan == time(11, 30)
+        assert schedule.total_delay_seconds == 3600
+        assert not sum(schedule.idle_seconds.values())
+
+    def test_unscheduled_runs(self):
+        schedule = DriverScheduler.schedule(self.runs, number_of_drivers=1)
+        assert [scheduled_run.run.assigned_truck_id for scheduled_run in schedule.scheduled_runs] == [1, 2, 3]
+
+    def test_get_required_drivers(self):
+        assert DriverScheduler.get_required_drivers(self.runs) == 3
+        schedule = DriverScheduler.schedule(self.runs, number_of_drivers=3)
+        assert not schedule.total_delay_seconds
+        assert schedule.makespan == time(11)
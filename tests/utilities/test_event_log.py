@@ -0,0 +1,53 @@
+from datetime import time
+
+from src.constants.delivery_status import DeliveryStatus
+from src.models.event_log import EventLog
+from src.models.package import Package
+from src.models.simulation_result import SimulationResult
+from src.utilities.delivery_runner import DeliveryRunner
+from src.utilities.package_handler import PackageHandler
+from src.utilities.time_conversion import TimeConversion
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestEventLog(DayTestCase):
+
+    def test_queries(self):
+        first_location, second_location = PackageHandler.all_locations[1:3]
+        event_log = EventLog()
+        event_log.append(1, 8 * 3600, DeliveryStatus.OUT_FOR_DELIVERY, first_location, 1)
+        event_log.append(1, 8 * 3600 + 1800, DeliveryStatus.DELIVERED, first_location, 1)
+        event_log.append(2, 9 * 3600 + 5, DeliveryStatus.DELIVERED, second_location, 2)
+        event_log.append(3, 9 * 3600 + 10, DeliveryStatus.DELIVERED, second_location, 2)
+        event_log.append(4, 10 * 3600, DeliveryStatus.AT_HUB, first_location)
+        assert len(event_log) == 5
+        assert event_log.get_event(4) == (4, 10 * 3600, DeliveryStatus.AT_HUB, first_location, None)
+        assert event_log.get_delivery_seconds() == {1: 8 * 3600 + 1800, 2: 9 * 3600 + 5, 3: 9 * 3600 + 10}
+        assert event_log.get_deliveries_per_hour() == {8: 1, 9: 2}
+        assert event_log.get_deliveries_per_truck() == {1: 1, 2: 2}
+        assert event_log.get_late_package_ids({1: time(8, 30), 2: time(9), 3: None}) == [2]
+        event_log.truncate(2)
+        assert event_log.get_deliveries_per_truck() == {1: 1}
+
+    def test_large_ids(self):
+        location = PackageHandler.all_locations[1]
+        event_log = EventLog()
+        event_log.append(70000, 8 * 3600, DeliveryStatus.DELIVERED, location, 300)
+        assert event_log.get_event(0) == (70000, 8 * 3600, DeliveryStatus.DELIVERED, location, 300)
+        assert event_log.get_deliveries_per_truck() == {300: 1}
+        event_length = len(Package.event_log)
+        package = Package(package_id=70000, location=location, is_verified_address=True, deadline=time(10, 30),
+                          weight=1, special_note='')
+        package.update_status(DeliveryStatus.DELIVERED, time(9), truck_id=300)
+        assert Package.event_log.get_event(event_length) == (70000, 9 * 3600, DeliveryStatus.DELIVERED, location, 300)
+
+    def test_simulated_day(self):
+        DeliveryRunner.simulate(seed=0)
+        event_log = Package.event_log
+        packages = PackageHandler.all_packages
+        assert event_log.get_delivery_seconds() == {package.package_id: TimeConversion.get_seconds(
+            package.delivery_time) for package in packages}
+        assert sum(event_log.get_deliveries_per_hour().values()) == len(packages)
+        assert sum(event_log.get_deliveries_per_truck().values()) == len(packages)
+        assert event_log.get_late_package_ids({package.package_id: package.deadline for package in packages}) == \
+            SimulationResult(0, packages, DeliveryRunner.route_runs).late_package_ids
@@ -0,0 +1,71 @@
+import os
+import random
+import sqlite3
+import tempfile
+
+from src import config
+from src.models.package import Package
+from src.utilities.delivery_runner import DeliveryRunner
+from src.utilities.event_store import EventStore
+from src.utilities.package_handler import PackageHandler
+from src.utilities.time_conversion import TimeConversion
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestEventStore(DayTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.directory.name, 'delivery_history.db')
+        config.EVENT_STORE_ENABLED = True
+        config.EVENT_STORE_FILE = self.filepath
+        config.UI_ENABLED = False
+        config.UI_ELEMENTS_ENABLED = False
+        random.seed(0)
+
+    def tearDown(self) -> None:
+        config.EVENT_STORE_ENABLED = False
+        config.UI_ENABLED = True
+        config.UI_ELEMENTS_ENABLED = True
+        self.directory.cleanup()
+
+    def test_save_day(self):
+        DeliveryRunner.load_trucks()
+        DeliveryRunner.commence_deliveries()
+        with EventStore(self.filepath) as event_store:
+            plan_id = event_store.get_latest_plan_id()
+            assert plan_id == DeliveryRunner.plan_id
+            runs = event_store.get_runs(plan_id)
+            assert len(runs) == len(DeliveryRunner.route_runs)
+            for run_index, truck_id, start_seconds, completion_seconds, mileage in runs:
+                stops = event_store.get_stops(plan_id, run_index)
+                assert stops[0][2] == start_seconds and stops[-1][2] == completion_seconds
+                assert abs(stops[-1][3] - mileage) < 1e-6
+            deliveries = event_store.get_deliveries_between(plan_id, 0, 24 * 3600)
+            assert sorted((package_id, seconds) for seconds, package_id, _ in deliveries) == sorted(
+                (package.package_id, TimeConversion.get_seconds(package.delivery_time))
+                for package in PackageHandler.all_packages)
+            package = PackageHandler.package_hash.get_package(9)
+            history = event_store.get_package_history(plan_id, 9)
+            assert [status for _, status, _, _ in history][-1] == 'DELIVERED'
+            assert history[-1][2] == package.location.name
+            truck_events = event_store.get_truck_events(plan_id, history[-1][3])
+            assert (history[-1][0], 9, 'DELIVERED', package.location.name) in truck_events
+            assert len(Package.event_log) == sum(len(event_store.get_package_history(plan_id, package.package_id))
+                                                 for package in PackageHandler.all_packages)
+
+    def test_indexes(self):
+        with EventStore(self.filepath) as event_store:
+            plan_id = event_store.save_plan([])
+            assert event_store.get_runs(plan_id) == []
+        connection = sqlite3.connect(self.filepath)
+        assert connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        for query, index in [('SELECT * FROM status_events WHERE plan_id = 1 AND package_id = 9',
+                              'status_events_by_package'),
+                             ('SELECT * FROM status_events WHERE plan_id = 1 AND truck_id = 2',
+                              'status_events_by_truck'),
+                             ('SELECT * FROM status_events WHERE plan_id = 1 AND seconds < 36000',
+                              'status_events_by_time')]:
+            assert index in str(connection.execute('EXPLAIN QUERY PLAN ' + query).fetchall())
+        connection.close()
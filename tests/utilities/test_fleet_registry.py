@@ -0,0 +1,46 @@
+from datetime import time
+from unittest import TestCase
+
+from src.models.route_run import RouteRun
+from src.models.truck import Truck
+from src.utilities.fleet_registry import FleetRegistry
+
+
+def _add_run(truck: Truck, start_time: time, completion_time: time, return_to_hub: bool) -> RouteRun:
+    run = RouteRun(return_to_hub=return_to_hub, start_time=start_time)
+    run.assigned_truck_id = truck.truck_id
+    run._estimated_completion_time = completion_time
+    truck.route_runs.append(run)
+    return run
+
+
+class TestFleetRegistry(TestCase):
+    def setUp(self) -> None:
+        self.trucks = [Truck(truck_id) for truck_id in range(1, 201)]
+        self.fleet = FleetRegistry(self.trucks, number_of_drivers=2)
+
+    def test_get_truck(self):
+        assert len(self.fleet) == 200
+        assert self.fleet.get_truck(150) is self.trucks[149]
+        assert self.fleet.get_truck(201) is None
+        assert list(self.fleet) == self.trucks
+
+    def test_get_runs(self):
+        late_run = _add_run(self.trucks[0], time(10), time(11), False)
+        early_run = _add_run(self.trucks[0], time(8), time(9), True)
+        other_run = _add_run(self.trucks[1], time(9), time(10), False)
+        assert self.fleet.get_runs() == [early_run, other_run, late_run]
+        assert self.fleet.get_runs(1) == [early_run, late_run]
+        assert self.fleet.get_runs(2) == [other_run]
+        assert self.fleet.get_runs(201) == []
+
+    def test_assign_shifts(self):
+        _add_run(self.trucks[0], time(8), time(9), True)
+        _add_run(self.trucks[1], time(8), time(11), False)
+        _add_run(self.trucks[2], time(9, 30), time(11), False)
+        _add_run(self.trucks[3], time(9, 45), time(11), False)
+        fleet = FleetRegistry(self.trucks, number_of_drivers=2)
+        schedule = fleet.assign_shifts()
+        assert fleet.driver_schedule is schedule
+        assert [(scheduled_run.run.assigned_truck_id, scheduled_run.driver_id)
+                for scheduled_run in schedule.scheduled_runs] == [(2, 1), (1, 2), (3, 2)]
@@ -0,0 +1,50 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.utilities.log_sink import LogSink
+
+
+class TestLogSink(TestCase):
+
+    def test_rotation(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'log.txt')
+            log_sink = LogSink(filepath, buffer_lines=10, max_bytes=100, backup_count=2)
+            for i in range(100):
+                log_sink.write(f'line {i:03}')
+            log_sink.close()
+            assert len(log_sink) == 100
+            assert log_sink.get_recent_lines() == [f'line {i:03}' for i in range(90, 100)]
+            assert os.path.exists(filepath + '.2') and not os.path.exists(filepath + '.3')
+            assert all(os.path.getsize(path) <= 100 for path in (filepath, filepath + '.1', filepath + '.2'))
+            lines = list(log_sink.read_lines())
+            assert lines == [f'line {i:03}' for i in range(100 - len(lines), 100)]
+
+    def test_paging_and_search(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_sink = LogSink(os.path.join(directory, 'log.txt'))
+            log_sink.write('\033[91mTruck 1 departed\033[0m')
+            log_sink.is_enabled = False
+            log_sink.write('discarded')
+            log_sink.is_enabled = True
+            for i in range(2, 6):
+                log_sink.write(f'Truck {i} departed')
+            assert log_sink.get_page(1, page_size=2) == ['Truck 3 departed', 'Truck 4 departed']
+            assert log_sink.get_page(3, page_size=2) == []
+            assert [line_number for line_number, _ in log_sink.search('TRUCK 1 DEPARTED')] == [1]
+            assert len(log_sink.search('departed')) == 5
+            log_sink.close()
+
+    def test_write_after_writer_stops(self):
+        with tempfile.TemporaryDirectory() as directory:
+            log_sink = LogSink(os.path.join(directory, 'missing', 'log.txt'), buffer_lines=2)
+            with patch('threading.excepthook'):
+                for i in range(10):
+                    log_sink.write(f'line {i}')
+                log_sink.flush()
+                log_sink.close()
+            assert len(log_sink) == 10
+            assert log_sink.get_recent_lines() == ['line 8', 'line 9']
+            assert list(log_sink.read_lines()) == []
@@ -0,0 +1,56 @@
+import random
+from unittest import TestCase
+
+from src import config
+from src.utilities.monte_carlo import MonteCarloSimulator
+from src.utilities.package_handler import PackageHandler
+from src.utilities.route_builder import RouteBuilder
+
+
+class TestMonteCarloSimulator(TestCase):
+    trucks = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        headless_simulation_enabled = config.HEADLESS_SIMULATION_ENABLED
+        config.HEADLESS_SIMULATION_ENABLED = True
+        PackageHandler.load_day()
+        random.seed(0)
+        try:
+            cls.trucks = list(RouteBuilder.build_optimized_runs())
+        finally:
+            config.HEADLESS_SIMULATION_ENABLED = headless_simulation_enabled
+
+    def test_run(self):
+        result = MonteCarloSimulator.run(self.trucks, replications=200, max_workers=1)
+        assert result.replications == 200
+        assert sorted(result.on_time_probability) == [package.package_id for package in PackageHandler.all_packages]
+        assert all(0 <= probability <= 1 for probability in result.on_time_probability.values())
+        assert sorted(result.finish_time_percentiles) == sorted([truck.truck_id for truck in self.trucks
+                                                                 if truck.route_runs])
+        for percentiles in result.finish_time_percentiles.values():
+            assert list(percentiles) == list(config.MONTE_CARLO_PERCENTILES)
+            assert percentiles[50] <= percentiles[90] <= percentiles[95]
+        at_risk_package_ids = result.get_at_risk_packages()
+        assert all(result.on_time_probability[package_id] < 0.95 for package_id in at_risk_package_ids)
+        assert at_risk_package_ids == sorted(at_risk_package_ids,
+                                             key=lambda package_id: result.on_time_probability[package_id])
+
+    def test_run_without_variation(self):
+        min_speed_mph, max_speed_mph = config.MONTE_CARLO_MIN_SPEED_MPH, config.MONTE_CARLO_MAX_SPEED_MPH
+        arrival_jitter_seconds = config.MONTE_CARLO_ARRIVAL_JITTER_SECONDS
+        config.MONTE_CARLO_MIN_SPEED_MPH = config.MONTE_CARLO_MAX_SPEED_MPH = config.DELIVERY_TRUCK_MPH
+        config.MONTE_CARLO_ARRIVAL_JITTER_SECONDS = 0
+        try:
+            result = MonteCarloSimulator.run(self.trucks, replications=20, max_workers=1)
+        finally:
+            config.MONTE_CARLO_MIN_SPEED_MPH, config.MONTE_CARLO_MAX_SPEED_MPH = min_speed_mph, max_speed_mph
+            config.MONTE_CARLO_ARRIVAL_JITTER_SECONDS = arrival_jitter_seconds
+        assert set(result.on_time_probability.values()) == {1.0}
+        assert not result.get_at_risk_packages()
+
+    def test_run_across_processes(self):
+        result = MonteCarloSimulator.run(self.trucks, replications=100, seed=7, max_workers=1)
+        pooled_result = MonteCarloSimulator.run(self.trucks, replications=100, seed=7, max_workers=3)
+        assert pooled_result.on_time_probability == result.on_time_probability
+        assert pooled_result.finish_time_percentiles == result.finish_time_percentiles
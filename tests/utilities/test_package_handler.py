@@ -1,16 +1,17 @@
 from datetime import time
-from unittest import TestCase
 
 from src import config
 from src.constants.delivery_status import DeliveryStatus
-from src.exceptions import AddressUpdateException
+from src.exceptions import AddressUpdateException, DelayedPackagesArrivedException
 from src.models.truck import Truck
 from src.utilities.custom_hash import CustomHash
 from src.utilities.package_handler import PackageHandler
+from tests.utilities.day_test_case import DayTestCase
 
 
-class TestPackageHandler(TestCase):
+class TestPackageHandler(DayTestCase):
     def setUp(self) -> None:
+        super().setUp()
         self.locations = PackageHandler.all_locations
         self.packages = PackageHandler.all_packages
         self.custom_hash = CustomHash(config.NUM_TRUCK_CAPACITY)
@@ -19,9 +20,6 @@ class TestPackageHandler(TestCase):
         self.truck_2 = Truck(2)
         self.truck_3 = Truck(3)
 
-    def tearDown(self) -> None:
-        pass
-
     def test_update_delivery_location(self):
         assert not len(self.truck_1)
         self.truck_1.add_package(self.custom_hash.get_package(9))
@@ -123,3 +121,34 @@ class TestPackageHandler(TestCase):
         available_packages = PackageHandler.get_available_packages(current_time=time(8), ignore_assigned=True)
         for package in available_packages:
             assert package.location is not assigned_location
+
+    def test_load_day(self):
+        carryover_packages = [self.custom_hash.get_package(package_id) for package_id in (13, 25, 38)]
+        PackageHandler.load_day(config.PACKAGE_CSV_FILE, carryover_packages)
+        assert len(PackageHandler.all_packages) == len(self.packages) + len(carryover_packages)
+        loaded_package_ids = set([id(package) for package in PackageHandler.all_packages])
+        assert all(id(package) in loaded_package_ids for location in self.locations for package in location.package_set)
+        for package_id, previous_package in zip((41, 42, 43), carryover_packages):
+            package = PackageHandler.package_hash.get_package(package_id)
+            assert package.location is previous_package.location
+            assert package in package.location.package_set
+            assert package.status is DeliveryStatus.AT_HUB
+            assert package.hub_arrival_time == config.STANDARD_PACKAGE_ARRIVAL_TIME
+            assert not package.bundled_package_set
+        assert PackageHandler.package_hash.get_package(43).assigned_truck_id == 2
+        assert PackageHandler.constraint_graph.latest_delayed_arrival == time(hour=9, minute=5)
+        PackageHandler.load_day(config.PACKAGE_CSV_FILE)
+        assert len(PackageHandler.all_packages) == len(self.packages)
+
+    def test_bulk_status_update_batches_due_transitions(self):
+        delayed_package_ids = [6, 25, 28, 32]
+        assert PackageHandler.bulk_status_update(time(9)) == []
+        status_updates = PackageHandler.bulk_status_update(time(10, 30))
+        assert [type(status_update) for status_update in status_updates] == [DelayedPackagesArrivedException,
+                                                                               AddressUpdateException]
+        assert sorted([package.package_id for package in status_updates[0].packages]) == delayed_package_ids
+        assert all(self.custom_hash.get_package(package_id).status is DeliveryStatus.AT_HUB
+                   for package_id in delayed_package_ids)
+        assert status_updates[1].package.package_id == 9 and status_updates[1].package.is_verified_address
+        assert not len(PackageHandler.pending_transitions)
+        assert PackageHandler.bulk_status_update(time(12)) == []
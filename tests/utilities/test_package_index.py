@@ -0,0 +1,50 @@
+from datetime import time
+
+from src import config
+from src.constants.delivery_status import DeliveryStatus
+from src.models.package import Package
+from src.utilities.delivery_runner import DeliveryRunner
+from src.utilities.package_handler import PackageHandler
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestPackageIndex(DayTestCase):
+
+    def assert_index_matches_packages(self):
+        packages = PackageHandler.all_packages
+        package_index = Package.package_index
+        assert len(package_index) == len(packages)
+        for status in DeliveryStatus:
+            assert package_index.get_status_packages(status) == set(
+                [package for package in packages if package.status is status])
+        assert PackageHandler.get_assigned_truck_packages() == PackageHandler.get_assigned_truck_packages(
+            packages=packages)
+        for truck_id in range(1, config.NUM_DELIVERY_TRUCKS + 1):
+            assert PackageHandler.get_assigned_truck_packages(truck_id) == PackageHandler.get_assigned_truck_packages(
+                truck_id, packages)
+        assert PackageHandler.get_unconfirmed_packages() == PackageHandler.get_unconfirmed_packages(packages)
+        for ignore_arrived in (False, True):
+            assert PackageHandler.get_delayed_packages(ignore_arrived=ignore_arrived) == \
+                PackageHandler.get_delayed_packages(packages, ignore_arrived)
+        for current_time in (time(4), time(8), time(9, 5), time(12)):
+            assert PackageHandler.get_available_packages(current_time) == PackageHandler.get_available_packages(
+                current_time, packages)
+        assert PackageHandler.get_bundled_packages() == PackageHandler.get_bundled_packages(
+            PackageHandler.all_locations)
+        assert PackageHandler.get_packages_due_by(time(10, 30)) == set(
+            [package for package in packages if package.deadline <= time(10, 30)])
+
+    def test_index_after_simulated_day(self):
+        self.assert_index_matches_packages()
+        DeliveryRunner.simulate(seed=0)
+        assert not PackageHandler.get_unconfirmed_packages()
+        self.assert_index_matches_packages()
+
+    def test_copies_do_not_change_index(self):
+        package = PackageHandler.package_hash.get_package(9)
+        snapshot_package = PackageHandler.get_package_snapshot(package, time(8))
+        snapshot_package.status = DeliveryStatus.DELIVERED
+        snapshot_package.is_verified_address = True
+        assert package in Package.package_index.get_status_packages(package.status)
+        assert package not in Package.package_index.get_status_packages(DeliveryStatus.DELIVERED)
+        assert package in PackageHandler.get_unconfirmed_packages()
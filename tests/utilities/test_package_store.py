@@ -0,0 +1,71 @@
+from datetime import time
+
+from src import config
+from src.constants.delivery_status import DeliveryStatus
+from src.models.package import Package
+from src.utilities.delivery_runner import DeliveryRunner
+from src.utilities.package_handler import PackageHandler
+from src.utilities.time_conversion import TimeConversion
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestPackageStore(DayTestCase):
+
+    def assert_store_matches_packages(self):
+        package_store = Package.package_store
+        packages = package_store.get_packages()
+        assert packages == list(PackageHandler.all_packages)
+        locations = PackageHandler.all_locations
+        for row, package in enumerate(packages):
+            assert package_store.get_column('package_id')[row] == package.package_id
+            assert locations[package_store.get_column('location_index')[row]] is package.location
+            assert package_store.get_column('deadline_seconds')[row] == TimeConversion.get_seconds(package.deadline)
+            assert package_store.get_column('release_seconds')[row] == TimeConversion.get_seconds(
+                package.hub_arrival_time)
+            assert package_store.get_column('weight')[row] == package.weight
+            assert package_store.get_column('truck_id')[row] == (package.assigned_truck_id or 0)
+        for status in DeliveryStatus:
+            assert set(package_store.select(package_store.get_status_mask(status))) == \
+                Package.package_index.get_status_packages(status)
+        for current_time in (time(4), time(8), time(9, 5), time(12)):
+            assert set(package_store.select(package_store.get_released_mask(current_time))) == \
+                Package.package_index.get_released_packages(current_time)
+        for truck_id in [None] + list(range(1, config.NUM_DELIVERY_TRUCKS + 1)):
+            assert set(package_store.select(package_store.get_truck_mask(truck_id))) == \
+                Package.package_index.get_truck_packages(truck_id)
+
+    def test_store_after_simulated_day(self):
+        self.assert_store_matches_packages()
+        DeliveryRunner.simulate(seed=0)
+        self.assert_store_matches_packages()
+
+    def test_bundle_ids(self):
+        package_store = Package.package_store
+        bundle_ids = dict(zip(package_store.get_packages(), package_store.get_column('bundle_id')))
+        for bundle_group in Package.package_index.get_bundle_groups():
+            assert len(set([bundle_ids[package] for package in bundle_group])) == 1
+            assert bundle_ids[next(iter(bundle_group))] != -1
+        assert bundle_ids[PackageHandler.package_hash.get_package(1)] == -1
+
+    def test_combined_masks_and_weights(self):
+        package_store = Package.package_store
+        mask = package_store.combine_masks(package_store.get_due_mask(time(10, 30)),
+                                           package_store.get_released_mask(config.DELIVERY_DISPATCH_TIME))
+        assert set(package_store.select(mask)) == set(
+            [package for package in PackageHandler.all_packages
+             if package.deadline <= time(10, 30) and package.hub_arrival_time <= config.DELIVERY_DISPATCH_TIME])
+        location_weights = package_store.get_location_weights()
+        for location in PackageHandler.all_locations:
+            weight = sum([package.weight for package in PackageHandler.all_packages if package.location is location])
+            assert location_weights.get(location, 0) == weight
+        assert sum(package_store.get_location_weights(mask).values()) == sum(
+            [package.weight for package in package_store.select(mask)])
+
+    def test_copies_do_not_change_store(self):
+        package = PackageHandler.package_hash.get_package(9)
+        snapshot_package = PackageHandler.get_package_snapshot(package, time(8))
+        snapshot_package.status = DeliveryStatus.DELIVERED
+        snapshot_package.location = PackageHandler.all_locations[0]
+        package_store = Package.package_store
+        assert package not in package_store.select(package_store.get_status_mask(DeliveryStatus.DELIVERED))
+        self.assert_store_matches_packages()
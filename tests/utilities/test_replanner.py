@@ -0,0 +1,136 @@
+import asyncio
+import random
+from datetime import time
+from unittest.mock import patch
+
+from src import config
+from src.constants.delivery_status import DeliveryStatus
+from src.exceptions import ReplanningError
+from src.utilities.delivery_runner import DeliveryRunner
+from src.utilities.package_handler import PackageHandler
+from src.utilities.replanner import IncrementalReplanner
+from src.utilities.run_planner import RunPlanner
+from src.utilities.virtual_clock import VirtualClock
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestIncrementalReplanner(DayTestCase):
+
+    def setUp(self) -> None:
+        config.HEADLESS_SIMULATION_ENABLED = True
+        super().setUp()
+        random.seed(0)
+        DeliveryRunner.load_trucks()
+        self.runs = sorted(DeliveryRunner.route_runs)
+
+    def tearDown(self) -> None:
+        config.HEADLESS_SIMULATION_ENABLED = False
+
+    def _get_single_package(self, run):
+        return sorted([package for package in run.required_packages if package.location in run.ordered_route[1:]
+                       and len(package.location.package_set) == 1], key=lambda package: package.package_id)[0]
+
+    def test_replan_pending_run(self):
+        run = self.runs[1]
+        package = self._get_single_package(run)
+        old_location = package.location
+        new_location = [location for location in self.runs[-1].ordered_route if not location.is_hub][0]
+        replanned_runs = IncrementalReplanner.update_address(DeliveryRunner.trucks, package,
+                                                             new_location.get_full_address(), time(8))
+        assert replanned_runs == [run] and replanned_runs[0] is run
+        assert new_location in run.ordered_route
+        assert old_location not in run.ordered_route
+        assert run.ordered_route[0].is_hub
+        assert run.estimated_mileage == run.get_estimated_mileage_at_location(index=len(run.ordered_route) - 1)
+        DeliveryRunner.commence_deliveries()
+        assert package.status is DeliveryStatus.DELIVERED
+        assert package.location is new_location
+        assert all(package.status is DeliveryStatus.DELIVERED for package in PackageHandler.all_packages)
+
+    def test_replan_during_deliveries(self):
+        run = self.runs[0]
+        last_location = [location for location in run.ordered_route if not location.is_hub][-1]
+        package = sorted(last_location.package_set, key=lambda _package: _package.package_id)[0]
+        new_location = [location for location in self.runs[-1].ordered_route if not location.is_hub][-1]
+        update_seconds = 8 * 3600 + 20 * 60
+        replanned_runs = []
+
+        async def report_address_update(clock: VirtualClock):
+            await clock.sleep_until(update_seconds)
+            replanned_runs.extend(IncrementalReplanner.update_address(
+                DeliveryRunner.trucks, package, new_location.get_full_address(), time(8, 20)))
+
+        async def run_with_update():
+            clock = VirtualClock()
+            clock.spawn(report_address_update(clock))
+            await DeliveryRunner.run_deliveries(clock)
+
+        asyncio.run(run_with_update())
+        assert replanned_runs and replanned_runs[0] is run
+        assert package.location is new_location
+        assert package.status is DeliveryStatus.DELIVERED
+        assert package.delivery_time > time(8, 20)
+        assert all(package.status is DeliveryStatus.DELIVERED for package in PackageHandler.all_packages)
+
+    def test_replan_without_delivering_run(self):
+        package = PackageHandler.package_hash.get_package(9)
+        assert not IncrementalReplanner.replan(DeliveryRunner.trucks, package, PackageHandler.all_locations[0])
+
+    def test_replan_infeasible_run_appends_location(self):
+        run = self.runs[1]
+        package = self._get_single_package(run)
+        ordered_route = list(run.ordered_route)
+        new_location = [location for location in self.runs[-1].ordered_route if not location.is_hub][-1]
+        with patch.object(RunPlanner, 'repair', return_value=False):
+            replanned_runs = IncrementalReplanner.update_address(DeliveryRunner.trucks, package,
+                                                                 new_location.get_full_address(), time(8))
+        assert replanned_runs == [run]
+        assert run.ordered_route == ordered_route + [new_location]
+        DeliveryRunner.commence_deliveries()
+        assert package.status is DeliveryStatus.DELIVERED and package.location is new_location
+        assert all(package.status is DeliveryStatus.DELIVERED for package in PackageHandler.all_packages)
+
+    def test_replan_infeasible_run_moves_to_pending_run(self):
+        run, pending_run = self.runs[:2]
+        package = PackageHandler.package_hash.get_package(2)
+        ordered_route = list(run.ordered_route)
+        new_location = [location for location in pending_run.ordered_route if not location.is_hub][0]
+        repair = RunPlanner.repair
+
+        def infeasible_repair(repaired_run, *args):
+            return repaired_run is not run and repair(repaired_run, *args)
+
+        with patch.object(config, 'NUM_TRUCK_CAPACITY', config.NUM_TRUCK_CAPACITY + 1):
+            with patch.object(RunPlanner, 'repair', infeasible_repair):
+                replanned_runs = IncrementalReplanner.update_address(DeliveryRunner.trucks, package,
+                                                                     new_location.get_full_address(), time(8))
+            assert replanned_runs == [pending_run]
+            assert run.ordered_route == ordered_route
+            assert package not in run.required_packages and package in pending_run.required_packages
+            DeliveryRunner.commence_deliveries()
+        assert package.status is DeliveryStatus.DELIVERED and package.location is new_location
+        assert package.delivery_time > pending_run.start_time
+        assert all(package.status is DeliveryStatus.DELIVERED for package in PackageHandler.all_packages)
+
+    def test_replan_infeasible_run_keeps_route(self):
+        run = self.runs[1]
+        package = self._get_single_package(run)
+        ordered_route = list(run.ordered_route)
+        estimated_completion_time = run.estimated_completion_time
+        new_location = [location for location in self.runs[-1].ordered_route if not location.is_hub][-1]
+        constraints = (new_location.earliest_deadline, new_location.latest_package_arrival)
+
+        def infeasible_repair(repaired_run, first_index, insert_locations=(), remove_locations=()):
+            repaired_run.ordered_route = repaired_run.ordered_route[:first_index]
+            return False
+
+        with patch.object(RunPlanner, 'repair', infeasible_repair):
+            with patch.object(RunPlanner, 'append', return_value=False):
+                with self.assertRaises(ReplanningError) as context:
+                    IncrementalReplanner.update_address(DeliveryRunner.trucks, package,
+                                                        new_location.get_full_address(), time(8))
+        assert context.exception.run is run and context.exception.package is package
+        assert run.ordered_route == ordered_route
+        assert run.estimated_completion_time == estimated_completion_time
+        assert (new_location.earliest_deadline, new_location.latest_package_arrival) == constraints
+        assert not new_location.has_rerouted_package
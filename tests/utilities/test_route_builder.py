@@ -1,11 +1,10 @@
-from unittest import TestCase
-
 from src import config
 from src.utilities.package_handler import PackageHandler
 from src.utilities.route_builder import RouteBuilder
+from tests.utilities.day_test_case import DayTestCase
 
 
-class TestRouteBuilder(TestCase):
+class TestRouteBuilder(DayTestCase):
 
     def test_build_optimized_runs(self):
         config.UI_ENABLED = False
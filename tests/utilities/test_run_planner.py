@@ -1,10 +1,10 @@
 from copy import copy
-from unittest import TestCase
 
 from src import config
 from src.models.truck import Truck
 from src.utilities.package_handler import PackageHandler
 from src.utilities.run_planner import RunPlanner
+from tests.utilities.day_test_case import DayTestCase
 
 
 def _set_all_locations_assigned(packages):
@@ -19,9 +19,10 @@ def _get_packages_by_id(list_of_ids):
     return package_set
 
 
-class TestRunPlanner(TestCase):
+class TestRunPlanner(DayTestCase):
 
     def setUp(self) -> None:
+        super().setUp()
         self.locations = PackageHandler.all_locations
         self.packages = PackageHandler.all_packages
         self.package_hash = PackageHandler.package_hash
@@ -0,0 +1,29 @@
+from datetime import time
+from unittest.mock import patch
+
+from src import config
+from src.exceptions import LateDeliveryError
+from src.utilities.package_handler import PackageHandler
+from src.utilities.savings_planner import SavingsPlanner
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestSavingsPlanner(DayTestCase):
+
+    def test_build_runs(self):
+        trucks = SavingsPlanner.build_runs()
+        runs = [run for truck in trucks for run in truck.route_runs]
+        assert runs
+        assert not [location for location in PackageHandler.all_locations
+                    if not location.is_hub and location.package_set and not location.been_assigned]
+        assert not [run for run in runs if run.error_type]
+        assert not [run for run in runs if len(run.required_packages) > config.NUM_TRUCK_CAPACITY]
+        for truck in trucks:
+            for run in truck.route_runs:
+                assert not [package for package in run.required_packages
+                            if package.assigned_truck_id and package.assigned_truck_id != truck.truck_id]
+
+    def test_build_runs_with_late_route(self):
+        with patch.object(config, 'DELIVERY_DISPATCH_TIME', time(10, 25)):
+            with self.assertRaises(LateDeliveryError):
+                SavingsPlanner.build_runs()
@@ -0,0 +1,28 @@
+import csv
+import io
+import json
+from datetime import time
+
+from src import config
+from src.constants.delivery_status import DeliveryStatus
+from src.utilities.delivery_runner import DeliveryRunner
+from src.utilities.package_handler import PackageHandler
+from src.utilities.status_report import StatusReport
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestStatusReport(DayTestCase):
+
+    def test_reports(self):
+        DeliveryRunner.simulate(seed=0)
+        packages = sorted(PackageHandler.all_packages, key=lambda package: package.package_id)
+        address_length = max([len(package.location.get_full_address()) for package in packages])
+        target_time = time(10, 30)
+        expected_lines = '\n'.join([package.get_status_string(target_time, address_length=address_length)
+                                    for package in packages]).splitlines()
+        assert StatusReport.to_text(target_time).splitlines() == expected_lines
+        rows = list(csv.DictReader(io.StringIO(StatusReport.to_csv(config.DELIVERY_RETURN_TIME))))
+        assert [int(row['package_id']) for row in rows] == [package.package_id for package in packages]
+        assert all(row['status'] == DeliveryStatus.DELIVERED.name for row in rows)
+        assert json.loads(StatusReport.to_json(config.DELIVERY_RETURN_TIME)) == [
+            {**row, 'package_id': int(row['package_id'])} for row in rows]
@@ -0,0 +1,58 @@
+from datetime import time
+
+from src.constants.delivery_status import DeliveryStatus
+from src.models.status_timeline import StatusTimeline
+from src.utilities.delivery_runner import DeliveryRunner
+from src.utilities.package_handler import PackageHandler
+from tests.utilities.day_test_case import DayTestCase
+
+
+class TestStatusTimeline(DayTestCase):
+
+    def test_record(self):
+        location = PackageHandler.all_locations[1]
+        timeline = StatusTimeline()
+        timeline.record(time(9), DeliveryStatus.OUT_FOR_DELIVERY, location, True, 'note')
+        timeline.record(time(8), DeliveryStatus.AT_HUB, location, True, 'note')
+        timeline.record(time(9), DeliveryStatus.DELIVERED, location, False, '')
+        timeline.record(time(9), DeliveryStatus.DELIVERED, location, False, '')
+        assert len(timeline) == 2
+        assert [update_time for update_time, _ in timeline.get_states()] == [time(8), time(9)]
+        package_state = timeline.get_state_at_time(time(9, 30), 7)
+        assert package_state.package_id == 7
+        assert package_state.status == (DeliveryStatus.OUT_FOR_DELIVERY, DeliveryStatus.DELIVERED)
+        assert package_state.location is location
+        assert package_state.is_verified_address and package_state.special_note == 'note'
+        assert timeline.get_state_at_time(time(8, 59, 59)).status is DeliveryStatus.AT_HUB
+        assert timeline.get_state_at_time(time(7)).update_time == time(8)
+        assert timeline.get_row_at_seconds(9 * 3600 + 1) == (
+            9 * 3600, (DeliveryStatus.OUT_FOR_DELIVERY, DeliveryStatus.DELIVERED), location)
+
+    def test_get_package_states_at_time(self):
+        DeliveryRunner.simulate(seed=0)
+        for target_time in [time(8), time(9, 5), time(10, 20), time(12, 3), time(17)]:
+            package_states = PackageHandler.get_package_states_at_time(target_time)
+            assert [package_state.package_id for package_state in package_states] == sorted(
+                package.package_id for package in PackageHandler.all_packages)
+            for package_state in package_states:
+                package = PackageHandler.package_hash.get_package(package_state.package_id)
+                snapshot_package = PackageHandler.get_package_snapshot(package, target_time)
+                update_time, snapshot_update = package.find_package_state_at_time(target_time)
+                assert package_state.status == snapshot_package.status == snapshot_update['status']
+                assert package_state.location is snapshot_package.location is snapshot_update['location']
+                assert package_state.update_time == update_time
+                assert list(package.status_update_dict)[-1] == package.status_timeline.get_states()[-1][0]
+
+    def test_day_tables(self):
+        location = PackageHandler.all_locations[1]
+        timeline = StatusTimeline()
+        for index in range(70000):
+            timeline.record(time(index // 3600, index // 60 % 60, index % 60), DeliveryStatus.AT_HUB, location, True,
+                            f'note {index}')
+        assert timeline.get_state_at_time(time(20)).special_note == 'note 69999'
+        PackageHandler.load_day()
+        next_timeline = StatusTimeline()
+        next_timeline.record(time(8), DeliveryStatus.AT_HUB, location, True, 'next day')
+        assert timeline.get_state_at_time(time(20)).special_note == 'note 69999'
+        assert next_timeline.get_state_at_time(time(9)).special_note == 'next day'
+        assert 'note 0' not in next_timeline._tables.special_notes.values
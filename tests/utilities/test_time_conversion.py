@@ -32,3 +32,20 @@ class TestTimeConversion(TestCase):
         delta_seconds = -1800
         new_time = TimeConversion.add_time_delta(new_time, delta_seconds)
         assert current_time == new_time
+
+    def test_get_seconds(self):
+        assert TimeConversion.get_seconds(time(hour=0)) == 0
+        assert TimeConversion.get_seconds(time(hour=8, minute=30, second=15)) == 30615
+        assert TimeConversion.get_seconds(time(hour=23, minute=59, second=59)) == 86399
+
+    def test_get_time(self):
+        assert TimeConversion.get_time(30615) == time(hour=8, minute=30, second=15)
+        assert TimeConversion.get_time(30614.6) == time(hour=8, minute=30, second=15)
+        with self.assertRaises(ValueError):
+            TimeConversion.get_time(86400 + 60)
+        with self.assertRaises(ValueError):
+            TimeConversion.increment_time(time(23, 59, 59))
+        with self.assertRaises(ValueError):
+            TimeConversion.add_time_delta(time(0, 0, 30), -60)
+        current_time = time(hour=10, minute=20, second=40)
+        assert TimeConversion.get_time(TimeConversion.get_seconds(current_time)) == current_time
@@ -0,0 +1,81 @@
+import asyncio
+from unittest import TestCase
+
+from src.utilities.virtual_clock import Broadcast, VirtualClock
+
+
+class TestVirtualClock(TestCase):
+
+    def test_run(self):
+        clock = VirtualClock(100)
+        wake_ups = []
+
+        async def sleeper(name: str, wake_seconds: int, priority: int):
+            await clock.sleep_until(wake_seconds, priority)
+            wake_ups.append((clock.seconds, name))
+            await clock.sleep_until(clock.seconds + 50)
+            wake_ups.append((clock.seconds, name))
+
+        async def run():
+            clock.spawn(sleeper('a', 200, 1))
+            clock.spawn(sleeper('b', 200, 0))
+            clock.spawn(sleeper('c', 50, 0))
+            await clock.run()
+
+        asyncio.run(run())
+        assert wake_ups == [(100, 'c'), (150, 'c'), (200, 'b'), (200, 'a'), (250, 'b'), (250, 'a')]
+
+    def test_run_until(self):
+        clock = VirtualClock()
+        wake_ups = []
+
+        async def ticker():
+            for seconds in range(0, 1000, 10):
+                await clock.sleep_until(seconds)
+                wake_ups.append(seconds)
+
+        async def run():
+            clock.spawn(ticker())
+            await clock.run(until_seconds=45)
+
+        asyncio.run(run())
+        assert wake_ups == [0, 10, 20, 30, 40]
+
+    def test_run_raises_task_exception(self):
+        clock = VirtualClock()
+
+        async def failing():
+            await clock.sleep_until(10)
+            raise ValueError
+
+        async def run():
+            clock.spawn(failing())
+            await clock.run()
+
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+
+    def test_broadcast(self):
+        clock = VirtualClock()
+        broadcast = Broadcast(clock)
+        received = []
+
+        async def listener(name: str):
+            while not broadcast.is_closed:
+                value = await broadcast.wait()
+                received.append((clock.seconds, name, value))
+
+        async def publisher():
+            for seconds in (30, 60):
+                await clock.sleep_until(seconds)
+                broadcast.publish(seconds // 30)
+            broadcast.close()
+
+        async def run():
+            clock.spawn(listener('a'))
+            clock.spawn(listener('b'))
+            clock.spawn(publisher())
+            await clock.run()
+
+        asyncio.run(run())
+        assert received == [(30, 'a', 1), (30, 'b', 1), (60, 'a', 2), (60, 'b', 2)]